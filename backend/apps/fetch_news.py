@@ -1,18 +1,125 @@
-from newsapi import NewsApiClient
-import os
-from .news_param_generator import sample_filters, build_query_combinations
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.db import connection
+from .news.models import ArticleUrl
+from .news_api_client import get_news_api_client
+from .news_api_quota import get_quota_ledger
+from .news_param_generator import sample_filters, plan_query_combinations
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+class RateLimiter:
+    """
+    Thread-safe limiter spacing calls so that at most `rate` start per second.
+    A falsy rate disables limiting.
+    """
+
+    def __init__(self, rate=None):
+        self.interval = 1.0 / rate if rate else 0
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self):
+        """Block until the caller is allowed to start its request."""
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def _known_ratio(articles):
+    """Share of the given articles whose URL is already stored."""
+    urls = {article.get('url') for article in articles if article.get('url')}
+    if not urls:
+        return 0.0
+    # ArticleUrl holds each stored URL once, so its primary key answers this with one index probe per URL
+    known = ArticleUrl.objects.filter(url__in=urls).count()
+    return known / len(urls)
+
+
+def _run_query(news_api, idx, params, limiter, timeout, max_pages):
+    """
+    Execute a single top-headlines query, following pages while useful.
+    
+    Pages are requested until `totalResults` is covered, `max_pages` is reached
+    or a page is mostly made of articles already stored (NEWS_API_KNOWN_STOP_RATIO).
+    A failure before any article is fetched is reported as the query error; a
+    later failure only ends the pagination.
+    
+    Returns:
+        tuple: (articles, timing) where timing describes the calls
+    """
+    session = news_api.request_method
+    started = time.perf_counter()
+    articles = []
+    error = None
+    stopped_early = False
+    total_results = 0
+    calls = {'attempts': 0, 'bytes': 0, 'wire_bytes': 0}
+    page = 0
+    try:
+        while page < max_pages:
+            page += 1
+            limiter.wait()
+            logger.debug(f"Executing query {idx} page {page} with params: {params}")
+            try:
+                with session.override_timeout(timeout):
+                    result = news_api.get_top_headlines(page=page, **params)
+            finally:
+                call = session.last_call() or {}
+                for key in calls:
+                    calls[key] += call.get(key, 0)
+
+            page_articles = result.get('articles', [])
+            total_results = result.get('totalResults', 0)
+            articles.extend(page_articles)
+            logger.debug(f"Query {idx} page {page} returned {len(page_articles)} articles")
+
+            page_size = params.get('page_size') or len(page_articles)
+            if not page_articles or page * page_size >= total_results:
+                break
+            if _known_ratio(page_articles) >= settings.NEWS_API_KNOWN_STOP_RATIO:
+                stopped_early = True
+                break
+    except Exception as e:
+        if not articles:
+            logger.warning(f"Error fetching articles for query {idx} (params: {params}): {str(e)}")
+            error = str(e)
+        else:
+            logger.warning(f"Stopped paging query {idx} at page {page} (params: {params}): {str(e)}")
+    finally:
+        # Worker threads open their own database connection for the known-URL check
+        connection.close()
+
+    timing = {
+        'params': params,
+        'elapsed': round(time.perf_counter() - started, 4),
+        'articles': len(articles),
+        'pages': page,
+        'total_results': total_results,
+        'stopped_early': stopped_early,
+        'error': error,
+        **calls,
+    }
+    return articles, timing
+
+
 def fetch_sources():
     """
     Fetch news sources from NewsAPI.
     """
     try:
-        logger.info("Starting fetch_sources...", os.getenv("NEWS_API_KEY"))
-        news_api = NewsApiClient(api_key=os.getenv("NEWS_API_KEY"))
+        logger.info("Starting fetch_sources...")
+        news_api = get_news_api_client()
 
         logger.debug("Calling NewsAPI get_sources endpoint")
         sources = news_api.get_sources().get('sources', [])
@@ -23,9 +130,110 @@ def fetch_sources():
         return []
 
 
-def fetch_top_headlines(countries=None, categories=None, sources=None, sample_countries=None, sample_categories=None, **kwargs):
+def resolve_query_combinations(countries=None, categories=None, sources=None, sample_countries=None,
+                               sample_categories=None):
+    """
+    Apply sampling and plan the fewest NewsAPI calls covering the filters,
+    trimmed to the remaining daily NewsAPI budget.
+    
+    Returns:
+        list: Query parameter dictionaries (empty when no filter is given)
+    """
+    if sample_countries or sample_categories:
+        logger.info(f"Sampling filters - countries: {sample_countries}, categories: {sample_categories}")
+        countries, categories = sample_filters(sample_countries, sample_categories)
+        logger.info(f"Sampled {len(countries)} countries: {countries}")
+        logger.info(f"Sampled {len(categories)} categories: {categories}")
+
+    if not countries and not categories and not sources:
+        return []
+
+    logger.info("Planning query combinations...")
+    plan = plan_query_combinations(countries, categories, sources)
+    query_combinations = plan['combinations']
+    logger.info(f"Planned {plan['min_calls']} to {plan['max_calls']} calls for up to {plan['estimated_articles']} articles")
+    logger.debug(f"Query combinations: {query_combinations}")
+
+    # Degrade gracefully instead of failing half-way through the run: the
+    # ledger budgets the first pages (min_calls), acquire() meters the rest
+    return get_quota_ledger().trim(query_combinations)
+
+
+def iter_query_batches(query_combinations, max_workers=None, timeout=None, max_rps=None, max_pages=None):
+    """
+    Run queries concurrently and yield one (articles, timing) batch per query.
+    
+    Batches are yielded in submission order and at most `max_workers` queries
+    are in flight or buffered at any time, so memory is bounded by the batch
+    size rather than by the number of combinations.
+    """
+    max_workers = max_workers or settings.NEWS_API_MAX_WORKERS
+    timeout = timeout or settings.NEWS_API_TIMEOUT
+    max_rps = max_rps if max_rps is not None else settings.NEWS_API_MAX_RPS
+    max_pages = max_pages or settings.NEWS_API_MAX_PAGES
+
+    news_api = get_news_api_client()
+    limiter = RateLimiter(max_rps)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        for idx, params in enumerate(query_combinations, 1):
+            pending.append(executor.submit(_run_query, news_api, idx, params, limiter, timeout, max_pages))
+            if len(pending) >= max_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def dedupe_batches(batches, seen=None):
+    """
+    Drop articles whose URL was already yielded by an earlier batch.
+    
+    Args:
+        batches (iterable): (articles, timing) pairs
+        seen (set): Optional set of URLs to treat as already seen
+    """
+    seen = set() if seen is None else seen
+    for articles, timing in batches:
+        unique = []
+        for article in articles:
+            url = article.get('url')
+            if url and url not in seen:
+                seen.add(url)
+                unique.append(article)
+        yield unique, timing
+
+
+def iter_top_headlines(countries=None, categories=None, sources=None, sample_countries=None, sample_categories=None,
+                       max_workers=None, timeout=None, max_rps=None, max_pages=None, **kwargs):
+    """
+    Stream deduplicated headline batches, one per query combination.
+    Takes the same arguments as fetch_top_headlines().
+    
+    Yields:
+        tuple: (articles, timing) for each executed query
+    """
+    # If no filters provided, use custom kwargs only
+    if not any([countries, categories, sources, sample_countries, sample_categories]):
+        logger.info("No specific filters provided, using custom kwargs")
+        logger.debug(f"Custom kwargs: {kwargs}")
+        query_combinations = get_quota_ledger().trim([kwargs])
+    else:
+        query_combinations = resolve_query_combinations(
+            countries, categories, sources, sample_countries, sample_categories
+        )
+
+    batches = iter_query_batches(
+        query_combinations, max_workers=max_workers, timeout=timeout, max_rps=max_rps, max_pages=max_pages
+    )
+    yield from dedupe_batches(batches)
+
+
+def fetch_top_headlines(countries=None, categories=None, sources=None, sample_countries=None, sample_categories=None,
+                        max_workers=None, timeout=None, max_rps=None, max_pages=None, **kwargs):
     """
     Fetch latest news headlines with selective or sampled filtering.
+    Collects iter_top_headlines() into a single list.
     
     Args:
         countries (list): Specific country codes (e.g., ['us', 'fr'])
@@ -33,65 +241,44 @@ def fetch_top_headlines(countries=None, categories=None, sources=None, sample_co
         sources (list): Specific source IDs (e.g., ['bbc-news'])
         sample_countries (int): Randomly sample N countries (e.g., 4)
         sample_categories (int): Randomly sample N categories (e.g., 20)
+        max_workers (int): Queries run concurrently (defaults to NEWS_API_MAX_WORKERS)
+        timeout (float): Per-request timeout in seconds (defaults to NEWS_API_TIMEOUT)
+        max_rps (float): Global requests-per-second cap (defaults to NEWS_API_MAX_RPS)
+        max_pages (int): Pages followed per query (defaults to NEWS_API_MAX_PAGES)
         **kwargs: Additional parameters for custom queries
     
     Returns:
-        dict: {'articles': [...], 'totalResults': count}
+        dict: {'articles': [...], 'totalResults': count, 'timings': [...]}
     """
     try:
         logger.info("Starting fetch_top_headlines...")
         logger.debug(f"Parameters - countries: {countries}, categories: {categories}, sources: {sources}, "
                     f"sample_countries: {sample_countries}, sample_categories: {sample_categories}")
-        
-        news_api = NewsApiClient(api_key=os.getenv("NEWS_API_KEY"))
+
         all_articles = []
-        
-        # Handle sampling
-        if sample_countries or sample_categories:
-            logger.info(f"Sampling filters - countries: {sample_countries}, categories: {sample_categories}")
-            countries, categories = sample_filters(sample_countries, sample_categories)
-            logger.info(f"Sampled {len(countries)} countries: {countries}")
-            logger.info(f"Sampled {len(categories)} categories: {categories}")
-        
-        # If no filters provided, use custom kwargs only
-        if not countries and not categories and not sources:
-            logger.info("No specific filters provided, using custom kwargs")
-            logger.debug(f"Custom kwargs: {kwargs}")
-            result = news_api.get_top_headlines(**kwargs)
-            articles_count = len(result.get('articles', []))
-            logger.info(f"Fetched {articles_count} articles with custom parameters")
-            return result
-        
-        # Build and execute queries for specified filters
-        logger.info("Building query combinations...")
-        query_combinations = build_query_combinations(countries, categories, sources)
-        logger.info(f"Generated {len(query_combinations)} query combinations")
-        logger.debug(f"Query combinations: {query_combinations}")
-        
-        for idx, params in enumerate(query_combinations, 1):
-            try:
-                logger.debug(f"Executing query {idx}/{len(query_combinations)} with params: {params}")
-                result = news_api.get_top_headlines(**params)
-                articles = result.get('articles', [])
-                logger.debug(f"Query {idx} returned {len(articles)} articles")
-                all_articles.extend(articles)
-            except Exception as e:
-                logger.warning(f"Error fetching articles for query {idx} (params: {params}): {str(e)}")
-                continue
-        
-        logger.info(f"Total articles collected before deduplication: {len(all_articles)}")
-        
-        # Remove duplicates based on URL
-        unique_articles = {article['url']: article for article in all_articles}
-        final_count = len(unique_articles)
-        
-        logger.info(f"After deduplication: {final_count} unique articles")
-        logger.info(f"Removed {len(all_articles) - final_count} duplicate articles")
-        
+        timings = []
+        for articles, timing in iter_top_headlines(
+            countries=countries,
+            categories=categories,
+            sources=sources,
+            sample_countries=sample_countries,
+            sample_categories=sample_categories,
+            max_workers=max_workers,
+            timeout=timeout,
+            max_rps=max_rps,
+            max_pages=max_pages,
+            **kwargs
+        ):
+            all_articles.extend(articles)
+            timings.append(timing)
+
+        logger.info(f"After deduplication: {len(all_articles)} unique articles")
+
         return {
-            'articles': list(unique_articles.values()),
-            'totalResults': final_count
+            'articles': all_articles,
+            'totalResults': len(all_articles),
+            'timings': timings,
         }
     except Exception as e:
         logger.error(f"Unexpected error in fetch_top_headlines: {str(e)}", exc_info=True)
-        return {'articles': [], 'totalResults': 0}
\ No newline at end of file
+        return {'articles': [], 'totalResults': 0, 'timings': []}
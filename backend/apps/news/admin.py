@@ -6,6 +6,8 @@ from .models import (
     Source,
     NewsArticle,
 )
+from .archive import restore_articles
+from .pagination import CountStrategyPaginator
 
 class ReadOnlyAdmin(admin.ModelAdmin):
     def has_add_permission(self, request):
@@ -41,8 +43,9 @@ class SourceAdmin(admin.ModelAdmin):
         "category",
         "language",
         "country",
+        "is_active",
     )
-    list_filter = ("category", "language", "country")
+    list_filter = ("category", "language", "country", "is_active")
     search_fields = ("name", "source_id")
     ordering = ("name",)
 
@@ -57,8 +60,16 @@ class NewsArticleAdmin(admin.ModelAdmin):
         "country",
         "published_at",
     )
-    list_filter = ("category", "language", "country", "published_at")
+    list_filter = ("category", "language", "country", "published_at", "body_archived")
     search_fields = ("title", "description")
     date_hierarchy = "published_at"
     ordering = ("-published_at",)
-    readonly_fields = ("created_at",)
\ No newline at end of file
+    readonly_fields = ("created_at", "body_archived")
+    # Counts follow NEWS_ARTICLE_COUNT_STRATEGY; skip the extra unfiltered COUNT(*)
+    paginator = CountStrategyPaginator
+    show_full_result_count = False
+
+    def get_object(self, request, object_id, from_field=None):
+        # Edit archived articles with their text; saving stores it back in the row
+        obj = super().get_object(request, object_id, from_field)
+        return restore_articles([obj])[0] if obj is not None else None
@@ -1,6 +1,24 @@
+import logging
+
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
+
+logger = logging.getLogger(__name__)
+
+
+def bump_reference_version(sender, **kwargs):
+    """Reference tables are seeded by migrations; invalidate their HTTP validators."""
+    from .response_cache import REFERENCES, bump_version
+    try:
+        bump_version(REFERENCES)
+    except Exception as e:
+        # An unreachable cache must not fail the migration; validators just stay as they were
+        logger.warning(f"Could not bump the reference data version after migrate: {e}")
 
 
 class NewsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.news'
+
+    def ready(self):
+        post_migrate.connect(bump_reference_version, sender=self)
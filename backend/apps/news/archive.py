@@ -0,0 +1,125 @@
+import zlib
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+from config.db_router import pin_to_primary
+from .models import ArchivedArticleBody, NewsArticle
+
+# Heavy text columns moved to ArchivedArticleBody once an article is old
+ARCHIVED_FIELDS = ('description', 'content')
+
+# Bodies are written once and rarely read: favour size over compression speed
+COMPRESSION_LEVEL = 9
+
+
+def compress_text(value):
+    return None if value is None else zlib.compress(value.encode(), COMPRESSION_LEVEL)
+
+
+def decompress_text(blob):
+    return None if blob is None else zlib.decompress(blob).decode()
+
+
+def archive_cutoff(days):
+    """Articles published before this time are archived."""
+    return timezone.now() - timedelta(days=days)
+
+
+@pin_to_primary()
+def archive_batch(cutoff, batch_size):
+    """
+    Move the description and content of the oldest `batch_size` unarchived
+    articles published before `cutoff` into ArchivedArticleBody, in one
+    transaction. Archived rows leave the partial index the batch is read from,
+    so repeated calls resume where the previous one stopped.
+
+    Returns:
+        dict: {'archived': int, 'raw_bytes': int, 'compressed_bytes': int}
+    """
+    with transaction.atomic():
+        rows = list(
+            NewsArticle.objects.select_for_update(skip_locked=True)
+            .filter(body_archived=False, published_at__lt=cutoff)
+            .order_by('published_at', 'id')
+            .values('id', *ARCHIVED_FIELDS)[:batch_size]
+        )
+        if not rows:
+            return {'archived': 0, 'raw_bytes': 0, 'compressed_bytes': 0}
+
+        bodies = []
+        raw_bytes = compressed_bytes = 0
+        for row in rows:
+            if all(row[field] is None for field in ARCHIVED_FIELDS):
+                continue
+            body = ArchivedArticleBody(
+                article_id=row['id'],
+                **{field: compress_text(row[field]) for field in ARCHIVED_FIELDS}
+            )
+            raw_bytes += sum(len(row[field].encode()) for field in ARCHIVED_FIELDS if row[field] is not None)
+            compressed_bytes += sum(len(getattr(body, field)) for field in ARCHIVED_FIELDS if row[field] is not None)
+            bodies.append(body)
+        # A body left over from an earlier archival of the same article is replaced
+        ArchivedArticleBody.objects.bulk_create(
+            bodies,
+            update_conflicts=True,
+            unique_fields=['article'],
+            update_fields=[*ARCHIVED_FIELDS, 'archived_at'],
+        )
+        NewsArticle.objects.filter(
+            id__in=[row['id'] for row in rows], published_at__lt=cutoff
+        ).update(body_archived=True, **{field: None for field in ARCHIVED_FIELDS})
+    return {'archived': len(rows), 'raw_bytes': raw_bytes, 'compressed_bytes': compressed_bytes}
+
+
+def _archived(articles):
+    """Articles (values() rows or instances) whose archived body was read as NULL."""
+    pending = []
+    for article in articles:
+        if isinstance(article, dict):
+            if article.get('body_archived'):
+                pending.append(article)
+        elif 'body_archived' not in article.get_deferred_fields() and article.body_archived:
+            pending.append(article)
+    return pending
+
+
+def _restore(pending, bodies, fields):
+    for article in pending:
+        article_id = article['id'] if isinstance(article, dict) else article.id
+        body = bodies.get(article_id)
+        values = {field: decompress_text(getattr(body, field)) if body else None for field in fields}
+        # The text is back in memory, so the article no longer reads as archived
+        values['body_archived'] = False
+        if isinstance(article, dict):
+            article.update(values)
+        else:
+            for field, value in values.items():
+                setattr(article, field, value)
+
+
+def _bodies_queryset(pending, fields):
+    ids = [article['id'] if isinstance(article, dict) else article.id for article in pending]
+    return ArchivedArticleBody.objects.filter(article_id__in=ids).only('article_id', *fields)
+
+
+def restore_articles(articles, fields=ARCHIVED_FIELDS):
+    """
+    Put the archived text back on articles read with `body_archived`
+    (values() rows or model instances), with one query for all of them.
+    Nothing is queried when none of them is archived.
+    """
+    pending = _archived(articles)
+    if pending:
+        bodies = {body.article_id: body for body in _bodies_queryset(pending, fields)}
+        _restore(pending, bodies, fields)
+    return articles
+
+
+async def arestore_articles(articles, fields=ARCHIVED_FIELDS):
+    """restore_articles() for async code."""
+    pending = _archived(articles)
+    if pending:
+        bodies = {body.article_id: body async for body in _bodies_queryset(pending, fields)}
+        _restore(pending, bodies, fields)
+    return articles
@@ -0,0 +1,191 @@
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse
+from django.utils.cache import add_never_cache_headers, patch_cache_control
+from django.views import View
+from django.views.decorators.http import condition
+from rest_framework.exceptions import APIException, NotFound
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+
+from . import response_cache
+from .archive import arestore_articles
+from .models import Category, Country, Language, NewsArticle
+from .references import areference_table
+from .views import (
+    CategoryListView, CountryListView, LanguageListView, NewsArticleListView, NewsArticleRetrieveView,
+    SourceListAPIView,
+)
+
+
+class AsyncAPIView(View):
+    """
+    Read-only async JSON endpoint for ASGI deployments, mirroring `sync_view`.
+
+    DRF views are sync-only, so these views run on Django's async View and reuse
+    the DRF pieces of the sync view that do not touch the database (filters,
+    serializers, pagination responses). Queries go through the async ORM and the
+    response bytes match what DRF's JSONRenderer produces for the sync view. DRF
+    exceptions are answered with their status code and payload.
+
+    Cache-Control and the version-stamp validators of ConditionalGetMixin follow
+    the sync view's `cache_namespaces` / `cache_max_age`; the stamps are read in
+    a thread, as the cache may be a network round trip.
+    """
+    http_method_names = ['get', 'head', 'options']
+    sync_view = None
+
+    async def dispatch(self, request, *args, **kwargs):
+        try:
+            if request.method in ('GET', 'HEAD'):
+                return await self.conditional_get(request, *args, **kwargs)
+            return await super().dispatch(request, *args, **kwargs)
+        except APIException as exc:
+            detail = exc.detail if isinstance(exc.detail, (list, dict)) else {'detail': exc.detail}
+            return self.render(detail, status=exc.status_code)
+
+    async def conditional_get(self, request, *args, **kwargs):
+        """ConditionalGetMixin.get() for async views."""
+        namespaces = self.sync_view.cache_namespaces
+        settled, shared = await sync_to_async(
+            lambda: (response_cache.versions_settled(namespaces), response_cache.is_shared())
+        )()
+        # Only GET and HEAD get here, and View.dispatch() would answer both with get()
+        handler = self.get
+        if not settled:
+            response = await handler(request, *args, **kwargs)
+            add_never_cache_headers(response)
+            return response
+        conditional = 'HTTP_IF_NONE_MATCH' in request.META or 'HTTP_IF_MODIFIED_SINCE' in request.META
+        if not shared or (conditional and not await self.resource_exists(request, *args, **kwargs)):
+            response = await handler(request, *args, **kwargs)
+        else:
+            etag, last_modified = await sync_to_async(
+                lambda: (response_cache.version_etag(namespaces), response_cache.version_last_modified(namespaces))
+            )()
+            response = await condition(
+                etag_func=lambda request, *args, **kwargs: etag,
+                last_modified_func=lambda request, *args, **kwargs: last_modified,
+            )(handler)(request, *args, **kwargs)
+        patch_cache_control(response, public=True, max_age=self.sync_view.cache_max_age)
+        return response
+
+    async def resource_exists(self, request, *args, **kwargs):
+        """ConditionalGetMixin.resource_exists()"""
+        return True
+
+    def render(self, data, status=200):
+        return HttpResponse(JSONRenderer().render(data), status=status, content_type='application/json')
+
+    async def load_references(self):
+        """
+        Load the reference tables through the async ORM, so the filters and
+        serializers that resolve codes and names never query from the event loop.
+        """
+        return {
+            'category': await areference_table(Category),
+            'country': await areference_table(Country),
+            'language': await areference_table(Language),
+        }
+
+    def drf_view(self, request, **kwargs):
+        """A `sync_view` instance set up for the request, to borrow its filtering and serialization."""
+        view = self.sync_view(request=Request(request), args=(), kwargs=kwargs, format_kwarg=None)
+        view.headers = {}
+        return view
+
+
+class AsyncListView(AsyncAPIView):
+    """Async version of a plain ListAPIView: its queryset, read through the async ORM, and its serializer."""
+
+    async def get(self, request, *args, **kwargs):
+        view = self.drf_view(request)
+        objects = [obj async for obj in view.get_queryset()]
+        return self.render(view.get_serializer(objects, many=True).data)
+
+
+class AsyncCategoryListView(AsyncListView):
+    """Async CategoryListView"""
+    sync_view = CategoryListView
+
+
+class AsyncLanguageListView(AsyncListView):
+    """Async LanguageListView"""
+    sync_view = LanguageListView
+
+
+class AsyncCountryListView(AsyncListView):
+    """Async CountryListView"""
+    sync_view = CountryListView
+
+
+class AsyncSourceListView(AsyncListView):
+    """Async SourceListAPIView: active sources with their nested references"""
+    sync_view = SourceListAPIView
+
+
+class AsyncNewsArticleListView(AsyncAPIView):
+    """
+    Async NewsArticleListView: same filters, search, ordering, fields, both
+    pagination modes and response cache, with the count and the page rows awaited.
+    """
+    sync_view = NewsArticleListView
+
+    async def get(self, request, *args, **kwargs):
+        view = self.drf_view(request)
+        namespaces = self.sync_view.cache_namespaces
+        cache_key = await sync_to_async(
+            lambda: response_cache.is_enabled() and response_cache.versions_settled(namespaces)
+            and response_cache.response_cache_key(view.request, namespaces)
+        )()
+        if not cache_key:
+            return await self.get_uncached(view)
+
+        data = await sync_to_async(response_cache.get_cached_response)(cache_key)
+        if data is not None:
+            response = self.render(data)
+            response['X-Cache'] = 'HIT'
+            return response
+
+        response = await self.get_uncached(view)
+        if response.status_code == 200:
+            await sync_to_async(response_cache.set_cached_response)(cache_key, response.data)
+        response['X-Cache'] = 'MISS'
+        return response
+
+    async def get_uncached(self, view):
+        try:
+            await self.load_references()
+            # Building the queryset is lazy: no query runs until the paginator awaits it
+            queryset = view.get_list_queryset()
+            paginator = view.paginator
+            page = await paginator.apaginate_queryset(queryset, view.request, view=view)
+            if 'description' in view.get_requested_fields():
+                # serialize_articles() then finds nothing left to restore
+                await arestore_articles(page, ('description',))
+            data = paginator.get_paginated_response(view.serialize_articles(page)).data
+        except APIException:
+            # Client errors such as an invalid page or cursor keep their status code
+            raise
+        except Exception:
+            return self.render({'error': 'An error occurred while fetching articles.'}, status=500)
+        response = self.render(data)
+        # Kept for the response cache, as DRF's Response.data
+        response.data = data
+        return response
+
+
+class AsyncNewsArticleRetrieveView(AsyncAPIView):
+    """Async NewsArticleRetrieveView, including ?fields= / ?exclude="""
+    sync_view = NewsArticleRetrieveView
+
+    async def resource_exists(self, request, *args, **kwargs):
+        return await NewsArticle.objects.filter(pk=kwargs['pk']).aexists()
+
+    async def get(self, request, *args, **kwargs):
+        view = self.drf_view(request, **kwargs)
+        try:
+            article = await view.get_queryset().aget(pk=kwargs['pk'])
+        except NewsArticle.DoesNotExist:
+            raise NotFound('No NewsArticle matches the given query.')
+        await arestore_articles([article], ('description',))
+        return self.render(view.get_serializer(article).data)
@@ -0,0 +1,108 @@
+from collections import Counter
+from django.db import connection, transaction
+from django.db.models import Count
+from config.db_router import pin_to_primary
+from .models import ArticleFacetCount, Category, Country, Language, NewsArticle, Source
+from .references import reference_table
+
+# Facet name -> denormalized column shared by NewsArticle and ArticleFacetCount
+FACET_COLUMNS = {
+    'category': 'category_id',
+    'country': 'country_id',
+    'language': 'language_id',
+    'source': 'source_id',
+}
+
+FACET_REFERENCES = {
+    'category': Category,
+    'country': Country,
+    'language': Language,
+}
+
+
+def facet_key(article):
+    """Rollup dimensions of an article (model instance or values() row)."""
+    if isinstance(article, dict):
+        return tuple(article[column] for column in FACET_COLUMNS.values())
+    return tuple(getattr(article, column) for column in FACET_COLUMNS.values())
+
+
+def apply_facet_deltas(deltas):
+    """
+    Add per-combination count deltas to the rollup in a single statement.
+
+    Args:
+        deltas (Counter): {(category_id, country_id, language_id, source_id): delta}
+    """
+    rows = [(*key, delta) for key, delta in deltas.items() if delta]
+    if not rows:
+        return
+    # A stable order keeps concurrent ingestion workers from deadlocking on the same rows
+    rows.sort(key=lambda row: tuple((value is None, value or 0) for value in row[:4]))
+
+    table = ArticleFacetCount._meta.db_table
+    columns = ', '.join(FACET_COLUMNS.values())
+    placeholders = ', '.join(['(%s, %s, %s, %s, %s)'] * len(rows))
+    sql = (
+        f"INSERT INTO {table} ({columns}, count) VALUES {placeholders} "
+        f"ON CONFLICT ({columns}) DO UPDATE SET count = {table}.count + EXCLUDED.count"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [value for row in rows for value in row])
+
+
+@pin_to_primary()
+def rebuild_facet_counts():
+    """
+    Recompute the whole rollup from the article table (one GROUP BY).
+
+    Returns:
+        int: Number of rollup rows
+    """
+    grouped = NewsArticle.objects.order_by().values(*FACET_COLUMNS.values()).annotate(total=Count('id'))
+    rows = [
+        ArticleFacetCount(**{column: row[column] for column in FACET_COLUMNS.values()}, count=row['total'])
+        for row in grouped
+    ]
+    with transaction.atomic():
+        ArticleFacetCount.objects.all().delete()
+        ArticleFacetCount.objects.bulk_create(rows, batch_size=1000)
+    return len(rows)
+
+
+def count_facets(queryset_for, count_expression):
+    """
+    Counts per value of every facet, each computed under the filters of the
+    other facets (so a sidebar can offer every alternative of the selected value).
+
+    Args:
+        queryset_for (callable): facet name (or None for all filters) -> filtered queryset
+        count_expression: Aggregate giving the article count of a group
+
+    Returns:
+        dict: {'total': int, 'facets': {facet: [{'id', 'key', 'name', 'count'}, ...]}}
+    """
+    total = queryset_for(None).aggregate(total=count_expression)['total'] or 0
+    counts = {}
+    for facet, column in FACET_COLUMNS.items():
+        grouped = (
+            queryset_for(facet).order_by().exclude(**{f'{column}__isnull': True})
+            .values(column).annotate(total=count_expression).filter(total__gt=0)
+        )
+        counts[facet] = Counter({row[column]: row['total'] for row in grouped})
+
+    sources = Source.objects.in_bulk(list(counts['source'])) if counts['source'] else {}
+    facets = {}
+    for facet, facet_counts in counts.items():
+        values = []
+        for pk, count in facet_counts.most_common():
+            if facet == 'source':
+                source = sources.get(pk)
+                key, name = (source.source_id, source.name) if source else (None, None)
+            else:
+                table = reference_table(FACET_REFERENCES[facet])
+                key, name = table['keys'].get(pk), table['names'].get(pk)
+            values.append({'id': pk, 'key': key, 'name': name, 'count': count})
+        facets[facet] = values
+    return {'total': total, 'facets': facets}
+
@@ -1,5 +1,9 @@
 import django_filters
-from .models import NewsArticle, Country, Language
+from django.contrib.postgres.search import SearchHeadline, SearchQuery, SearchRank
+from django.db.models import F
+from rest_framework.filters import BaseFilterBackend
+from .models import NewsArticle, Category, Country, Language, Source
+from .references import reference_table, resolve_reference
 
 
 class NewsArticleFilter(django_filters.FilterSet):
@@ -26,47 +30,101 @@ class NewsArticleFilter(django_filters.FilterSet):
         label='Source',
         method='filter_source'
     )
+    # Date ranges on the partition key only scan the partitions of those months
+    published_after = django_filters.IsoDateTimeFilter(
+        field_name='published_at',
+        lookup_expr='gte',
+        label='Published at or after'
+    )
+    published_before = django_filters.IsoDateTimeFilter(
+        field_name='published_at',
+        lookup_expr='lt',
+        label='Published before'
+    )
 
     class Meta:
         model = NewsArticle
-        fields = ['category', 'country', 'language', 'source']
+        fields = ['category', 'country', 'language', 'source', 'published_after', 'published_before']
 
     def filter_category(self, queryset, name, value):
         """Filter by category name (case-insensitive)"""
-        if value:
-            return queryset.filter(category__name__iexact=value)
-        return queryset
+        return self._filter_reference(queryset, 'category_id', Category, value)
 
     def filter_country(self, queryset, name, value):
         """Filter by country code or name (case-insensitive)"""
-        if value:
-            return queryset.filter(
-                country__code__iexact=value
-            ) | queryset.filter(
-                country__code__in=[
-                    code for code, display_name in Country.COUNTRY_CHOICES
-                    if display_name.lower() == value.lower()
-                ]
-            )
-        return queryset
+        return self._filter_reference(queryset, 'country_id', Country, value)
 
     def filter_language(self, queryset, name, value):
         """Filter by language code or name (case-insensitive)"""
-        if value:
-            return queryset.filter(
-                language__code__iexact=value
-            ) | queryset.filter(
-                language__code__in=[
-                    code for code, display_name in Language.LANGUAGE_CHOICES
-                    if display_name.lower() == value.lower()
-                ]
-            )
-        return queryset
+        return self._filter_reference(queryset, 'language_id', Language, value)
 
     def filter_source(self, queryset, name, value):
         """Filter by source name (case-insensitive)"""
         if value:
-            return queryset.filter(source__name__iexact=value)
+            return queryset.filter(
+                source_id__in=Source.objects.filter(name__iexact=value).values('pk')
+            )
         return queryset
 
+    def _filter_reference(self, queryset, field, model, value):
+        """
+        Resolve a code or display name to the reference PK in Python and
+        emit a single equality predicate on the denormalized column.
+        """
+        if not value:
+            return queryset
+        pk = resolve_reference(model, value)
+        if pk is None:
+            return queryset.none()
+        return queryset.filter(**{field: pk})
+
+
+def build_search_query(terms, config=None):
+    """
+    Web-search style tsquery for the given terms.
+    Without a config the query is OR-ed across every article language so that
+    stemmed vectors match whatever language they were built with.
+    """
+    if config:
+        return SearchQuery(terms, search_type='websearch', config=config)
+
+    query = SearchQuery(terms, search_type='websearch', config='simple')
+    for search_config in sorted(set(Language.SEARCH_CONFIGS.values())):
+        query |= SearchQuery(terms, search_type='websearch', config=search_config)
+    return query
+
 
+class FullTextSearchFilter(BaseFilterBackend):
+    """
+    Full-text search on ?q= over NewsArticle.search_vector.
+    Results are ranked by relevance (title > description > content) unless an
+    explicit ?ordering is given, and carry a highlighted description snippet.
+    Combines with every NewsArticleFilter filter.
+    """
+    search_param = 'q'
+
+    def filter_queryset(self, request, queryset, view):
+        terms = request.query_params.get(self.search_param, '').strip()
+        if not terms:
+            return queryset
+
+        # Search with the article language's configuration when the client filters by language
+        config = None
+        language = request.query_params.get('language')
+        if language:
+            code = reference_table(Language)['keys'].get(resolve_reference(Language, language))
+            config = Language.SEARCH_CONFIGS.get(code)
+
+        query = build_search_query(terms, config)
+        # The headline is NULL for archived rows: their description column is empty
+        # (see apps.news.archive) while search_vector still matches them
+        queryset = queryset.filter(search_vector=query).annotate(
+            search_rank=SearchRank(F('search_vector'), query),
+            search_headline=SearchHeadline(
+                'description', query, config=config,
+                start_sel='<mark>', stop_sel='</mark>', max_words=35, min_words=15,
+            ),
+        )
+        if not request.query_params.get('ordering'):
+            queryset = queryset.order_by('-search_rank', '-published_at')
+        return queryset
@@ -0,0 +1,58 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.news.archive import archive_batch, archive_cutoff
+
+
+class Command(BaseCommand):
+    help = (
+        "Move the description and content of articles older than NEWS_ARCHIVE_AFTER_DAYS "
+        "into compressed cold storage, in batches. Safe to interrupt: a new run resumes "
+        "with the oldest articles not archived yet."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--older-than-days', type=int, default=settings.NEWS_ARCHIVE_AFTER_DAYS,
+            help="Archive articles published more than this many days ago",
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=settings.NEWS_ARCHIVE_BATCH_SIZE,
+            help="Articles archived per transaction",
+        )
+        parser.add_argument(
+            '--max-batches', type=int, default=0,
+            help="Stop after this many batches (0 runs until every old article is archived)",
+        )
+        parser.add_argument(
+            '--sleep', type=float, default=0,
+            help="Seconds to pause between batches, to leave room for other writers",
+        )
+
+    def handle(self, *args, **options):
+        cutoff = archive_cutoff(options['older_than_days'])
+        self.stdout.write(f"Archiving the bodies of articles published before {cutoff.isoformat()}")
+
+        batches = archived = raw_bytes = compressed_bytes = 0
+        while not options['max_batches'] or batches < options['max_batches']:
+            result = archive_batch(cutoff, options['batch_size'])
+            if not result['archived']:
+                break
+            batches += 1
+            archived += result['archived']
+            raw_bytes += result['raw_bytes']
+            compressed_bytes += result['compressed_bytes']
+            self.stdout.write(
+                f"Batch {batches}: {result['archived']} articles, "
+                f"{result['raw_bytes']} bytes -> {result['compressed_bytes']} bytes"
+            )
+            if options['sleep']:
+                time.sleep(options['sleep'])
+
+        ratio = f", {raw_bytes / compressed_bytes:.1f}x compression" if compressed_bytes else ""
+        self.stdout.write(self.style.SUCCESS(
+            f"Archived {archived} articles in {batches} batches "
+            f"({raw_bytes} bytes -> {compressed_bytes} bytes{ratio})"
+        ))
@@ -0,0 +1,135 @@
+import asyncio
+import json
+import statistics
+import subprocess
+import time
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import AsyncClient
+from django.test.utils import override_settings
+from django.urls import reverse
+
+from apps.news.models import NewsArticle
+from apps.news.references import clear_reference_tables
+from apps.news.management.commands.benchmark_serialization import seed_articles
+
+
+class Command(BaseCommand):
+    help = (
+        "Load-test the sync DRF endpoints against their async/ counterparts through "
+        "the ASGI request handler at a given concurrency, on a throwaway test database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--articles', type=int, default=5000)
+        parser.add_argument('--sources', type=int, default=50)
+        parser.add_argument('--concurrency', type=int, default=100)
+        parser.add_argument('--requests', type=int, default=1000, help='Requests per endpoint and mode')
+        parser.add_argument('--output', default='benchmark-async.json')
+
+    def handle(self, *args, **options):
+        old_name = connection.settings_dict['NAME']
+        connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        # Reference rows get new primary keys in the test database
+        clear_reference_tables()
+        try:
+            seed_articles(options['articles'], options['sources'])
+            article_id = NewsArticle.objects.order_by('id').values_list('id', flat=True).first()
+            # Measure the views themselves, not the response cache in front of the sync list.
+            # The test database only exists on the primary connection, so replicas are not read.
+            with override_settings(NEWS_RESPONSE_CACHE_TIMEOUT=0, DATABASE_REPLICAS=[],
+                                   ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver']):
+                results = asyncio.run(self.run_all(self.endpoints(article_id), options))
+        finally:
+            connection.close()
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+        for name, modes in results.items():
+            sync, async_ = modes['sync'], modes['async']
+            self.stdout.write(
+                f"{name}: sync {sync['requests_per_second']:.0f} req/s (p95 {sync['latency_ms']['p95']:.1f} ms), "
+                f"async {async_['requests_per_second']:.0f} req/s (p95 {async_['latency_ms']['p95']:.1f} ms)"
+            )
+
+        report = {
+            'benchmark': 'async',
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'commit': self.git_commit(),
+            'config': {key: options[key] for key in ('articles', 'sources', 'concurrency', 'requests')},
+            'database': connection.vendor,
+            'endpoints': results,
+        }
+        with open(options['output'], 'w') as f:
+            json.dump(report, f, indent=2)
+        self.stdout.write(self.style.SUCCESS(f"Results written to {options['output']}"))
+
+    def endpoints(self, article_id):
+        """Endpoint name -> (sync path, async path), including their query strings."""
+        pairs = {
+            'articles': ('newsarticle-list', 'async-newsarticle-list', {}, ''),
+            'articles_filtered': ('newsarticle-list', 'async-newsarticle-list', {}, '?category=business&page=3'),
+            'articles_cursor': ('newsarticle-list', 'async-newsarticle-list', {}, '?pagination=cursor&page_size=50'),
+            'article_detail': ('newsarticle-detail', 'async-newsarticle-detail', {'pk': article_id}, ''),
+            'sources': ('source-list', 'async-source-list', {}, ''),
+            'countries': ('country-list', 'async-country-list', {}, ''),
+        }
+        return {
+            name: (reverse(sync_name, kwargs=kwargs) + query, reverse(async_name, kwargs=kwargs) + query)
+            for name, (sync_name, async_name, kwargs, query) in pairs.items()
+        }
+
+    async def run_all(self, endpoints, options):
+        client = AsyncClient()
+        results = {}
+        for name, (sync_path, async_path) in endpoints.items():
+            results[name] = {
+                'sync': await self.load(client, sync_path, options),
+                'async': await self.load(client, async_path, options),
+            }
+        return results
+
+    async def load(self, client, path, options):
+        """Send the requests with at most --concurrency in flight and time each of them."""
+        semaphore = asyncio.Semaphore(options['concurrency'])
+        latencies = []
+        statuses = {}
+
+        async def request():
+            async with semaphore:
+                started = time.perf_counter()
+                response = await client.get(path)
+                latencies.append(time.perf_counter() - started)
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+        # Warm up connections and the reference tables before timing
+        response = await client.get(path)
+        if response.status_code != 200:
+            raise CommandError(f"{path} answered {response.status_code}")
+        started = time.perf_counter()
+        await asyncio.gather(*(request() for _ in range(options['requests'])))
+        elapsed = time.perf_counter() - started
+        return {
+            'path': path,
+            'requests_per_second': round(len(latencies) / elapsed, 1),
+            'latency_ms': self.summarize(latencies),
+            'status_codes': statuses,
+        }
+
+    def summarize(self, samples):
+        samples_ms = sorted(sample * 1000 for sample in samples)
+        return {
+            'p50': round(statistics.median(samples_ms), 3),
+            'p95': round(samples_ms[int(len(samples_ms) * 0.95) - 1], 3),
+            'mean': round(statistics.mean(samples_ms), 3),
+        }
+
+    def git_commit(self):
+        try:
+            return subprocess.check_output(
+                ['git', 'rev-parse', 'HEAD'], text=True, stderr=subprocess.DEVNULL
+            ).strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
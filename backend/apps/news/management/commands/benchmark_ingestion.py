@@ -0,0 +1,136 @@
+import json
+import os
+import subprocess
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.db.backends.signals import connection_created
+from django.test.utils import override_settings
+
+from apps.news_api_client import reset_session
+from apps.news_api_stub import NewsApiStub
+from apps.news.models import NewsArticle, Source
+from apps.news.services import save_sources_to_db, save_top_headlines_to_db
+
+
+class QueryCounter:
+    """Counts SQL statements on every connection, including worker threads."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+    def attach(self, sender, connection, **kwargs):
+        connection.execute_wrappers.append(self)
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the ingestion path (sources sync + headline ingestion) against the "
+        "offline NewsAPI stub, on a throwaway test database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--countries', nargs='+', default=['us', 'fr', 'eg', 'ca'])
+        parser.add_argument('--categories', nargs='+', default=['business', 'technology', 'sports', 'health'])
+        parser.add_argument('--latency', type=float, default=0.05)
+        parser.add_argument('--error-rate', type=float, default=0.0)
+        parser.add_argument('--payload-bytes', type=int, default=500)
+        parser.add_argument('--results', type=int, default=150)
+        parser.add_argument('--fixtures')
+        parser.add_argument('--output', default='benchmark-ingestion.json')
+
+    def handle(self, *args, **options):
+        old_name = connection.settings_dict['NAME']
+        connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        try:
+            with NewsApiStub(
+                latency=options['latency'],
+                error_rate=options['error_rate'],
+                payload_bytes=options['payload_bytes'],
+                results_per_query=options['results'],
+                fixtures=options['fixtures'],
+            ) as stub:
+                runs = self.run_benchmarks(stub, options)
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+        report = {
+            'benchmark': 'ingestion',
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'commit': self.git_commit(),
+            'config': {key: options[key] for key in (
+                'countries', 'categories', 'latency', 'error_rate', 'payload_bytes', 'results', 'fixtures'
+            )},
+            'runs': runs,
+        }
+        with open(options['output'], 'w') as f:
+            json.dump(report, f, indent=2)
+        self.stdout.write(self.style.SUCCESS(f"Results written to {options['output']}"))
+
+    def run_benchmarks(self, stub, options):
+        runs = []
+        # The stub ignores the key, but NewsApiClient refuses to send a request without one
+        os.environ.setdefault('NEWS_API_KEY', 'stub-key')
+        # No quota in the benchmark: the stub is free and the run must be repeatable.
+        # The test database only exists on the primary connection, so replicas are not read.
+        with override_settings(NEWS_API_BASE_URL=stub.base_url, NEWS_API_DAILY_QUOTA=0,
+                               NEWS_API_QUOTA_PER_SECOND=0, NEWS_API_MAX_RPS=0, DATABASE_REPLICAS=[]):
+            reset_session()
+            for label in ('cold', 'warm'):
+                result = self.measure(lambda: self.ingest(options))
+                result['run'] = label
+                result['articles_in_db'] = NewsArticle.objects.count()
+                result['sources_in_db'] = Source.objects.count()
+                runs.append(result)
+                self.stdout.write(
+                    f"{label}: {result['articles_per_second']:.1f} articles/s, {result['queries']} queries, "
+                    f"peak {result['peak_memory_kb']:.0f} KiB, {result['wall_time']:.2f}s"
+                )
+        reset_session()
+        return runs
+
+    def ingest(self, options):
+        sources = save_sources_to_db(retire_missing=True)
+        articles = save_top_headlines_to_db(countries=options['countries'], categories=options['categories'])
+        return {'sources': sources, 'articles': articles}
+
+    def measure(self, func):
+        counter = QueryCounter()
+        connection_created.connect(counter.attach)
+        connection.ensure_connection()
+        tracemalloc.start()
+        started = time.perf_counter()
+        try:
+            with connection.execute_wrapper(counter):
+                summary = func()
+            wall_time = time.perf_counter() - started
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+            connection_created.disconnect(counter.attach)
+
+        articles = summary['articles'] or {}
+        written = articles.get('created', 0) + articles.get('updated', 0)
+        return {
+            'wall_time': round(wall_time, 4),
+            'queries': counter.count,
+            'peak_memory_kb': round(peak / 1024, 1),
+            'articles_written': written,
+            'articles_per_second': round(written / wall_time, 2) if wall_time else 0,
+            'summary': summary,
+        }
+
+    def git_commit(self):
+        try:
+            return subprocess.check_output(
+                ['git', 'rev-parse', 'HEAD'], text=True, stderr=subprocess.DEVNULL
+            ).strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
@@ -0,0 +1,158 @@
+import json
+import random
+import statistics
+import subprocess
+import time
+from datetime import datetime, timedelta, timezone
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import override_settings
+
+from apps.news.models import Category, Country, Language, NewsArticle, Source
+from apps.news.references import clear_reference_tables
+from apps.news.serializers import NewsArticleListRowSerializer, NewsArticleListSerializer
+from apps.news.views import NewsArticleListView
+
+
+def seed_articles(article_count, source_count):
+    """Create benchmark sources and articles spread over the reference rows."""
+    rnd = random.Random(42)
+    categories = list(Category.objects.all())
+    countries = list(Country.objects.all())
+    languages = list(Language.objects.all())
+    Source.objects.bulk_create([
+        Source(
+            source_id=f'bench-source-{i}',
+            name=f'Bench Source {i}',
+            category=categories[i % len(categories)],
+            country=countries[i % len(countries)],
+            language=languages[i % len(languages)],
+        )
+        for i in range(source_count)
+    ])
+    sources = list(Source.objects.all())
+    published = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    NewsArticle.objects.bulk_create([
+        NewsArticle(
+            title=f'Bench headline {i}',
+            description='Lorem ipsum dolor sit amet ' * 8,
+            content='Lorem ipsum dolor sit amet ' * 40,
+            url=f'https://bench.example.com/{i}',
+            image_url=f'https://bench.example.com/{i}.jpg',
+            published_at=published + timedelta(minutes=i),
+            source=source,
+            category_id=source.category_id,
+            country_id=source.country_id,
+            language_id=source.language_id,
+        )
+        for i, source in ((i, rnd.choice(sources)) for i in range(article_count))
+    ], batch_size=1000)
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark article list serialization: NewsArticleListSerializer on model "
+        "instances vs NewsArticleListRowSerializer on values() rows, per page, on a "
+        "throwaway test database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--articles', type=int, default=5000)
+        parser.add_argument('--sources', type=int, default=50)
+        parser.add_argument('--page-size', type=int, default=100)
+        parser.add_argument('--pages', type=int, default=50, help='Pages measured per mode')
+        parser.add_argument('--output', default='benchmark-serialization.json')
+
+    def handle(self, *args, **options):
+        old_name = connection.settings_dict['NAME']
+        connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        # Reference rows get new primary keys in the test database
+        clear_reference_tables()
+        try:
+            # The test database only exists on the primary connection, so replicas are not read
+            with override_settings(DATABASE_REPLICAS=[]):
+                seed_articles(options['articles'], options['sources'])
+                modes = {
+                    'serializer': self.measure(self.serializer_page, options),
+                    'values': self.measure(self.values_page, options),
+                }
+                identical = all(
+                    json.dumps(self.serializer_page(page, options['page_size'])[1])
+                    == json.dumps(self.values_page(page, options['page_size'])[1])
+                    for page in range(3)
+                )
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+        for label, result in modes.items():
+            self.stdout.write(
+                f"{label}: serialize {result['serialize_ms']['median']:.2f} ms/page, "
+                f"query + serialize {result['total_ms']['median']:.2f} ms/page"
+            )
+        speedup = modes['serializer']['serialize_ms']['median'] / (modes['values']['serialize_ms']['median'] or 1)
+        self.stdout.write(f"Serialization speedup: {speedup:.1f}x, identical output: {identical}")
+
+        report = {
+            'benchmark': 'serialization',
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'commit': self.git_commit(),
+            'config': {key: options[key] for key in ('articles', 'sources', 'page_size', 'pages')},
+            'modes': modes,
+            'serialize_speedup': round(speedup, 2),
+            'identical_output': identical,
+        }
+        with open(options['output'], 'w') as f:
+            json.dump(report, f, indent=2)
+        self.stdout.write(self.style.SUCCESS(f"Results written to {options['output']}"))
+
+    def page_bounds(self, page, page_size):
+        start = page * page_size
+        return start, start + page_size
+
+    def serializer_page(self, page, page_size):
+        """Fetch and serialize one page the way NewsArticleListSerializer does."""
+        start, end = self.page_bounds(page, page_size)
+        rows = list(NewsArticleListView.queryset.order_by('-published_at')[start:end])
+        started = time.perf_counter()
+        data = NewsArticleListSerializer(rows, many=True).data
+        return time.perf_counter() - started, data
+
+    def values_page(self, page, page_size):
+        """Fetch and serialize one page through the values() read path."""
+        start, end = self.page_bounds(page, page_size)
+        queryset = NewsArticleListRowSerializer.values(NewsArticleListView.queryset.order_by('-published_at'))
+        rows = list(queryset[start:end])
+        started = time.perf_counter()
+        data = NewsArticleListRowSerializer(rows).data
+        return time.perf_counter() - started, data
+
+    def measure(self, page_func, options):
+        page_count = max(options['articles'] // options['page_size'], 1)
+        serialize_times = []
+        total_times = []
+        for i in range(options['pages']):
+            started = time.perf_counter()
+            serialize_time, _ = page_func(i % page_count, options['page_size'])
+            total_times.append(time.perf_counter() - started)
+            serialize_times.append(serialize_time)
+        return {
+            'serialize_ms': self.summarize(serialize_times),
+            'total_ms': self.summarize(total_times),
+        }
+
+    def summarize(self, samples):
+        samples_ms = sorted(sample * 1000 for sample in samples)
+        return {
+            'median': round(statistics.median(samples_ms), 3),
+            'p95': round(samples_ms[int(len(samples_ms) * 0.95) - 1], 3),
+            'mean': round(statistics.mean(samples_ms), 3),
+        }
+
+    def git_commit(self):
+        try:
+            return subprocess.check_output(
+                ['git', 'rev-parse', 'HEAD'], text=True, stderr=subprocess.DEVNULL
+            ).strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
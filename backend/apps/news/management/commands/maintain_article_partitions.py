@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from apps.news.partitions import maintain_partitions
+
+
+class Command(BaseCommand):
+    help = (
+        "Create the upcoming monthly article partitions and detach (or drop) the "
+        "ones past NEWS_ARTICLE_RETENTION_MONTHS, as the daily Celery task does."
+    )
+
+    def handle(self, *args, **options):
+        result = maintain_partitions()
+        if not result['partitioned']:
+            self.stdout.write(self.style.WARNING("The article table is not partitioned; nothing to do"))
+            return
+        for name in result['created']:
+            self.stdout.write(f"Created {name}")
+        for name in result['detached']:
+            self.stdout.write(f"Detached {name}")
+        self.stdout.write(self.style.SUCCESS(
+            f"{len(result['created'])} partitions created, {len(result['detached'])} detached"
+        ))
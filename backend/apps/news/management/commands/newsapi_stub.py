@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+
+from apps.news_api_stub import NewsApiStub
+
+
+class Command(BaseCommand):
+    help = "Run a local NewsAPI stand-in (set NEWS_API_BASE_URL to its address)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--host', default='127.0.0.1')
+        parser.add_argument('--port', type=int, default=8099)
+        parser.add_argument('--latency', type=float, default=0.0, help="Seconds added to every response")
+        parser.add_argument('--error-rate', type=float, default=0.0, help="Share of requests answered with 500")
+        parser.add_argument('--payload-bytes', type=int, default=500, help="Size of each article body")
+        parser.add_argument('--results', type=int, default=150, help="totalResults per synthetic query")
+        parser.add_argument('--fixtures', help="JSON file with recorded 'sources' and 'articles'")
+
+    def handle(self, *args, **options):
+        stub = NewsApiStub(
+            host=options['host'],
+            port=options['port'],
+            latency=options['latency'],
+            error_rate=options['error_rate'],
+            payload_bytes=options['payload_bytes'],
+            results_per_query=options['results'],
+            fixtures=options['fixtures'],
+        )
+        self.stdout.write(self.style.SUCCESS(f"NewsAPI stub listening on {stub.base_url}"))
+        try:
+            stub.server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            stub.server.server_close()
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from apps.news.facets import rebuild_facet_counts
+from apps.news.response_cache import ARTICLES, bump_version
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the article facet rollup from the article table, e.g. after "
+        "articles were edited or deleted outside ingestion."
+    )
+
+    def handle(self, *args, **options):
+        rows = rebuild_facet_counts()
+        bump_version(ARTICLES)
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rows} facet count rows"))
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.10 on 2026-10-17 12:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0004_alter_source_url'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='source',
+            name='is_active',
+            field=models.BooleanField(default=True),
+        ),
+    ]
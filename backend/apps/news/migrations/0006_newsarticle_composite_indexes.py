@@ -0,0 +1,29 @@
+# Generated by Django 5.2.10 on 2026-10-17 12:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0005_source_is_active'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='newsarticle',
+            index=models.Index(fields=['category', '-published_at'], name='news_article_cat_pub_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='newsarticle',
+            index=models.Index(fields=['country', '-published_at'], name='news_article_ctry_pub_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='newsarticle',
+            index=models.Index(fields=['language', '-published_at'], name='news_article_lang_pub_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='newsarticle',
+            index=models.Index(fields=['source', '-published_at'], name='news_article_src_pub_idx'),
+        ),
+    ]
@@ -0,0 +1,65 @@
+# Generated by Django 5.2.10 on 2026-10-17 12:34
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+SEARCH_VECTOR_TRIGGER = """
+CREATE OR REPLACE FUNCTION news_article_search_vector() RETURNS trigger AS $$
+DECLARE
+    config regconfig;
+BEGIN
+    SELECT CASE l.code
+               WHEN 'en' THEN 'english'
+               WHEN 'fr' THEN 'french'
+               WHEN 'ar' THEN 'arabic'
+               ELSE 'simple'
+           END::regconfig
+      INTO config
+      FROM news_language l
+     WHERE l.id = NEW.language_id;
+
+    config := COALESCE(config, 'simple'::regconfig);
+
+    NEW.search_vector :=
+        setweight(to_tsvector(config, COALESCE(NEW.title, '')), 'A') ||
+        setweight(to_tsvector(config, COALESCE(NEW.description, '')), 'B') ||
+        setweight(to_tsvector(config, COALESCE(NEW.content, '')), 'C');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER news_article_search_vector_update
+    BEFORE INSERT OR UPDATE OF title, description, content, language_id
+    ON news_newsarticle
+    FOR EACH ROW EXECUTE FUNCTION news_article_search_vector();
+
+-- Backfill existing rows through the trigger
+UPDATE news_newsarticle SET title = title;
+"""
+
+DROP_SEARCH_VECTOR_TRIGGER = """
+DROP TRIGGER IF EXISTS news_article_search_vector_update ON news_newsarticle;
+DROP FUNCTION IF EXISTS news_article_search_vector();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0006_newsarticle_composite_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='newsarticle',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunSQL(SEARCH_VECTOR_TRIGGER, DROP_SEARCH_VECTOR_TRIGGER),
+        migrations.AddIndex(
+            model_name='newsarticle',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='news_article_search_idx'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.10 on 2026-10-17 12:35
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0007_newsarticle_search_vector'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='newsarticle',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['title'], name='news_article_title_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='source',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['name'], name='news_source_name_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+    ]
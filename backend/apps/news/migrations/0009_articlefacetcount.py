@@ -0,0 +1,41 @@
+# Generated by Django 5.2.10 on 2026-10-17 12:43
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_facet_counts(apps, schema_editor):
+    NewsArticle = apps.get_model("news", "NewsArticle")
+    ArticleFacetCount = apps.get_model("news", "ArticleFacetCount")
+    columns = ["category_id", "country_id", "language_id", "source_id"]
+    grouped = NewsArticle.objects.order_by().values(*columns).annotate(total=Count("id"))
+    ArticleFacetCount.objects.bulk_create(
+        [ArticleFacetCount(**{column: row[column] for column in columns}, count=row["total"]) for row in grouped],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0008_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArticleFacetCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('count', models.IntegerField(default=0)),
+                ('category', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='news.category')),
+                ('country', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='news.country')),
+                ('language', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='news.language')),
+                ('source', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='news.source')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('category', 'country', 'language', 'source'), name='news_facet_count_dims_uniq', nulls_distinct=False)],
+            },
+        ),
+        migrations.RunPython(backfill_facet_counts, migrations.RunPython.noop),
+    ]
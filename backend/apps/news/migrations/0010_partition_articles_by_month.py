@@ -0,0 +1,131 @@
+# Generated by Django 5.2.10 on 2026-10-17 12:55
+
+from datetime import datetime, timezone
+
+from django.db import migrations, models
+
+TABLE = "news_newsarticle"
+OLD_TABLE = "news_newsarticle_unpartitioned"
+DEFAULT_PARTITION = "news_newsarticle_default"
+
+# Monthly partitions are created up to this many months ahead; later months are
+# kept ready by apps.news.partitions.ensure_partitions()
+MONTHS_AHEAD = 3
+# Rows older than this land in the default partition instead of one partition per month
+MAX_MONTHS_BACK = 120
+
+
+def _month(value):
+    return value.year * 12 + value.month - 1
+
+
+def _month_bound(month):
+    return datetime(month // 12, month % 12 + 1, 1, tzinfo=timezone.utc)
+
+
+def _table_objects(cursor, table):
+    """CREATE statements of the table's indexes, constraints and triggers, except the primary key."""
+    cursor.execute(
+        """
+        SELECT indexdef FROM pg_indexes
+         WHERE schemaname = current_schema() AND tablename = %s
+           AND NOT EXISTS (
+               SELECT 1 FROM pg_constraint c
+                WHERE c.conindid = format('%%I.%%I', schemaname, indexname)::regclass
+           )
+        """,
+        [table],
+    )
+    indexes = [row[0] for row in cursor.fetchall()]
+    cursor.execute(
+        """
+        SELECT format('ALTER TABLE %%I ADD CONSTRAINT %%I %%s', %s, conname, pg_get_constraintdef(oid))
+          FROM pg_constraint WHERE conrelid = %s::regclass AND contype <> 'p'
+        """,
+        [table, table],
+    )
+    constraints = [row[0] for row in cursor.fetchall()]
+    cursor.execute(
+        "SELECT pg_get_triggerdef(oid) FROM pg_trigger WHERE tgrelid = %s::regclass AND NOT tgisinternal",
+        [table],
+    )
+    triggers = [row[0] for row in cursor.fetchall()]
+    cursor.execute(
+        "SELECT count(*) FROM pg_constraint WHERE confrelid = %s::regclass AND contype = 'f'",
+        [table],
+    )
+    if cursor.fetchone()[0]:
+        raise RuntimeError(f"{table} is referenced by foreign keys; they cannot point at a partitioned table")
+    return constraints + indexes + triggers
+
+
+def _rebuild_articles(schema_editor, partitioned):
+    """
+    Recreate the article table as a range-partitioned table (or back as a plain
+    one) with the same columns, data, constraints, indexes and triggers.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        objects = _table_objects(cursor, TABLE)
+        cursor.execute(f"SELECT min(published_at), max(published_at) FROM {TABLE}")
+        oldest, newest = cursor.fetchone()
+
+        cursor.execute(f"ALTER TABLE {TABLE} RENAME TO {OLD_TABLE}")
+        partition_clause = " PARTITION BY RANGE (published_at)" if partitioned else ""
+        cursor.execute(f"CREATE TABLE {TABLE} (LIKE {OLD_TABLE} INCLUDING DEFAULTS){partition_clause}")
+        # Identity columns are not supported on partitioned tables before Postgres 17
+        cursor.execute(f"CREATE SEQUENCE {TABLE}_id_seq_new OWNED BY {TABLE}.id")
+        cursor.execute(f"ALTER TABLE {TABLE} ALTER COLUMN id SET DEFAULT nextval('{TABLE}_id_seq_new')")
+
+        if partitioned:
+            current = _month(datetime.now(timezone.utc))
+            first = max(_month(oldest) if oldest else current, current - MAX_MONTHS_BACK)
+            last = max(_month(newest) if newest else current, current) + MONTHS_AHEAD
+            for month in range(first, last + 1):
+                start, end = _month_bound(month), _month_bound(month + 1)
+                cursor.execute(
+                    f"CREATE TABLE {TABLE}_p{start:%Y_%m} PARTITION OF {TABLE} "
+                    f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+                )
+            cursor.execute(f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF {TABLE} DEFAULT")
+
+        cursor.execute(f"INSERT INTO {TABLE} SELECT * FROM {OLD_TABLE}")
+        cursor.execute(f"SELECT setval('{TABLE}_id_seq_new', COALESCE(max(id), 0) + 1, false) FROM {TABLE}")
+        # Dropping the old table frees the names of its sequence, constraints and indexes
+        cursor.execute(f"DROP TABLE {OLD_TABLE}")
+        cursor.execute(f"ALTER SEQUENCE {TABLE}_id_seq_new RENAME TO {TABLE}_id_seq")
+
+        primary_key = "id, published_at" if partitioned else "id"
+        cursor.execute(f"ALTER TABLE {TABLE} ADD CONSTRAINT {TABLE}_pkey PRIMARY KEY ({primary_key})")
+        for statement in objects:
+            cursor.execute(statement)
+        cursor.execute(f"ANALYZE {TABLE}")
+
+
+def partition_articles(apps, schema_editor):
+    _rebuild_articles(schema_editor, partitioned=True)
+
+
+def unpartition_articles(apps, schema_editor):
+    _rebuild_articles(schema_editor, partitioned=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0009_articlefacetcount'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='newsarticle',
+            name='url',
+            field=models.URLField(),
+        ),
+        migrations.AddConstraint(
+            model_name='newsarticle',
+            constraint=models.UniqueConstraint(fields=('url', 'published_at'), name='news_article_url_published_uniq'),
+        ),
+        migrations.RunPython(partition_articles, unpartition_articles),
+    ]
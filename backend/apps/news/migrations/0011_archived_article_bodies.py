@@ -0,0 +1,70 @@
+# Generated by Django 5.2.10 on 2026-10-17 12:58
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def search_vector_function(archived_guard):
+    return f"""
+CREATE OR REPLACE FUNCTION news_article_search_vector() RETURNS trigger AS $$
+DECLARE
+    config regconfig;
+BEGIN{archived_guard}
+    SELECT CASE l.code
+               WHEN 'en' THEN 'english'
+               WHEN 'fr' THEN 'french'
+               WHEN 'ar' THEN 'arabic'
+               ELSE 'simple'
+           END::regconfig
+      INTO config
+      FROM news_language l
+     WHERE l.id = NEW.language_id;
+
+    config := COALESCE(config, 'simple'::regconfig);
+
+    NEW.search_vector :=
+        setweight(to_tsvector(config, COALESCE(NEW.title, '')), 'A') ||
+        setweight(to_tsvector(config, COALESCE(NEW.description, '')), 'B') ||
+        setweight(to_tsvector(config, COALESCE(NEW.content, '')), 'C');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+"""
+
+
+# The description and content of archived rows are NULL: keep the vector built
+# from them until ingestion stores a fresh body (body_archived back to false)
+ARCHIVED_GUARD = """
+    IF TG_OP = 'UPDATE' AND NEW.body_archived THEN
+        RETURN NEW;
+    END IF;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0010_partition_articles_by_month'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedArticleBody',
+            fields=[
+                ('article', models.OneToOneField(db_constraint=False, on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='archived_body', serialize=False, to='news.newsarticle')),
+                ('description', models.BinaryField(null=True)),
+                ('content', models.BinaryField(null=True)),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='newsarticle',
+            name='body_archived',
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='newsarticle',
+            index=models.Index(condition=models.Q(('body_archived', False)), fields=['published_at', 'id'], name='news_article_unarchived_idx'),
+        ),
+        migrations.RunSQL(search_vector_function(ARCHIVED_GUARD), search_vector_function("")),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.10 on 2026-10-17 13:24
+
+from django.db import migrations, models
+
+# Register the URLs already stored. Should a URL have been stored twice, with two
+# published_at values, the older one keeps it.
+BACKFILL = """
+INSERT INTO news_articleurl (url, published_at)
+SELECT url, min(published_at) FROM news_newsarticle GROUP BY url
+"""
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0011_archived_article_bodies'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArticleUrl',
+            fields=[
+                ('url', models.URLField(primary_key=True, serialize=False)),
+                ('published_at', models.DateTimeField(db_index=True)),
+            ],
+        ),
+        migrations.RunSQL(BACKFILL, migrations.RunSQL.noop),
+    ]
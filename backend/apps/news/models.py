@@ -1,3 +1,5 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 
 
@@ -30,6 +32,13 @@ class Language(models.Model):
         ('fr', 'French'),
         ('ar', 'Arabic'),
     ]
+    # PostgreSQL text search configuration used for articles in each language.
+    # Keep in sync with the news_article_search_vector() trigger (migrations 0007, 0011).
+    SEARCH_CONFIGS = {
+        'en': 'english',
+        'fr': 'french',
+        'ar': 'arabic',
+    }
     code = models.CharField(max_length=2, choices=LANGUAGE_CHOICES, unique=True)
 
     def __str__(self):
@@ -81,6 +90,15 @@ class Source(models.Model):
         blank=True,
         related_name='sources'
     )
+    # Sources that disappear from the NewsAPI feed are retired instead of deleted
+    # so their articles keep the link.
+    is_active = models.BooleanField(default=True)
+
+    class Meta:
+        indexes = [
+            # Serves prefix and fuzzy matches for the typeahead endpoint
+            GinIndex(fields=['name'], name='news_source_name_trgm_idx', opclasses=['gin_trgm_ops']),
+        ]
 
     def __str__(self):
         return self.name
@@ -90,10 +108,15 @@ class NewsArticle(models.Model):
     """
     Represents a news article.
     Denormalized fields (category, language, country) are stored for faster filtering.
+
+    In Postgres the table is partitioned by published_at month (migration 0010,
+    apps.news.partitions); the database primary key is (id, published_at).
     """
     title = models.CharField(max_length=255)
     description = models.TextField(null=True, blank=True)
-    url = models.URLField(unique=True)
+    # Unique together with published_at (see Meta): the table is range
+    # partitioned by published_at and Postgres unique constraints must include it.
+    url = models.URLField()
     content = models.TextField(null=True, blank=True)
     image_url = models.URLField(null=True, blank=True)
     published_at = models.DateTimeField()
@@ -132,12 +155,35 @@ class NewsArticle(models.Model):
     
     created_at = models.DateTimeField(auto_now_add=True)
 
+    # Weighted title/description/content vector, maintained by a database trigger
+    # using the text search configuration of the article's language.
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    # description and content were moved to ArchivedArticleBody (cold storage)
+    # and are NULL here; the search vector built from them is kept.
+    body_archived = models.BooleanField(default=False, editable=False)
+
     class Meta:
         indexes = [
             models.Index(fields=['category']),
             models.Index(fields=['language']),
             models.Index(fields=['country']),
             models.Index(fields=['published_at']),
+            # Filtered list queries ordered by -published_at become index range scans
+            models.Index(fields=['category', '-published_at'], name='news_article_cat_pub_idx'),
+            models.Index(fields=['country', '-published_at'], name='news_article_ctry_pub_idx'),
+            models.Index(fields=['language', '-published_at'], name='news_article_lang_pub_idx'),
+            models.Index(fields=['source', '-published_at'], name='news_article_src_pub_idx'),
+            GinIndex(fields=['search_vector'], name='news_article_search_idx'),
+            GinIndex(fields=['title'], name='news_article_title_trgm_idx', opclasses=['gin_trgm_ops']),
+            # Oldest articles still holding their bodies, the next ones to archive
+            models.Index(
+                fields=['published_at', 'id'], condition=models.Q(body_archived=False),
+                name='news_article_unarchived_idx',
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=['url', 'published_at'], name='news_article_url_published_uniq'),
         ]
 
     def __str__(self):
@@ -148,4 +194,67 @@ class NewsArticle(models.Model):
             self.category = self.source.category
             self.language = self.source.language
             self.country = self.source.country
-        super().save(*args, **kwargs)
\ No newline at end of file
+        super().save(*args, **kwargs)
+
+
+class ArticleUrl(models.Model):
+    """
+    Stored article URLs, one row each. The partitioned article table can only
+    enforce (url, published_at) uniqueness, so ingestion registers a URL here
+    before writing its article, and holds the row lock while it does (see
+    apps.news.services.bulk_upsert_articles).
+    """
+    # No foreign key to the article: the partitioned table is keyed on (id, published_at)
+    url = models.URLField(primary_key=True)
+    # The article's published_at, so retention can release the URLs of the months it removes
+    published_at = models.DateTimeField(db_index=True)
+
+    def __str__(self):
+        return self.url
+
+
+class ArchivedArticleBody(models.Model):
+    """
+    zlib-compressed description and content of an old article, moved out of
+    NewsArticle by the archive_article_bodies command (see apps.news.archive).
+    """
+    # No database foreign key: the partitioned article table is keyed on (id, published_at)
+    article = models.OneToOneField(
+        NewsArticle,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        db_constraint=False,
+        related_name='archived_body'
+    )
+    description = models.BinaryField(null=True)
+    content = models.BinaryField(null=True)
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"Archived body of article {self.article_id}"
+
+
+class ArticleFacetCount(models.Model):
+    """
+    Article count per (category, country, language, source) combination.
+    Rollup of NewsArticle maintained incrementally by ingestion, so facet
+    counts never GROUP BY the article table.
+    """
+    category = models.ForeignKey(Category, on_delete=models.CASCADE, null=True, related_name='+')
+    country = models.ForeignKey(Country, on_delete=models.CASCADE, null=True, related_name='+')
+    language = models.ForeignKey(Language, on_delete=models.CASCADE, null=True, related_name='+')
+    source = models.ForeignKey(Source, on_delete=models.CASCADE, null=True, related_name='+')
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            # Articles without a source or reference still get exactly one row per combination
+            models.UniqueConstraint(
+                fields=['category', 'country', 'language', 'source'],
+                name='news_facet_count_dims_uniq',
+                nulls_distinct=False,
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.category_id}/{self.country_id}/{self.language_id}/{self.source_id}: {self.count}"
@@ -1,5 +1,146 @@
-from rest_framework.pagination import PageNumberPagination
+import base64
+import binascii
+import hashlib
+import json
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.paginator import EmptyPage, InvalidPage, Page, PageNotAnInteger, Paginator
+from django.db import connections
+from django.db.models import Q, QuerySet
+from django.utils.dateparse import parse_datetime
+from django.utils.functional import cached_property
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
 from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from . import response_cache
+
+COUNT_EXACT = 'exact'
+COUNT_ESTIMATED = 'estimated'
+COUNT_CACHED = 'cached'
+
+
+class CountStrategyPage(Page):
+    """Page that still offers a next page when the count may be an underestimate."""
+
+    def has_next(self):
+        if self.paginator.count_is_approximate and len(self.object_list) == self.paginator.per_page:
+            return True
+        return super().has_next()
+
+
+class CountStrategyPaginator(Paginator):
+    """
+    Paginator whose count follows NEWS_ARTICLE_COUNT_STRATEGY:
+    - exact: COUNT(*) on every request
+    - estimated: the planner's row estimate (pg_class.reltuples for an unfiltered
+      table, EXPLAIN otherwise); an exact COUNT(*) is still used when the estimate
+      is below NEWS_ARTICLE_COUNT_ESTIMATE_THRESHOLD or the database is not PostgreSQL
+    - cached: COUNT(*) cached per filter signature (query SQL) in the response
+      cache for NEWS_ARTICLE_COUNT_CACHE_TIMEOUT seconds; exact until the article
+      data version changes, approximate afterwards
+
+    `count_is_approximate` tells whether `count` may be off. Approximate counts do
+    not bound the page number, so pages past the estimate remain reachable.
+    """
+
+    def __init__(self, object_list, per_page, orphans=0, allow_empty_first_page=True, strategy=None):
+        super().__init__(object_list, per_page, orphans, allow_empty_first_page)
+        self.strategy = strategy or settings.NEWS_ARTICLE_COUNT_STRATEGY
+        self.count_is_approximate = False
+
+    @cached_property
+    def count(self):
+        if not isinstance(self.object_list, QuerySet) or self.strategy == COUNT_EXACT:
+            return self.exact_count()
+        if self.strategy == COUNT_ESTIMATED:
+            estimate = self.estimated_count()
+            if estimate is not None and estimate >= settings.NEWS_ARTICLE_COUNT_ESTIMATE_THRESHOLD:
+                self.count_is_approximate = True
+                return estimate
+            return self.exact_count()
+        if self.strategy == COUNT_CACHED:
+            return self.cached_count()
+        raise ValueError(f"Unknown NEWS_ARTICLE_COUNT_STRATEGY {self.strategy!r}")
+
+    async def acount(self):
+        """`count` for async code: exact counts use QuerySet.acount(), other strategies run in a thread."""
+        if 'count' not in self.__dict__:
+            if self.strategy == COUNT_EXACT and isinstance(self.object_list, QuerySet):
+                self.__dict__['count'] = await self.object_list.acount()
+            else:
+                await sync_to_async(getattr)(self, 'count')
+        return self.count
+
+    def exact_count(self):
+        return Paginator.count.func(self)
+
+    def estimated_count(self):
+        """Planner row estimate for the queryset, or None when unavailable."""
+        queryset = self.object_list.order_by()
+        connection = connections[queryset.db]
+        if connection.vendor != 'postgresql':
+            return None
+        with connection.cursor() as cursor:
+            if not queryset.query.where and not queryset.query.distinct:
+                # A partitioned table has no statistics of its own: add up its partitions'
+                cursor.execute(
+                    "SELECT CASE WHEN bool_or(reltuples >= 0) THEN sum(greatest(reltuples, 0))::bigint END "
+                    "FROM pg_class WHERE relkind <> 'p' AND (oid = %s::regclass "
+                    "OR oid IN (SELECT inhrelid FROM pg_inherits WHERE inhparent = %s::regclass))",
+                    [queryset.model._meta.db_table] * 2,
+                )
+                row = cursor.fetchone()
+                estimate = row[0] if row else None
+            else:
+                sql, params = queryset.query.sql_with_params()
+                cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+                plan = cursor.fetchone()[0]
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                estimate = plan[0]['Plan']['Plan Rows']
+        # reltuples is -1 (NULL above) for a table that was never analyzed
+        if estimate is None or estimate < 0:
+            return None
+        return int(estimate)
+
+    def cached_count(self):
+        sql, params = self.object_list.order_by().query.sql_with_params()
+        signature = hashlib.md5(f"{self.object_list.db}:{sql}:{params!r}".encode()).hexdigest()
+        count, stale = response_cache.get_cached_count(signature)
+        if count is None:
+            # Read the version first: a change committed while counting leaves the count stale
+            version = response_cache.get_version(response_cache.ARTICLES)
+            count = self.exact_count()
+            response_cache.set_cached_count(signature, version, count)
+        self.count_is_approximate = stale
+        return count
+
+    def validate_number(self, number):
+        self.count  # computing the count decides whether it is approximate
+        if not self.count_is_approximate:
+            return super().validate_number(number)
+        # The count may be low: accept any page from 1 up, past the end it is simply empty
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(_("That page number is not an integer"))
+        if number < 1:
+            raise EmptyPage(_("That page number is less than 1"))
+        return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        if not self.count_is_approximate:
+            return super().page(number)
+        bottom = (number - 1) * self.per_page
+        return self._get_page(self.object_list[bottom:bottom + self.per_page], number, self)
+
+    def _get_page(self, *args, **kwargs):
+        return CountStrategyPage(*args, **kwargs)
 
 
 class NewsArticlePagination(PageNumberPagination):
@@ -10,13 +151,158 @@ class NewsArticlePagination(PageNumberPagination):
     page_size = 50
     page_size_query_param = 'page_size'
     max_page_size = 100
+    django_paginator_class = CountStrategyPaginator
     
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """paginate_queryset() for async views: the count and the page rows are awaited."""
+        self.request = request
+        paginator = self.django_paginator_class(queryset, self.get_page_size(request))
+        await paginator.acount()
+        page_number = self.get_page_number(request, paginator)
+        try:
+            self.page = paginator.page(page_number)
+        except InvalidPage as exc:
+            raise NotFound(self.invalid_page_message.format(page_number=page_number, message=str(exc)))
+        self.page.object_list = [item async for item in self.page.object_list]
+        return self.page.object_list
+
     def get_paginated_response(self, data):
         """Custom pagination response format"""
         return Response({
             'count': self.page.paginator.count,
+            'count_is_approximate': self.page.paginator.count_is_approximate,
             'total_pages': self.page.paginator.num_pages,
             'current_page': self.page.number,
             'page_size': self.get_page_size(self.request),
             'results': data
-        })
\ No newline at end of file
+        })
+
+
+class NewsArticleCursorPagination(BasePagination):
+    """
+    Keyset pagination on the active ordering with an `id` tie-break.
+    Opt-in with ?pagination=cursor (or by sending a ?cursor=).
+    No COUNT(*) and no OFFSET, so every page costs the same on large tables.
+    """
+    page_size = NewsArticlePagination.page_size
+    page_size_query_param = NewsArticlePagination.page_size_query_param
+    max_page_size = NewsArticlePagination.max_page_size
+    cursor_query_param = 'cursor'
+    mode_query_param = 'pagination'
+    default_ordering = '-published_at'
+    datetime_fields = {'published_at', 'created_at'}
+
+    @classmethod
+    def is_requested(cls, request):
+        """Whether the client opted into cursor pagination."""
+        params = request.query_params
+        return params.get(cls.mode_query_param) == 'cursor' or cls.cursor_query_param in params
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(max(size, 1), self.max_page_size)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        return self.page_results(list(self.page_queryset(queryset, request)))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """paginate_queryset() for async views."""
+        return self.page_results([item async for item in self.page_queryset(queryset, request)])
+
+    def page_queryset(self, queryset, request):
+        """Keyset-filtered queryset of the requested page, plus one row to detect a further page."""
+        self.request = request
+        self.page_size = self.get_page_size(request)
+
+        # The first ordering term applied by OrderingFilter drives the keyset
+        ordering = list(queryset.query.order_by) or [self.default_ordering]
+        first = ordering[0]
+        self.field = first.lstrip('-')
+        self.descending = first.startswith('-')
+
+        cursor = self.decode_cursor(request)
+        reverse = bool(cursor and cursor['reverse'])
+
+        descending = self.descending != reverse
+        prefix = '-' if descending else ''
+        queryset = queryset.order_by(f'{prefix}{self.field}', f'{prefix}id')
+
+        if cursor:
+            value, pk = cursor['value'], cursor['id']
+            op = 'lt' if descending else 'gt'
+            queryset = queryset.filter(
+                Q(**{f'{self.field}__{op}': value}) | Q(**{self.field: value, f'id__{op}': pk})
+            )
+
+        self.cursor = cursor
+        self.reverse = reverse
+        return queryset[:self.page_size + 1]
+
+    def page_results(self, results):
+        """Trim the fetched rows to the page and record the neighbouring positions."""
+        cursor, reverse = self.cursor, self.reverse
+        has_more = len(results) > self.page_size
+        results = results[:self.page_size]
+        if reverse:
+            results.reverse()
+
+        # Going backwards there is always a page after; going forwards there is one before any cursor
+        has_next = has_more if not reverse else True
+        has_previous = has_more if reverse else cursor is not None
+
+        self.next_position = self.position(results[-1]) if results and has_next else None
+        self.previous_position = self.position(results[0]) if results and has_previous else None
+        return results
+
+    def position(self, item):
+        if isinstance(item, dict):
+            return item[self.field], item['id']
+        return getattr(item, self.field), item.pk
+
+    def encode_cursor(self, position, reverse):
+        value, pk = position
+        if self.field in self.datetime_fields:
+            value = value.isoformat()
+        payload = json.dumps({'o': self.field, 'v': value, 'id': pk, 'r': reverse}, separators=(',', ':'))
+        token = base64.urlsafe_b64encode(payload.encode()).decode()
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, 'page')
+        return replace_query_param(url, self.cursor_query_param, token)
+
+    def decode_cursor(self, request):
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None
+        try:
+            data = json.loads(base64.urlsafe_b64decode(token.encode()))
+            value = data['v']
+            if data['o'] != self.field:
+                raise ValueError('Cursor ordering does not match the requested ordering')
+            if self.field in self.datetime_fields:
+                value = parse_datetime(value)
+                if value is None:
+                    raise ValueError('Invalid datetime')
+            return {'value': value, 'id': int(data['id']), 'reverse': bool(data['r'])}
+        except (TypeError, ValueError, KeyError, binascii.Error, UnicodeDecodeError):
+            raise NotFound('Invalid cursor')
+
+    def get_next_link(self):
+        if self.next_position is None:
+            return None
+        return self.encode_cursor(self.next_position, reverse=False)
+
+    def get_previous_link(self):
+        if self.previous_position is None:
+            return None
+        return self.encode_cursor(self.previous_position, reverse=True)
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'page_size': self.page_size,
+            'results': data
+        })
@@ -0,0 +1,193 @@
+import re
+from collections import Counter
+from datetime import date, datetime, timezone
+
+from django.conf import settings
+from django.db import connection, transaction
+from config.db_router import pin_to_primary
+from .facets import FACET_COLUMNS, apply_facet_deltas
+from .models import ArchivedArticleBody, ArticleUrl, NewsArticle
+from .response_cache import ARTICLES, bump_version_on_commit
+
+# NewsArticle is range partitioned by published_at month in Postgres (migration 0010):
+# one "<table>_pYYYY_MM" partition per month plus a default partition for
+# rows outside every month range.
+TABLE = NewsArticle._meta.db_table
+DEFAULT_PARTITION = f"{TABLE}_default"
+PARTITION_NAME = re.compile(rf"^{TABLE}_p(\d{{4}})_(\d{{2}})$")
+
+DETACH = 'detach'
+DROP = 'drop'
+
+
+def month_start(value):
+    """First day of the month of a date or datetime."""
+    return date(value.year, value.month, 1)
+
+
+def add_months(month, months):
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month):
+    return f"{TABLE}_p{month:%Y_%m}"
+
+
+def _bounds(month):
+    """Partition bounds of a month, as UTC timestamps."""
+    start = datetime(month.year, month.month, 1, tzinfo=timezone.utc)
+    end_month = add_months(month, 1)
+    return start, datetime(end_month.year, end_month.month, 1, tzinfo=timezone.utc)
+
+
+def is_partitioned():
+    """Whether the article table is a partitioned table (never outside Postgres)."""
+    if connection.vendor != 'postgresql':
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT relkind FROM pg_class WHERE oid = %s::regclass", [TABLE])
+        row = cursor.fetchone()
+    return bool(row) and row[0] == 'p'
+
+
+def attached_partitions():
+    """Attached monthly partitions as {month (date): table name}, oldest first."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = %s::regclass",
+            [TABLE],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+    partitions = {}
+    for name in names:
+        match = PARTITION_NAME.match(name)
+        if match:
+            partitions[date(int(match[1]), int(match[2]), 1)] = name
+    return dict(sorted(partitions.items()))
+
+
+def create_partition(month):
+    """
+    Create the partition of a month. Rows of that month already sitting in the
+    default partition are moved into it, as Postgres requires.
+    """
+    name = partition_name(month)
+    start, end = _bounds(month)
+    create = (
+        f"CREATE TABLE {name} PARTITION OF {TABLE} "
+        f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+    )
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} WHERE published_at >= %s AND published_at < %s)",
+            [start, end],
+        )
+        if not cursor.fetchone()[0]:
+            cursor.execute(create)
+            return
+        cursor.execute(f"ALTER TABLE {TABLE} DETACH PARTITION {DEFAULT_PARTITION}")
+        cursor.execute(create)
+        cursor.execute(
+            f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} WHERE published_at >= %s AND published_at < %s "
+            f"RETURNING *) INSERT INTO {name} SELECT * FROM moved",
+            [start, end],
+        )
+        cursor.execute(f"ALTER TABLE {TABLE} ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT")
+
+
+def ensure_partitions(months_ahead=None, today=None):
+    """
+    Create the missing monthly partitions from the newest existing one up to
+    `months_ahead` months after the current month.
+
+    Returns:
+        list: Names of the created partitions
+    """
+    if months_ahead is None:
+        months_ahead = settings.NEWS_ARTICLE_PARTITIONS_AHEAD
+    current = month_start(today or datetime.now(timezone.utc))
+    existing = attached_partitions()
+    # Start after the newest partition, so months removed by retention are never re-created
+    month = add_months(max(existing), 1) if existing else current
+    created = []
+    last = add_months(current, months_ahead)
+    while month <= last:
+        if month not in existing:
+            create_partition(month)
+            created.append(partition_name(month))
+        month = add_months(month, 1)
+    return created
+
+
+def detach_partition(month, action=DETACH):
+    """
+    Take a month's partition out of the article table, keeping it as a
+    standalone table (`detach`) or deleting it (`drop`). Its articles are
+    subtracted from the facet rollup, their URLs released from ArticleUrl and
+    their archived bodies moved out of ArchivedArticleBody in the same
+    transaction: a detached partition keeps them in a "<partition>_bodies"
+    table next to it.
+    """
+    name = partition_name(month)
+    start, end = _bounds(month)
+    with transaction.atomic(), connection.cursor() as cursor:
+        columns = ', '.join(FACET_COLUMNS.values())
+        cursor.execute(f"SELECT {columns}, count(*) FROM {name} GROUP BY {columns}")
+        apply_facet_deltas(Counter({tuple(row[:-1]): -row[-1] for row in cursor.fetchall()}))
+        cursor.execute(
+            f"DELETE FROM {ArticleUrl._meta.db_table} WHERE published_at >= %s AND published_at < %s",
+            [start, end],
+        )
+        cursor.execute(f"ALTER TABLE {TABLE} DETACH PARTITION {name}")
+        # Archived bodies have no foreign key to cascade through (see ArchivedArticleBody)
+        bodies = ArchivedArticleBody._meta.db_table
+        if action == DETACH:
+            cursor.execute(
+                f"CREATE TABLE {name}_bodies AS SELECT * FROM {bodies} WHERE article_id IN (SELECT id FROM {name})"
+            )
+        cursor.execute(f"DELETE FROM {bodies} WHERE article_id IN (SELECT id FROM {name})")
+        if action == DROP:
+            cursor.execute(f"DROP TABLE {name}")
+        bump_version_on_commit(ARTICLES)
+    return name
+
+
+def apply_retention(retention_months=None, action=None, today=None):
+    """
+    Detach (or drop) the monthly partitions older than the last
+    `retention_months` full months. 0 keeps every partition.
+
+    Returns:
+        list: Names of the detached partitions
+    """
+    if retention_months is None:
+        retention_months = settings.NEWS_ARTICLE_RETENTION_MONTHS
+    if action is None:
+        action = settings.NEWS_ARTICLE_RETENTION_ACTION
+    if action not in (DETACH, DROP):
+        raise ValueError(f"Unknown NEWS_ARTICLE_RETENTION_ACTION {action!r}")
+    if retention_months <= 0:
+        return []
+    cutoff = add_months(month_start(today or datetime.now(timezone.utc)), -retention_months)
+    return [
+        detach_partition(month, action)
+        for month in attached_partitions()
+        if month < cutoff
+    ]
+
+
+@pin_to_primary()
+def maintain_partitions(today=None):
+    """
+    Periodic partition maintenance: create upcoming months, then apply retention.
+
+    Returns:
+        dict: {'partitioned': bool, 'created': [names], 'detached': [names]}
+    """
+    if not is_partitioned():
+        return {'partitioned': False, 'created': [], 'detached': []}
+    created = ensure_partitions(today=today)
+    detached = apply_retention(today=today)
+    return {'partitioned': True, 'created': created, 'detached': detached}
@@ -0,0 +1,58 @@
+from .models import Category, Language, Country
+
+# Reference models are seeded by migrations and never change at runtime,
+# so their tables are loaded once per process.
+REFERENCE_KEY_FIELDS = {
+    Category: 'name',
+    Language: 'code',
+    Country: 'code',
+}
+
+_tables = {}
+
+
+def _build_table(model, rows):
+    key_field = REFERENCE_KEY_FIELDS[model]
+    choices = dict(model._meta.get_field(key_field).choices)
+    table = {'ids': {}, 'keys': {}, 'names': {}}
+    for pk, key in rows:
+        display = choices.get(key, key)
+        table['ids'][key.lower()] = pk
+        table['ids'][display.lower()] = pk
+        table['keys'][pk] = key
+        table['names'][pk] = display
+    return table
+
+
+def reference_table(model):
+    """
+    Lookup table for a reference model.
+    
+    Returns:
+        dict: {'ids': {lowercased code or display name: pk},
+               'keys': {pk: code or name}, 'names': {pk: display name}}
+    """
+    table = _tables.get(model)
+    if table is None:
+        rows = model.objects.values_list('pk', REFERENCE_KEY_FIELDS[model])
+        table = _tables[model] = _build_table(model, rows)
+    return table
+
+
+async def areference_table(model):
+    """reference_table() for async code: the first load goes through the async ORM."""
+    table = _tables.get(model)
+    if table is None:
+        rows = [row async for row in model.objects.values_list('pk', REFERENCE_KEY_FIELDS[model])]
+        table = _tables[model] = _build_table(model, rows)
+    return table
+
+
+def resolve_reference(model, value):
+    """Primary key of the reference row matching a code or display name, or None."""
+    return reference_table(model)['ids'].get(value.strip().lower())
+
+
+def clear_reference_tables():
+    """Forget the loaded tables (e.g. after reference data changes in tests)."""
+    _tables.clear()
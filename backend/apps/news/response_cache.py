@@ -0,0 +1,165 @@
+import hashlib
+import time
+from datetime import datetime, timezone
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from ..news_api_quota import PROCESS_LOCAL_CACHES
+
+# Data namespaces whose version stamps are bumped by ingestion (articles,
+# sources) or by migrations (reference tables).
+ARTICLES = 'articles'
+SOURCES = 'sources'
+REFERENCES = 'references'
+
+KEY_PREFIX = 'news:response'
+
+
+def _cache():
+    return caches[settings.NEWS_RESPONSE_CACHE]
+
+
+def is_shared():
+    """
+    Whether version stamps are shared by every process. Ingestion bumps them
+    from Celery workers, so with a process-local backend (LocMem, the fallback
+    when REDIS_URL is unset) web processes would never see a bump.
+    """
+    return not isinstance(_cache(), PROCESS_LOCAL_CACHES)
+
+
+def is_enabled():
+    """Whether list responses are cached: a timeout is set and the backend is shared."""
+    return bool(settings.NEWS_RESPONSE_CACHE_TIMEOUT) and is_shared()
+
+
+def get_version(namespace):
+    """
+    Current version stamp of a data namespace.
+
+    Stamps are nanosecond timestamps of the last change, created on first use,
+    so they double as a last-modified time.
+    """
+    key = f"{KEY_PREFIX}:version:{namespace}"
+    cache = _cache()
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump_version(*namespaces):
+    """Give the namespaces a new version stamp, orphaning every response cached under the old one."""
+    cache = _cache()
+    now = time.time_ns()
+    cache.set_many({f"{KEY_PREFIX}:version:{namespace}": now for namespace in namespaces}, timeout=None)
+
+
+def bump_version_on_commit(*namespaces):
+    """
+    Bump the namespaces once the current transaction commits (immediately
+    outside a transaction), so readers never cache rows from before the write.
+    """
+    transaction.on_commit(lambda: bump_version(*namespaces))
+
+
+def versions_settled(namespaces):
+    """
+    Whether replicas have had DATABASE_REPLICA_STICKY_SECONDS to replay the
+    latest change of the namespaces (always true without replicas). Until then a
+    response may have been read from a lagging replica, so it is served but
+    neither cached nor given a validator under the new version.
+    """
+    if not settings.DATABASE_REPLICAS:
+        return True
+    newest = max(get_version(namespace) for namespace in namespaces)
+    return time.time_ns() - newest >= settings.DATABASE_REPLICA_STICKY_SECONDS * 1_000_000_000
+
+
+def version_etag(namespaces):
+    """ETag for a response reading the namespaces: their joined version stamps."""
+    return '-'.join(str(get_version(namespace)) for namespace in namespaces)
+
+
+def version_last_modified(namespaces):
+    """Last-Modified for a response reading the namespaces: their newest stamp."""
+    return datetime.fromtimestamp(max(get_version(namespace) for namespace in namespaces) / 1e9, tz=timezone.utc)
+
+
+def response_cache_key(request, namespaces):
+    """
+    Key for a cached response: path and normalized query parameters (sorted,
+    blanks dropped) under the current versions of the namespaces it reads.
+    """
+    params = sorted(
+        (key, value)
+        for key, values in request.query_params.lists()
+        for value in values
+        if value.strip()
+    )
+    raw = repr((request.get_host(), request.path, params))
+    digest = hashlib.md5(raw.encode()).hexdigest()
+    versions = '.'.join(str(get_version(namespace)) for namespace in namespaces)
+    return f"{KEY_PREFIX}:{versions}:{digest}"
+
+
+def get_cached_response(key):
+    """Cached response data for the key, or None. Counts the hit or miss."""
+    cache = _cache()
+    data = cache.get(key)
+    _incr('hits' if data is not None else 'misses')
+    return data
+
+
+def set_cached_response(key, data):
+    _cache().set(key, data, settings.NEWS_RESPONSE_CACHE_TIMEOUT)
+
+
+def get_cached_count(signature):
+    """
+    Cached article count of a filter signature.
+
+    Returns:
+        tuple: (count or None, whether it may be stale: counted under an older
+        article version, or with version stamps no other process bumps)
+    """
+    entry = _cache().get(f"{KEY_PREFIX}:count:{signature}")
+    if entry is None:
+        return None, False
+    version, count = entry
+    return count, version != get_version(ARTICLES) or not is_shared()
+
+
+def set_cached_count(signature, version, count):
+    """Cache a count taken under the given article version for NEWS_ARTICLE_COUNT_CACHE_TIMEOUT seconds."""
+    _cache().set(f"{KEY_PREFIX}:count:{signature}", (version, count), settings.NEWS_ARTICLE_COUNT_CACHE_TIMEOUT)
+
+
+def _incr(counter):
+    key = f"{KEY_PREFIX}:stats:{counter}"
+    cache = _cache()
+    cache.add(key, 0, timeout=None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # The key was evicted between add() and incr()
+        cache.add(key, 1, timeout=None)
+
+
+def cache_stats():
+    """
+    Hit/miss counters of the response cache.
+
+    Returns:
+        dict: {'hits': int, 'misses': int, 'hit_ratio': float, 'versions': {namespace: stamp}}
+    """
+    counters = _cache().get_many([f"{KEY_PREFIX}:stats:hits", f"{KEY_PREFIX}:stats:misses"])
+    hits = counters.get(f"{KEY_PREFIX}:stats:hits", 0)
+    misses = counters.get(f"{KEY_PREFIX}:stats:misses", 0)
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_ratio': round(hits / (hits + misses), 4) if hits + misses else 0.0,
+        'versions': {namespace: get_version(namespace) for namespace in (ARTICLES, SOURCES, REFERENCES)},
+    }
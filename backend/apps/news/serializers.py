@@ -2,6 +2,7 @@
 
 from rest_framework import serializers
 from .models import NewsArticle, Source, Category, Language, Country
+from .references import reference_table
 
 
 class BaseChoiceSerializer(serializers.ModelSerializer):
@@ -57,7 +58,18 @@ class SourceSerializer(serializers.ModelSerializer):
         ]
 
 
-class NewsArticleListSerializer(serializers.ModelSerializer):
+class DynamicFieldsMixin:
+    """Keep only the fields listed in the `fields` serializer context entry, when present."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        fields = self.context.get('fields')
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+
+class NewsArticleListSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """Lightweight serializer for list views"""
     source = SourceMinimalSerializer(read_only=True)
     category_name = serializers.CharField(source='category.get_name_display', read_only=True)
@@ -72,9 +84,102 @@ class NewsArticleListSerializer(serializers.ModelSerializer):
             'country_name', 'language_name', 'created_at'
         ]
 
-
-
-class NewsArticleDetailSerializer(serializers.ModelSerializer):
+    # Output field -> columns it reads, in output order: the list views' only() projection
+    # and the fast list's values() rows. content and search_vector are never read, and the
+    # search annotations (?q=) read no column.
+    field_columns = {
+        'id': ['id'],
+        'title': ['title'],
+        # Archived descriptions are read back from cold storage (apps.news.archive)
+        'description': ['description', 'body_archived'],
+        'url': ['url'],
+        'image_url': ['image_url'],
+        'published_at': ['published_at'],
+        'source': ['source_id', 'source__source_id', 'source__name'],
+        'category_name': ['category_id'],
+        'country_name': ['country_id'],
+        'language_name': ['language_id'],
+        'created_at': ['created_at'],
+        'search_rank': [],
+        'search_headline': [],
+    }
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        # Present only on full-text search results (?q=)
+        fields = self.context.get('fields')
+        for name in ('search_rank', 'search_headline'):
+            if hasattr(instance, name) and (fields is None or name in fields):
+                data[name] = getattr(instance, name)
+        return data
+
+
+class NewsArticleListRowSerializer:
+    """
+    Fast equivalent of NewsArticleListSerializer(many=True) for values() rows.
+
+    Reads only the columns of the requested fields (joining the source alone),
+    resolves reference names from the in-memory tables and skips the per-field
+    machinery, while producing the same JSON, including the omitted *_name
+    keys when a reference is missing.
+    """
+    field_columns = NewsArticleListSerializer.field_columns
+    datetime_fields = {'published_at', 'created_at'}
+    search_fields = {'search_rank', 'search_headline'}
+
+    def __init__(self, rows, fields=None):
+        self.rows = rows
+        self.fields = list(fields or self.field_columns)
+
+    @classmethod
+    def values(cls, queryset, fields=None, extra_columns=()):
+        """
+        Turn an article queryset into the values() rows this serializer reads.
+
+        Args:
+            fields (list): Output fields to read (all by default)
+            extra_columns (iterable): Columns needed besides the output, e.g. for keyset pagination
+        """
+        annotations = queryset.query.annotations
+        columns = ['id', *extra_columns]
+        for field in fields or cls.field_columns:
+            columns.extend(cls.field_columns[field])
+            if field in cls.search_fields and field in annotations:
+                columns.append(field)
+        return queryset.values(*dict.fromkeys(columns))
+
+    @property
+    def data(self):
+        format_datetime = serializers.DateTimeField().to_representation
+        names = {
+            'category_name': ('category_id', reference_table(Category)['names']),
+            'country_name': ('country_id', reference_table(Country)['names']),
+            'language_name': ('language_id', reference_table(Language)['names']),
+        }
+        results = []
+        for row in self.rows:
+            data = {}
+            for field in self.fields:
+                if field in self.datetime_fields:
+                    data[field] = format_datetime(row[field])
+                elif field == 'source':
+                    data['source'] = {
+                        'id': row['source_id'],
+                        'source_id': row['source__source_id'],
+                        'name': row['source__name'],
+                    } if row['source_id'] is not None else None
+                elif field in names:
+                    column, table = names[field]
+                    if row[column] is not None:
+                        data[field] = table[row[column]]
+                elif field in row:
+                    # Search annotations are only present on ?q= results
+                    data[field] = row[field]
+            results.append(data)
+        return results
+
+
+class NewsArticleDetailSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """Detailed serializer for single article"""
     source = SourceSerializer(read_only=True)
     category = CategorySerializer(read_only=True)
@@ -88,3 +193,19 @@ class NewsArticleDetailSerializer(serializers.ModelSerializer):
             'published_at', 'source', 'category', 'language',
             'country', 'created_at'
         ]
+
+    # Output field -> columns it reads, in output order, for the detail view's only() projection
+    field_columns = {
+        **{
+            name: NewsArticleListSerializer.field_columns[name]
+            for name in ('id', 'title', 'description', 'url', 'image_url', 'published_at')
+        },
+        'source': [
+            'source_id', 'source__source_id', 'source__name', 'source__description', 'source__url',
+            'source__category__name', 'source__language__code', 'source__country__code',
+        ],
+        'category': ['category_id'],
+        'language': ['language_id'],
+        'country': ['country_id'],
+        'created_at': NewsArticleListSerializer.field_columns['created_at'],
+    }
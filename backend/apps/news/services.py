@@ -1,126 +1,453 @@
-from ..fetch_news import fetch_sources, fetch_top_headlines
-from .models import Source, Category, Language, Country, NewsArticle
-from django.db import transaction
+from ..fetch_news import fetch_sources, iter_top_headlines, iter_query_batches, dedupe_batches
+from .models import Source, Category, Language, Country, NewsArticle, ArchivedArticleBody, ArticleUrl
+from .response_cache import ARTICLES, SOURCES, bump_version_on_commit
+from .facets import FACET_COLUMNS, apply_facet_deltas, facet_key
+from collections import Counter
+from django.db import IntegrityError, transaction
+from config.db_router import pin_to_primary
 from datetime import datetime
 
+TITLE_MAX_LENGTH = NewsArticle._meta.get_field('title').max_length
+URL_MAX_LENGTH = NewsArticle._meta.get_field('url').max_length
+IMAGE_URL_MAX_LENGTH = NewsArticle._meta.get_field('image_url').max_length
+
+
+# Source columns compared against the feed on every sync.
+SOURCE_SYNC_FIELDS = [
+    'name', 'description', 'url', 'category_id', 'language_id', 'country_id', 'is_active',
+]
+
+
+@pin_to_primary()
+def sync_sources(sources, retire_missing=False):
+    """
+    Synchronise Source rows with a NewsAPI sources payload, keyed on source_id.
+    
+    New sources are bulk inserted and existing ones are bulk updated only when a
+    field actually changed. Nothing is deleted, so article -> source links survive.
     
-def save_sources_to_db() -> None:
+    Args:
+        sources (list): Raw source dictionaries from NewsAPI
+        retire_missing (bool): Mark sources absent from the payload as inactive
+    
+    Returns:
+        dict: {'inserted': int, 'updated': int, 'retired': int}
     """
-    Fetches news sources from an external API and saves them to the database.
+    categories = dict(Category.objects.values_list('name', 'id'))
+    languages = dict(Language.objects.values_list('code', 'id'))
+    countries = dict(Country.objects.values_list('code', 'id'))
+
+    incoming = {}
+    for source in sources:
+        source_id = source.get('id')
+        if not source_id:
+            continue
+        incoming[source_id] = {
+            'name': source.get('name', ''),
+            'description': source.get('description', ''),
+            'url': source.get('url', ''),
+            'category_id': categories.get(source.get('category')),
+            'language_id': languages.get(source.get('language')),
+            'country_id': countries.get(source.get('country')),
+            'is_active': True,
+        }
+
+    existing = {source.source_id: source for source in Source.objects.all()}
+
+    to_create = []
+    to_update = []
+    changed_fields = set()
+    for source_id, values in incoming.items():
+        source = existing.get(source_id)
+        if source is None:
+            to_create.append(Source(source_id=source_id, **values))
+            continue
+
+        changed = [field for field in SOURCE_SYNC_FIELDS if getattr(source, field) != values[field]]
+        if changed:
+            for field in changed:
+                setattr(source, field, values[field])
+            changed_fields.update(changed)
+            to_update.append(source)
+
+    with transaction.atomic():
+        if to_create:
+            Source.objects.bulk_create(to_create)
+        if to_update:
+            Source.objects.bulk_update(to_update, sorted(changed_fields))
+
+        retired_count = 0
+        if retire_missing:
+            retired_count = Source.objects.filter(is_active=True).exclude(
+                source_id__in=list(incoming)
+            ).update(is_active=False)
+
+        if to_create or to_update or retired_count:
+            bump_version_on_commit(SOURCES)
+
+    return {'inserted': len(to_create), 'updated': len(to_update), 'retired': retired_count}
+
+
+@pin_to_primary()
+def save_sources_to_db(retire_missing=False):
+    """
+    Fetches news sources from an external API and syncs them into the database.
+    
+    Args:
+        retire_missing (bool): Mark sources no longer returned by NewsAPI as inactive
+    
+    Returns:
+        dict: {'inserted': int, 'updated': int, 'retired': int} or None on failure
     """
     try:
-        with transaction.atomic():
-            sources = fetch_sources()
-            if not sources:
-                return
-            
-            # delete all the existing sources
-            Source.objects.all().delete()
-
-            for source in sources:
-                source_id = source.get('id')
-                if not source_id:
-                    continue
-                
-                source = Source.objects.create(
-                    source_id=source_id, 
-                    name=source.get('name', ''),
-                    description=source.get('description', ''),
-                    url=source.get('url', ''),
-                    category=Category.objects.filter(name=source.get('category')).first(),
-                    language=Language.objects.filter(code=source.get('language')).first(),
-                    country=Country.objects.filter(code=source.get('country')).first(),
-                )
-                source.save()   
-            
+        sources = fetch_sources()
+        if not sources:
+            # An empty payload usually means the fetch failed; never retire on it.
+            return {'inserted': 0, 'updated': 0, 'retired': 0}
+
+        summary = sync_sources(sources, retire_missing=retire_missing)
+        print(f"Successfully synced sources - Inserted: {summary['inserted']}, "
+              f"Updated: {summary['updated']}, Retired: {summary['retired']}")
+        return summary
+
     except Exception as e:
         print(f"Error saving sources: {e}")
         return
 
 
+ARTICLE_BATCH_SIZE = 500
+# Attempts at registering new URLs while concurrent writers register some of them too
+URL_CLAIM_ATTEMPTS = 3
+
+# Columns refreshed when an incoming article collides with an existing URL.
+# published_at is part of the conflict key (url, published_at), see bulk_upsert_articles().
+# body_archived is reset: the fresh description and content live in the row again.
+ARTICLE_UPDATE_FIELDS = [
+    'title', 'description', 'content', 'image_url',
+    'source', 'category', 'language', 'country', 'body_archived',
+]
+# Fields NewsAPI may leave out (None on a built article): stored as '' for a new
+# article, left as they are on a stored one
+OPTIONAL_ARTICLE_FIELDS = ['description', 'content', 'image_url']
+ARTICLE_BODY_FIELDS = {'description', 'content'}
+
+
+def _build_sources_map():
+    """
+    Load every source once and index it by name.
+    
+    Returns:
+        dict: {source_name: Source}, preferring active sources for duplicated names
+    """
+    sources_by_name = {}
+    for source in Source.objects.only(
+        'id', 'name', 'category_id', 'language_id', 'country_id'
+    ).order_by('-is_active', 'pk'):
+        sources_by_name.setdefault(source.name, source)
+    return sources_by_name
+
+
+def _parse_published_at(value):
+    """Parse a NewsAPI ISO-8601 timestamp, returning None when invalid."""
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+
+
+def _build_article(article_data, sources_by_name):
+    """
+    Validate a raw NewsAPI article and build an unsaved NewsArticle.
+    
+    Denormalized fields are copied from the source here because
+    bulk_create() bypasses NewsArticle.save(). Missing OPTIONAL_ARTICLE_FIELDS
+    are None, and the source is None when its name is unknown; see
+    _update_fields().
+    
+    Returns:
+        NewsArticle or None if the row is invalid
+    """
+    url = article_data.get('url')
+    title = article_data.get('title')
+    if not url or not title or len(url) > URL_MAX_LENGTH:
+        return None
+
+    published_at = _parse_published_at(article_data.get('publishedAt'))
+    if published_at is None:
+        return None
+
+    image_url = article_data.get('urlToImage') or None
+    if image_url and len(image_url) > IMAGE_URL_MAX_LENGTH:
+        image_url = None
+
+    source = sources_by_name.get((article_data.get('source') or {}).get('name'))
+
+    return NewsArticle(
+        url=url,
+        title=title[:TITLE_MAX_LENGTH],
+        description=article_data.get('description'),
+        content=article_data.get('content'),
+        image_url=image_url,
+        published_at=published_at,
+        source=source,
+        category_id=source.category_id if source else None,
+        language_id=source.language_id if source else None,
+        country_id=source.country_id if source else None,
+    )
+
+
+def _update_fields(article, stored):
+    """
+    Fields of a stored article that an incoming one refreshes: the fields it
+    carries. An unknown source keeps the stored source and its denormalized
+    columns. An archived body is only replaced by a complete one, or the
+    archived text of the missing field would be lost.
+
+    Returns:
+        tuple: Field names for bulk_create(update_fields=...)
+    """
+    if article.source_id is None:
+        for column in FACET_COLUMNS.values():
+            setattr(article, column, stored[column])
+    missing = {field for field in OPTIONAL_ARTICLE_FIELDS if getattr(article, field) is None}
+    if stored['body_archived'] and missing & ARTICLE_BODY_FIELDS:
+        missing |= ARTICLE_BODY_FIELDS | {'body_archived'}
+    return tuple(field for field in ARTICLE_UPDATE_FIELDS if field not in missing)
+
+
+def _claim_urls(articles):
+    """
+    Register the articles' URLs in ArticleUrl and lock their rows until the
+    transaction ends, so one writer at a time stores a given URL.
+
+    Rows are locked and inserted in URL order, so writers never deadlock. A URL
+    registered by a concurrent writer while this one inserts it raises
+    IntegrityError once that writer commits; the claim is then retried and
+    waits for its row lock instead.
+
+    Returns:
+        dict: {url: ArticleUrl} for every article, newly registered ones included
+    """
+    articles = sorted(articles, key=lambda article: article.url)
+    for attempt in range(URL_CLAIM_ATTEMPTS):
+        try:
+            with transaction.atomic():
+                claims = {
+                    claim.url: claim
+                    for claim in ArticleUrl.objects.select_for_update().filter(
+                        url__in=[article.url for article in articles]
+                    ).order_by('url')
+                }
+                new = [
+                    ArticleUrl(url=article.url, published_at=article.published_at)
+                    for article in articles if article.url not in claims
+                ]
+                ArticleUrl.objects.bulk_create(new)
+        except IntegrityError:
+            if attempt == URL_CLAIM_ATTEMPTS - 1:
+                raise
+            continue
+        claims.update((claim.url, claim) for claim in new)
+        return claims
+
+
+@pin_to_primary()
+def bulk_upsert_articles(articles, sources_by_name=None, batch_size=ARTICLE_BATCH_SIZE):
+    """
+    Validate raw NewsAPI articles and upsert them in chunks.
+    
+    Concurrent calls writing the same URLs are serialized by ArticleUrl row
+    locks held until commit.
+
+    Each chunk costs five queries (locking and registering its URLs in
+    ArticleUrl, existing article lookup, INSERT ... ON CONFLICT and the facet
+    rollup update) regardless of its size, plus one INSERT per further set of
+    fields its stored articles refresh (see _update_fields()) and one deleting
+    the now stale cold-storage bodies when it re-fetches archived articles.
+    
+    Args:
+        articles (list): Raw article dictionaries from NewsAPI
+        sources_by_name (dict): Optional pre-built {name: Source} map
+        batch_size (int): Number of rows written per INSERT
+    
+    Returns:
+        dict: {'created': int, 'updated': int, 'skipped': int}
+    """
+    if sources_by_name is None:
+        sources_by_name = _build_sources_map()
+
+    # Parse and validate everything first; the last occurrence of a URL wins.
+    built = {}
+    skipped = 0
+    for article_data in articles:
+        article = _build_article(article_data, sources_by_name)
+        if article is None:
+            skipped += 1
+            continue
+        built[article.url] = article
+
+    # Chunks in URL order lock their URLs in one global order (see _claim_urls())
+    rows = sorted(built.values(), key=lambda article: article.url)
+    created_count = 0
+    updated_count = 0
+
+    with transaction.atomic():
+        for start in range(0, len(rows), batch_size):
+            chunk = rows[start:start + batch_size]
+            # The table only keeps (url, published_at) unique: hold the URLs first
+            claims = _claim_urls(chunk)
+            # Stored rows: their facet dimensions, to move their rollup counts on
+            # update, and their published_at, which keeps an article in its
+            # partition and makes (url, published_at) conflict when NewsAPI
+            # reports a different time for it. Read under the URL locks, so no
+            # concurrent writer can store or change these articles before the
+            # upsert: the created / updated split and the facet deltas below are
+            # exactly what it does.
+            existing = {}
+            for row in NewsArticle.objects.filter(
+                url__in=[article.url for article in chunk]
+            ).values('id', 'url', 'published_at', 'body_archived', *FACET_COLUMNS.values()):
+                existing[row['url']] = row
+            moved = []
+            updates = {}
+            for article in chunk:
+                stored = existing.get(article.url)
+                if stored:
+                    article.published_at = stored['published_at']
+                    update_fields = _update_fields(article, stored)
+                else:
+                    for field in OPTIONAL_ARTICLE_FIELDS:
+                        if getattr(article, field) is None:
+                            setattr(article, field, '')
+                    update_fields = tuple(ARTICLE_UPDATE_FIELDS)
+                updates.setdefault(update_fields, []).append(article)
+                # A URL registered without its article (stored before ArticleUrl, or deleted since)
+                claim = claims[article.url]
+                if claim.published_at != article.published_at:
+                    claim.published_at = article.published_at
+                    moved.append(claim)
+            if moved:
+                ArticleUrl.objects.bulk_update(moved, ['published_at'])
+            for update_fields, articles_to_write in updates.items():
+                NewsArticle.objects.bulk_create(
+                    articles_to_write,
+                    update_conflicts=True,
+                    unique_fields=['url', 'published_at'],
+                    update_fields=list(update_fields),
+                )
+            deltas = Counter()
+            for article in chunk:
+                if article.url in existing:
+                    deltas[facet_key(existing[article.url])] -= 1
+                deltas[facet_key(article)] += 1
+            apply_facet_deltas(deltas)
+            # Archived bodies replaced by the fresh text in the row
+            unarchived = [
+                existing[article.url]['id']
+                for update_fields, written in updates.items() if 'body_archived' in update_fields
+                for article in written
+                if article.url in existing and existing[article.url]['body_archived']
+            ]
+            if unarchived:
+                ArchivedArticleBody.objects.filter(article_id__in=unarchived).delete()
+            updated_count += len(existing)
+            created_count += len(chunk) - len(existing)
+
+        if rows:
+            bump_version_on_commit(ARTICLES)
+
+    return {'created': created_count, 'updated': updated_count, 'skipped': skipped}
+
+
+@pin_to_primary()
 def save_top_headlines_to_db(countries=None, categories=None, sources=None, sample_countries=None, sample_categories=None):
     """
     Fetches top headlines from NewsAPI and saves them to the database.
     
+    Batches are streamed from iter_top_headlines() and written as soon as each
+    query returns, so memory stays bounded by a single batch.
+    
     Args:
         countries (list): Specific country codes (e.g., ['us', 'fr'])
         categories (list): Specific category names (e.g., ['business', 'technology'])
         sources (list): Specific source IDs (e.g., ['bbc-news'])
         sample_countries (int): Randomly sample N countries (e.g., 4)
         sample_categories (int): Randomly sample N categories (e.g., 20)
+    
+    Returns:
+        dict: {'created': int, 'updated': int, 'skipped': int, 'errors': int, 'calls': int}
+        or None on failure
     """
     try:
-        # Fetch headlines using the specified filters
-        result = fetch_top_headlines(
+        batches = iter_top_headlines(
             countries=countries,
             categories=categories,
             sources=sources,
             sample_countries=sample_countries,
             sample_categories=sample_categories
         )
-        
-        articles = result.get('articles', [])
-        
-        if not articles:
-            print("No articles fetched from NewsAPI")
-            return
-        
-        created_count = 0
-        updated_count = 0
-        
-        with transaction.atomic():
-            for article_data in articles:
-                try:
-                    # Skip articles without required fields
-                    if not article_data.get('url') or not article_data.get('title'):
-                        continue
-                    
-                    # Try to get the source
-                    source = None
-                    source_name = article_data.get('source', {}).get('name')
-                    if source_name:
-                        source = Source.objects.filter(name=source_name).first()
-                    
-                    # Parse published date
-                    published_at = article_data.get('publishedAt')
-                    if published_at and isinstance(published_at, str):
-                        try:
-                            published_at = datetime.fromisoformat(published_at.replace('Z', '+00:00'))
-                        except:
-                            continue
-                    else:
-                        continue
-                    
-                    # Create or update the article
-                    article, created = NewsArticle.objects.get_or_create(
-                        url=article_data.get('url'),
-                        defaults={
-                            'title': article_data.get('title', ''),
-                            'description': article_data.get('description', ''),
-                            'content': article_data.get('content', ''),
-                            'image_url': article_data.get('urlToImage', ''),
-                            'published_at': published_at,
-                            'source': source,
-                        }
-                    )
-                    
-                    if created:
-                        # Auto-populate denormalized fields from source
-                        if source:
-                            article.category = source.category
-                            article.language = source.language
-                            article.country = source.country
-                            article.save()
-                        created_count += 1
-                    else:
-                        updated_count += 1
-                
-                except Exception as e:
-                    print(f"Error saving article: {e}")
-                    continue
-        
-        print(f"Successfully saved articles - Created: {created_count}, Updated: {updated_count}")
+        summary = persist_article_batches(batches)
+        print(f"Successfully saved articles - Created: {summary['created']}, "
+              f"Updated: {summary['updated']}, Skipped: {summary['skipped']}, "
+              f"Failed queries: {summary['errors']}, NewsAPI calls: {summary['calls']}")
+        return summary
         
     except Exception as e:
         print(f"Error in save_top_headlines_to_db: {e}")
-        return
\ No newline at end of file
+        return
+
+
+@pin_to_primary()
+def persist_article_batches(batches, sources_by_name=None):
+    """
+    Upsert each (articles, timing) batch as it arrives.
+    
+    Args:
+        batches (iterable): (articles, timing) pairs from iter_top_headlines()
+        sources_by_name (dict): Optional pre-built {name: Source} map
+    
+    Returns:
+        dict: {'created': int, 'updated': int, 'skipped': int, 'errors': int, 'calls': int}
+    """
+    if sources_by_name is None:
+        sources_by_name = _build_sources_map()
+
+    summary = {'created': 0, 'updated': 0, 'skipped': 0, 'errors': 0, 'calls': 0}
+    for articles, timing in batches:
+        summary['calls'] += timing.get('attempts', 0)
+        if timing.get('error'):
+            summary['errors'] += 1
+        if not articles:
+            continue
+        batch_summary = bulk_upsert_articles(articles, sources_by_name=sources_by_name)
+        for key, value in batch_summary.items():
+            summary[key] += value
+    return summary
+
+
+@pin_to_primary()
+def save_headline_queries_to_db(query_combinations):
+    """
+    Fetches and saves an explicit list of NewsAPI queries (one fan-out slice).
+    
+    Args:
+        query_combinations (list): Query parameter dictionaries
+    
+    Returns:
+        dict: persist_article_batches() summary plus 'failed', the params of
+        queries that errored so they can be retried on their own
+    """
+    failed = []
+
+    def track_failures(batches):
+        for articles, timing in batches:
+            if timing.get('error'):
+                failed.append(timing['params'])
+            yield articles, timing
+
+    batches = dedupe_batches(iter_query_batches(query_combinations))
+    summary = persist_article_batches(track_failures(batches))
+    summary['failed'] = failed
+    return summary
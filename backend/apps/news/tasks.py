@@ -1,5 +1,7 @@
-from celery import shared_task
+from celery import shared_task, chord
 from celery.utils.log import get_task_logger
+from django.conf import settings
+from ..news_api_quota import get_quota_ledger
 
 logger = get_task_logger(__name__)
 
@@ -9,23 +11,87 @@ def fetch_sources_task():
     from .services import save_sources_to_db
 
     logger.info("Starting fetch_sources_task...")
-    save_sources_to_db()
-    logger.info("Completed fetch_sources_task.")
+    save_sources_to_db(retire_missing=True)
+    logger.info(f"Completed fetch_sources_task. NewsAPI budget: {get_quota_ledger().snapshot()}")
 
 
 
 @shared_task
-def fetch_latest_news_task():
+def fetch_latest_news_task(fan_out=None):
     from .services import save_top_headlines_to_db
+    from ..fetch_news import resolve_query_combinations
 
     logger.info("Starting fetch_latest_news_task...")
-    
+
+    if fan_out is None:
+        fan_out = settings.NEWS_INGEST_FAN_OUT
+
+    if fan_out:
+        # Split the sampled combinations into slices handled by separate workers
+        query_combinations = resolve_query_combinations(sample_countries=4, sample_categories=10)
+        slice_size = settings.NEWS_INGEST_SLICE_SIZE
+        slices = [
+            query_combinations[start:start + slice_size]
+            for start in range(0, len(query_combinations), slice_size)
+        ]
+        if not slices:
+            logger.info("No query combinations to ingest.")
+            return
+        logger.info(f"Fanning out {len(query_combinations)} queries into {len(slices)} subtasks.")
+        chord(ingest_headlines_slice_task.s(chunk) for chunk in slices)(aggregate_ingestion_results.s())
+        return
+
     # Sample 4 countries and 20 categories
-    save_top_headlines_to_db(sample_countries=4, sample_categories=10)
+    summary = save_top_headlines_to_db(sample_countries=4, sample_categories=10)
 
     # # other examples of usage:
     # save_top_headlines_to_db(countries=['us', 'fr'], categories=['business', 'technology'])
     # save_top_headlines_to_db(sample_countries=5, categories=['sports', 'health'])
     # save_top_headlines_to_db(sources=['bbc-news', 'cnn'])
 
-    logger.info("Completed fetch_latest_news_task.")
\ No newline at end of file
+    logger.info(f"Completed fetch_latest_news_task - {summary}. NewsAPI budget: {get_quota_ledger().snapshot()}")
+    return summary
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+def ingest_headlines_slice_task(self, query_combinations, carry=None):
+    """
+    Fetch and upsert one slice of query combinations.
+    Failed queries are retried on their own; counts from earlier attempts are
+    carried over so the final result covers the whole slice.
+    """
+    from .services import save_headline_queries_to_db
+
+    summary = save_headline_queries_to_db(query_combinations)
+    failed = summary.pop('failed')
+    if carry:
+        for key in ('created', 'updated', 'skipped', 'calls'):
+            summary[key] += carry[key]
+
+    if failed and self.request.retries < self.max_retries:
+        logger.warning(f"{len(failed)} queries failed in slice, retrying them.")
+        raise self.retry(args=[failed], kwargs={'carry': summary})
+
+    summary['errors'] = len(failed)
+    return summary
+
+
+@shared_task
+def aggregate_ingestion_results(results):
+    """Chord callback summing the per-slice ingestion summaries."""
+    totals = {'slices': len(results), 'created': 0, 'updated': 0, 'skipped': 0, 'errors': 0, 'calls': 0}
+    for result in results:
+        for key in ('created', 'updated', 'skipped', 'errors', 'calls'):
+            totals[key] += result.get(key, 0)
+
+    logger.info(f"Completed fan-out ingestion - {totals}. NewsAPI budget: {get_quota_ledger().snapshot()}")
+    return totals
+
+
+@shared_task
+def maintain_article_partitions_task():
+    from .partitions import maintain_partitions
+
+    result = maintain_partitions()
+    logger.info(f"Completed maintain_article_partitions_task - {result}")
+    return result
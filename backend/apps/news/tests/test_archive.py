@@ -0,0 +1,116 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+from asgiref.sync import sync_to_async
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from apps.news.archive import archive_batch, arestore_articles, restore_articles
+from apps.news.models import ArchivedArticleBody, NewsArticle, Source
+from apps.news.services import bulk_upsert_articles
+
+OLD = datetime(2025, 1, 1, tzinfo=timezone.utc)
+CUTOFF = OLD + timedelta(days=30)
+
+
+class ArchiveTests(TestCase):
+
+    def setUp(self):
+        self.source = Source.objects.create(source_id='example', name='Example')
+        self.old = [
+            NewsArticle.objects.create(
+                source=self.source, title=f'Old {i}', url=f'https://example.com/old/{i}',
+                description=f'Summary {i}', content=f'Body {i}', published_at=OLD + timedelta(hours=i),
+            )
+            for i in range(3)
+        ]
+        self.recent = NewsArticle.objects.create(
+            source=self.source, title='Recent', url='https://example.com/recent',
+            description='Recent summary', content='Recent body', published_at=CUTOFF,
+        )
+
+    def test_archive_batch_moves_the_oldest_bodies(self):
+        summary = archive_batch(CUTOFF, batch_size=2)
+        self.assertEqual(summary['archived'], 2)
+        self.assertEqual(summary['raw_bytes'], len('Summary 0Body 0Summary 1Body 1'))
+        self.assertEqual(
+            list(NewsArticle.objects.filter(body_archived=True).order_by('id').values_list('title', 'description', 'content')),
+            [('Old 0', None, None), ('Old 1', None, None)],
+        )
+        # The next batch resumes after the archived rows and leaves recent articles alone
+        self.assertEqual(archive_batch(CUTOFF, batch_size=2)['archived'], 1)
+        self.assertEqual(archive_batch(CUTOFF, batch_size=2)['archived'], 0)
+        self.assertEqual(ArchivedArticleBody.objects.count(), 3)
+        self.assertFalse(NewsArticle.objects.get(pk=self.recent.pk).body_archived)
+
+    def test_restore_articles(self):
+        archive_batch(CUTOFF, batch_size=10)
+        rows = list(NewsArticle.objects.order_by('id').values('id', 'description', 'body_archived'))
+        instances = list(NewsArticle.objects.order_by('id'))
+        with self.assertNumQueries(1):
+            restore_articles(rows, ('description',))
+        with self.assertNumQueries(1):
+            restore_articles(instances)
+        self.assertEqual([row['description'] for row in rows], ['Summary 0', 'Summary 1', 'Summary 2', 'Recent summary'])
+        self.assertEqual([article.content for article in instances], ['Body 0', 'Body 1', 'Body 2', 'Recent body'])
+        self.assertFalse(any(article.body_archived for article in instances))
+        with self.assertNumQueries(0):
+            restore_articles(instances)
+
+    async def test_arestore_articles(self):
+        await sync_to_async(archive_batch)(CUTOFF, batch_size=10)
+        rows = [row async for row in NewsArticle.objects.order_by('id').values('id', 'description', 'body_archived')]
+        await arestore_articles(rows, ('description',))
+        self.assertEqual([row['description'] for row in rows], ['Summary 0', 'Summary 1', 'Summary 2', 'Recent summary'])
+        self.assertFalse(any(row['body_archived'] for row in rows))
+
+    def test_reingesting_an_archived_url_stores_the_fresh_body(self):
+        archive_batch(CUTOFF, batch_size=10)
+        raw = {
+            'url': self.old[0].url, 'title': 'Old 0', 'publishedAt': '2025-01-01T00:00:00Z',
+            'source': {'name': 'Example'},
+        }
+        # Without the description and content, the article stays archived
+        bulk_upsert_articles([raw])
+        self.assertTrue(NewsArticle.objects.get(pk=self.old[0].pk).body_archived)
+        self.assertTrue(ArchivedArticleBody.objects.filter(article_id=self.old[0].pk).exists())
+
+        bulk_upsert_articles([{**raw, 'description': 'Fresh summary', 'content': 'Fresh body'}])
+        article = NewsArticle.objects.get(pk=self.old[0].pk)
+        self.assertEqual((article.body_archived, article.description, article.content), (False, 'Fresh summary', 'Fresh body'))
+        self.assertFalse(ArchivedArticleBody.objects.filter(article_id=self.old[0].pk).exists())
+
+
+@override_settings(NEWS_RESPONSE_CACHE_TIMEOUT=0)
+class ArchivedArticleEndpointTests(TestCase):
+    """Archived descriptions are served as if they had never left the article row."""
+
+    @classmethod
+    def setUpTestData(cls):
+        source = Source.objects.create(source_id='example', name='Example')
+        cls.article = NewsArticle.objects.create(
+            source=source, title='Old', url='https://example.com/old', description='Summary', content='Body',
+            published_at=OLD,
+        )
+        archive_batch(CUTOFF, batch_size=10)
+
+    def test_list(self):
+        for fast_list in (False, True):
+            with self.subTest(fast_list=fast_list), override_settings(NEWS_ARTICLE_FAST_LIST=fast_list):
+                response = self.client.get(reverse('newsarticle-list'), {'fields': 'title,description'})
+                self.assertEqual(response.json()['results'], [{'title': 'Old', 'description': 'Summary'}])
+
+    def test_detail(self):
+        response = self.client.get(reverse('newsarticle-detail', args=[self.article.pk]))
+        self.assertEqual(response.json()['description'], 'Summary')
+
+    def test_export(self):
+        response = self.client.get(reverse('newsarticle-export'), {'fields': 'description'})
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual([json.loads(line) for line in lines], [{'id': self.article.pk, 'description': 'Summary'}])
+
+    async def test_async_list_and_detail(self):
+        response = await self.async_client.get(reverse('async-newsarticle-list'), {'fields': 'description'})
+        self.assertEqual(response.json()['results'], [{'description': 'Summary'}])
+        response = await self.async_client.get(reverse('async-newsarticle-detail', args=[self.article.pk]))
+        self.assertEqual(response.json()['description'], 'Summary')
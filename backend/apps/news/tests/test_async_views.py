@@ -0,0 +1,82 @@
+import tempfile
+from contextlib import contextmanager
+
+from asgiref.sync import async_to_sync
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from apps.news.models import Category, Country, Language, NewsArticle, Source
+
+
+class AsyncViewParityTests(TestCase):
+    """The async views answer with the same bytes and caching headers as their sync views."""
+
+    @classmethod
+    def setUpTestData(cls):
+        category = Category.objects.get(name='business')
+        country = Country.objects.get(code='us')
+        language = Language.objects.get(code='en')
+        source = Source.objects.create(
+            source_id='example', name='Example', description='News', url='https://example.com',
+            category=category, country=country, language=language,
+        )
+        Source.objects.create(source_id='retired', name='Retired', is_active=False)
+        cls.articles = NewsArticle.objects.bulk_create(
+            NewsArticle(source=source, category=category, country=country, language=language,
+                        title=f'Headline {i}', description=f'Summary {i}', url=f'https://example.com/{i}',
+                        published_at=f'2026-01-0{i + 1}T00:00:00Z')
+            for i in range(3)
+        )
+
+    def assertSameResponse(self, name, *args, params=None, headers=None):
+        sync = self.client.get(reverse(name, args=args), params, headers=headers)
+        asynchronous = async_to_sync(self.async_client.get)(reverse(f'async-{name}', args=args), params, headers=headers)
+        self.assertEqual(asynchronous.status_code, sync.status_code)
+        # Pagination links point back at the endpoint that served the page
+        self.assertEqual(asynchronous.content.replace(b'/async/', b'/'), sync.content)
+        for header in ('Cache-Control', 'ETag', 'Last-Modified', 'X-Cache'):
+            self.assertEqual(asynchronous.get(header), sync.get(header), header)
+        return asynchronous
+
+    def test_list(self):
+        for params in ({}, {'fields': 'title,source', 'page_size': 2}, {'pagination': 'cursor', 'page_size': 2}):
+            for fast_list in (False, True):
+                with self.subTest(params=params, fast_list=fast_list), \
+                        override_settings(NEWS_ARTICLE_FAST_LIST=fast_list, NEWS_RESPONSE_CACHE_TIMEOUT=0):
+                    self.assertSameResponse('newsarticle-list', params=params)
+
+    def test_invalid_list_parameters(self):
+        self.assertSameResponse('newsarticle-list', params={'fields': 'nope'})
+
+    def test_detail(self):
+        self.assertSameResponse('newsarticle-detail', self.articles[0].pk)
+        self.assertSameResponse('newsarticle-detail', self.articles[0].pk, params={'exclude': 'source'})
+        self.assertSameResponse('newsarticle-detail', self.articles[-1].pk + 1)
+
+    def test_sources_and_references(self):
+        self.assertEqual([source['source_id'] for source in self.assertSameResponse('source-list').json()], ['example'])
+        for name in ('category-list', 'country-list', 'language-list'):
+            self.assertSameResponse(name)
+
+    @contextmanager
+    def shared_cache(self):
+        with tempfile.TemporaryDirectory() as directory, override_settings(CACHES={'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': directory,
+        }}):
+            yield
+
+    def test_list_from_the_response_cache(self):
+        with self.shared_cache():
+            self.assertEqual(self.assertSameResponse('newsarticle-list')['X-Cache'], 'MISS')
+            self.assertEqual(self.assertSameResponse('newsarticle-list')['X-Cache'], 'HIT')
+
+    def test_conditional_requests_with_a_shared_cache(self):
+        with self.shared_cache():
+            url = reverse('async-newsarticle-detail', args=[self.articles[0].pk])
+            etag = self.assertSameResponse('newsarticle-detail', self.articles[0].pk)['ETag']
+            self.assertTrue(etag)
+            response = async_to_sync(self.async_client.get)(url, headers={'If-None-Match': etag})
+            self.assertEqual(response.status_code, 304)
+            self.assertSameResponse('newsarticle-detail', self.articles[-1].pk + 1, headers={'If-None-Match': etag})
+            self.assertSameResponse('source-list', headers={'If-None-Match': etag})
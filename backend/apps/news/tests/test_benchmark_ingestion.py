@@ -0,0 +1,165 @@
+import gzip
+import io
+import json
+import os
+import tempfile
+from unittest import mock
+from urllib.request import Request, urlopen
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+
+from apps.fetch_news import iter_query_batches
+from apps.news.models import ArticleUrl
+from apps.news_api_client import reset_session
+from apps.news_api_stub import NewsApiStub
+
+QUERY = {'country': 'us', 'page_size': 100}
+
+
+class NewsApiStubTests(SimpleTestCase):
+
+    def setUp(self):
+        self.stub = NewsApiStub(sources_count=5, results_per_query=150, payload_bytes=40).start()
+        self.addCleanup(self.stub.stop)
+
+    def get(self, path, gzipped=False):
+        headers = {'Accept-Encoding': 'gzip'} if gzipped else {}
+        with urlopen(Request(self.stub.base_url + path, headers=headers)) as response:
+            body = response.read()
+            if response.headers.get('Content-Encoding') == 'gzip':
+                body = gzip.decompress(body)
+            return json.loads(body)
+
+    def test_serves_sources(self):
+        sources = self.get('/v2/sources')['sources']
+        self.assertEqual(len(sources), 5)
+        self.assertEqual(sources[0]['id'], 'stub-source-0')
+
+    def test_pages_top_headlines(self):
+        first = self.get('/v2/top-headlines?country=us&pageSize=100')
+        last = self.get('/v2/top-headlines?country=us&pageSize=100&page=2', gzipped=True)
+        self.assertEqual(first['totalResults'], 150)
+        self.assertEqual(len(first['articles']), 100)
+        self.assertEqual(len(last['articles']), 50)
+        self.assertNotEqual(first['articles'][0]['url'], last['articles'][0]['url'])
+
+
+class StubQueryMixin:
+    """Run QUERY against a NewsApiStub serving `results_per_query` articles."""
+    results_per_query = 150
+
+    def setUp(self):
+        self.stub = NewsApiStub(results_per_query=self.results_per_query).start()
+        self.addCleanup(self.stub.stop)
+        # NewsApiClient refuses to send a request without a key
+        api_key = mock.patch.dict(os.environ, {'NEWS_API_KEY': 'stub-key'})
+        api_key.start()
+        self.addCleanup(api_key.stop)
+        base_url = override_settings(NEWS_API_BASE_URL=self.stub.base_url)
+        base_url.enable()
+        self.addCleanup(base_url.disable)
+        reset_session()
+        self.addCleanup(reset_session)
+
+    def run_query(self, max_pages=2):
+        [(articles, timing)] = list(iter_query_batches([QUERY], max_workers=1, max_pages=max_pages))
+        return articles, timing
+
+
+@override_settings(NEWS_API_MAX_RETRIES=0, NEWS_API_MAX_RPS=0, NEWS_API_DAILY_QUOTA=0,
+                   NEWS_API_QUOTA_PER_SECOND=0, DATABASE_REPLICAS=[])
+class QueryFailureTests(StubQueryMixin, TestCase):
+    """A query counts as failed only when it fetched nothing."""
+
+    def fail_page(self, number):
+        respond = self.stub.respond
+
+        def failing(path, params):
+            if params.get('page') == str(number):
+                return 500, {'status': 'error', 'code': 'unexpectedError', 'message': 'Stub failure'}, {}
+            return respond(path, params)
+
+        self.stub.respond = failing
+
+    def test_pages_until_total_results(self):
+        articles, timing = self.run_query()
+        self.assertEqual(len(articles), 150)
+        self.assertEqual((timing['pages'], timing['error']), (2, None))
+
+    def test_failure_before_any_article_is_an_error(self):
+        self.fail_page(1)
+        with self.assertLogs('apps.fetch_news', 'WARNING'):
+            articles, timing = self.run_query()
+        self.assertEqual(articles, [])
+        self.assertIsNotNone(timing['error'])
+
+    def test_later_failure_keeps_the_fetched_pages(self):
+        self.fail_page(2)
+        with self.assertLogs('apps.fetch_news', 'WARNING'):
+            articles, timing = self.run_query()
+        self.assertEqual(len(articles), 100)
+        self.assertIsNone(timing['error'])
+
+    def test_failed_known_url_check_keeps_the_first_page(self):
+        with mock.patch('apps.fetch_news._known_ratio', side_effect=RuntimeError('db down')), \
+                self.assertLogs('apps.fetch_news', 'WARNING'):
+            articles, timing = self.run_query()
+        self.assertEqual(len(articles), 100)
+        self.assertIsNone(timing['error'])
+
+
+@override_settings(NEWS_API_MAX_RETRIES=0, NEWS_API_MAX_RPS=0, NEWS_API_DAILY_QUOTA=0,
+                   NEWS_API_QUOTA_PER_SECOND=0, DATABASE_REPLICAS=[], NEWS_API_KNOWN_STOP_RATIO=0.8)
+class KnownUrlStopTests(StubQueryMixin, TransactionTestCase):
+    """Paging stops at a page mostly made of stored URLs."""
+    # Worker threads check the URLs on their own connection, so they must be committed
+    serialized_rollback = True
+    results_per_query = 300
+
+    def store_first_page_urls(self, count):
+        _, payload, _ = self.stub.respond('/v2/top-headlines', {'country': 'us', 'pageSize': '100'})
+        ArticleUrl.objects.bulk_create(
+            ArticleUrl(url=article['url'], published_at=article['publishedAt'])
+            for article in payload['articles'][:count]
+        )
+
+    def test_stops_once_the_known_ratio_is_reached(self):
+        self.store_first_page_urls(80)
+        articles, timing = self.run_query(max_pages=3)
+        self.assertEqual(len(articles), 100)
+        self.assertEqual((timing['pages'], timing['stopped_early']), (1, True))
+
+    def test_pages_on_below_the_known_ratio(self):
+        self.store_first_page_urls(79)
+        articles, timing = self.run_query(max_pages=3)
+        self.assertEqual(len(articles), 300)
+        self.assertEqual((timing['pages'], timing['stopped_early']), (3, False))
+
+
+class BenchmarkIngestionCommandTests(TransactionTestCase):
+    """Smoke test: both runs ingest from the stub and the report is written."""
+    # The reference data seeded by migrations must survive the flush between tests
+    serialized_rollback = True
+
+    def test_writes_a_report(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        output = os.path.join(directory.name, 'benchmark.json')
+        # The test runner already provides a throwaway database
+        with mock.patch.object(connection.creation, 'create_test_db'), \
+                mock.patch.object(connection.creation, 'destroy_test_db'):
+            call_command(
+                'benchmark_ingestion', '--countries', 'us', '--categories', 'business', 'sports',
+                '--latency', '0', '--results', '30', '--payload-bytes', '50', '--output', output,
+                stdout=io.StringIO(),
+            )
+        with open(output) as f:
+            report = json.load(f)
+        cold, warm = report['runs']
+        self.assertEqual(cold['run'], 'cold')
+        self.assertEqual(cold['summary']['articles']['created'], 60)
+        self.assertEqual(warm['summary']['articles']['created'], 0)
+        self.assertEqual(warm['articles_in_db'], 60)
+        self.assertGreater(cold['queries'], 0)
@@ -0,0 +1,97 @@
+import os
+import tempfile
+import time
+from unittest import mock
+
+from django.db import DEFAULT_DB_ALIAS
+from django.db.utils import ConnectionHandler
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from apps.news.models import NewsArticle
+from config import db_router
+from config.db_router import PrimaryReplicaRouter, ReplicaPinningMiddleware, pin_to_primary
+
+REPLICA = 'replica'
+
+
+@override_settings(DATABASE_REPLICAS=[REPLICA], DATABASE_REPLICA_STICKY_SECONDS=5)
+class PrimaryReplicaRouterTests(SimpleTestCase):
+    """
+    Routing between two SQLite databases, the primary and one standing in for a
+    replica, seen by the router only.
+    """
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.use_replica(os.path.join(directory.name, 'replica.sqlite3'))
+        self.router = PrimaryReplicaRouter()
+        health = mock.patch.dict(db_router._health, clear=True)
+        health.start()
+        self.addCleanup(health.stop)
+        token = db_router._primary_until.set(0.0)
+        self.addCleanup(db_router._primary_until.reset, token)
+
+    def use_replica(self, name):
+        connections = ConnectionHandler({
+            DEFAULT_DB_ALIAS: {'ENGINE': 'django.db.backends.sqlite3', 'NAME': os.path.join(os.path.dirname(name), 'primary.sqlite3')},
+            REPLICA: {'ENGINE': 'django.db.backends.sqlite3', 'NAME': name},
+        })
+        patch = mock.patch.object(db_router, 'connections', connections)
+        patch.start()
+        self.addCleanup(patch.stop)
+        self.addCleanup(connections.close_all)
+
+    def db_for_read(self):
+        return self.router.db_for_read(NewsArticle)
+
+    def test_reads_from_a_healthy_replica(self):
+        self.assertEqual(self.db_for_read(), REPLICA)
+
+    def test_reads_stay_on_the_primary_after_a_write(self):
+        self.assertEqual(self.router.db_for_write(NewsArticle), DEFAULT_DB_ALIAS)
+        self.assertEqual(self.db_for_read(), DEFAULT_DB_ALIAS)
+        with mock.patch('config.db_router.time.time', return_value=time.time() + 6):
+            self.assertEqual(self.db_for_read(), REPLICA)
+
+    def test_pin_to_primary(self):
+        with pin_to_primary():
+            self.assertEqual(self.db_for_read(), DEFAULT_DB_ALIAS)
+        self.assertEqual(self.db_for_read(), REPLICA)
+
+    def test_unreachable_replica_falls_back_to_the_primary(self):
+        self.use_replica('/nonexistent/replica.sqlite3')
+        with self.assertLogs('config.db_router', 'WARNING'):
+            self.assertEqual(self.db_for_read(), DEFAULT_DB_ALIAS)
+        # The result is kept until the next health check is due
+        with mock.patch('config.db_router._probe') as probe:
+            self.assertEqual(self.db_for_read(), DEFAULT_DB_ALIAS)
+        probe.assert_not_called()
+
+    def test_lagging_replica_falls_back_to_the_primary(self):
+        with mock.patch('config.db_router._probe', return_value=False):
+            self.assertEqual(self.db_for_read(), DEFAULT_DB_ALIAS)
+
+    async def test_event_loop_reads_from_the_primary_until_probed_in_a_thread(self):
+        self.assertEqual(self.db_for_read(), DEFAULT_DB_ALIAS)
+        await db_router._probing[REPLICA]
+        self.assertEqual(self.db_for_read(), REPLICA)
+
+    def test_middleware_carries_the_sticky_window_in_a_cookie(self):
+        factory = RequestFactory()
+
+        def write(request):
+            self.router.db_for_write(NewsArticle)
+            return HttpResponse()
+
+        response = ReplicaPinningMiddleware(write)(factory.get('/'))
+        cookie = response.cookies[ReplicaPinningMiddleware.cookie_name]
+        self.assertGreater(float(cookie.value), time.time())
+
+        def read(request):
+            return HttpResponse(self.db_for_read())
+
+        request = factory.get('/', HTTP_COOKIE=f'{cookie.key}={cookie.value}')
+        self.assertEqual(ReplicaPinningMiddleware(read)(request).content.decode(), DEFAULT_DB_ALIAS)
+        self.assertEqual(ReplicaPinningMiddleware(read)(factory.get('/')).content.decode(), REPLICA)
@@ -0,0 +1,35 @@
+import json
+import warnings
+
+from django.test import TestCase
+from django.urls import reverse
+
+from apps.news.models import NewsArticle, Source
+
+
+class NewsArticleExportTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        source = Source.objects.create(source_id='example', name='Example')
+        NewsArticle.objects.bulk_create(
+            NewsArticle(source=source, title=f'Headline {i}', url=f'https://example.com/{i}',
+                        published_at='2026-01-01T00:00:00Z')
+            for i in range(3)
+        )
+
+    def test_streams_ndjson(self):
+        response = self.client.get(reverse('newsarticle-export'), {'fields': 'title'})
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual([json.loads(line)['title'] for line in lines], ['Headline 0', 'Headline 1', 'Headline 2'])
+
+    async def test_streams_asynchronously_under_asgi(self):
+        with warnings.catch_warnings():
+            # Django warns when it has to buffer a sync iterator for an ASGI response
+            warnings.simplefilter('error')
+            response = await self.async_client.get(reverse('newsarticle-export'), {'output': 'csv', 'fields': 'title'})
+            self.assertTrue(response.is_async)
+            content = b''.join([chunk async for chunk in response.streaming_content]).decode()
+        self.assertEqual([line.split(',')[1] for line in content.splitlines()], [
+            'title', 'Headline 0', 'Headline 1', 'Headline 2',
+        ])
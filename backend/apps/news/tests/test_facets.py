@@ -0,0 +1,111 @@
+from datetime import datetime, timezone
+from unittest import skipUnless
+
+from django.db import connection
+from django.db.models import Count
+from django.test import TestCase
+from django.urls import reverse
+
+from apps.news import partitions
+from apps.news.facets import FACET_COLUMNS
+from apps.news.models import Category, Country, Language, NewsArticle, Source
+from apps.news.partitions import add_months, month_start
+from apps.news.services import bulk_upsert_articles
+
+# Partitions that migration 0010 creates for an empty table: this month and the next ones
+CURRENT = month_start(datetime.now(timezone.utc))
+NEXT = add_months(CURRENT, 1)
+
+# Lookup of each facet's query parameter, as NewsArticleFilter applies it
+FACET_LOOKUPS = {
+    'category': 'category__name__iexact',
+    'country': 'country__code__iexact',
+    'language': 'language__code__iexact',
+    'source': 'source__name__iexact',
+}
+
+
+def raw_article(url, source, month=CURRENT):
+    return {
+        'url': f'https://example.com/{url}',
+        'title': 'Headline',
+        'publishedAt': f'{month:%Y-%m}-15T00:00:00Z',
+        'source': {'name': source},
+    }
+
+
+class NewsArticleFacetsTests(TestCase):
+    """The facets match a GROUP BY over the articles, each under the filters of the other facets."""
+
+    @classmethod
+    def setUpTestData(cls):
+        Source.objects.create(
+            source_id='wire', name='Wire', category=Category.objects.get(name='business'),
+            country=Country.objects.get(code='us'), language=Language.objects.get(code='en'),
+        )
+        Source.objects.create(
+            source_id='daily', name='Daily', category=Category.objects.get(name='sports'),
+            country=Country.objects.get(code='fr'), language=Language.objects.get(code='fr'),
+        )
+        bulk_upsert_articles(
+            [raw_article(f'wire/{i}', 'Wire') for i in range(3)]
+            + [raw_article(f'daily/{i}', 'Daily', NEXT) for i in range(2)]
+            + [raw_article('unknown', 'Unknown')]
+        )
+
+    def facets(self, **params):
+        response = self.client.get(reverse('newsarticle-facets'), params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def assertMatchesArticles(self, **params):
+        payload = self.facets(**params)
+        lookups = {FACET_LOOKUPS[name]: value for name, value in params.items() if name in FACET_LOOKUPS}
+        if 'published_after' in params:
+            lookups['published_at__gte'] = params['published_after']
+        self.assertEqual(payload['total'], NewsArticle.objects.filter(**lookups).count())
+        for facet, column in FACET_COLUMNS.items():
+            others = {lookup: value for lookup, value in lookups.items() if not lookup.startswith(f'{facet}__')}
+            grouped = dict(
+                NewsArticle.objects.filter(**others).exclude(**{f'{column}__isnull': True}).order_by()
+                .values_list(column).annotate(total=Count('id'))
+            )
+            self.assertEqual({value['id']: value['count'] for value in payload['facets'][facet]}, grouped, facet)
+        return payload
+
+    def assertMatchesArticlesForEveryFilter(self):
+        for params in ({}, {'country': 'us'}, {'country': 'US', 'category': 'business'}, {'source': 'daily'}):
+            with self.subTest(params=params):
+                self.assertEqual(self.assertMatchesArticles(**params)['computed_from'], 'rollup')
+        published_after = f'{NEXT:%Y-%m-%d}T00:00:00Z'
+        self.assertEqual(
+            self.assertMatchesArticles(published_after=published_after, country='fr')['computed_from'], 'articles',
+        )
+
+    def test_matches_the_articles_after_inserts(self):
+        self.assertMatchesArticlesForEveryFilter()
+        bulk_upsert_articles([raw_article('wire/new', 'Wire', NEXT), raw_article('daily/new', 'Daily')])
+        self.assertMatchesArticlesForEveryFilter()
+
+    def test_matches_the_articles_after_updates(self):
+        # Re-fetched under another source, the articles move to its category, country and language
+        bulk_upsert_articles([raw_article('wire/0', 'Daily'), raw_article('unknown', 'Wire')])
+        self.assertEqual(NewsArticle.objects.filter(source__source_id='daily').count(), 3)
+        self.assertMatchesArticlesForEveryFilter()
+
+    def test_each_facet_ignores_its_own_filter(self):
+        payload = self.facets(country='us')
+        self.assertEqual(payload['total'], 3)
+        self.assertEqual(sorted(value['key'] for value in payload['facets']['country']), ['fr', 'us'])
+        self.assertEqual([value['key'] for value in payload['facets']['category']], ['business'])
+        self.assertEqual([value['key'] for value in payload['facets']['source']], ['wire'])
+
+    @skipUnless(connection.vendor == 'postgresql', 'Articles are only partitioned in PostgreSQL')
+    def test_matches_the_articles_after_a_partition_drop(self):
+        # Rolled back with the test's transaction. The articles were inserted in that same
+        # transaction: their deferred foreign key checks must run before the table can go
+        with connection.cursor() as cursor:
+            cursor.execute('SET CONSTRAINTS ALL IMMEDIATE')
+        partitions.detach_partition(CURRENT, partitions.DROP)
+        self.assertEqual(NewsArticle.objects.count(), 2)
+        self.assertMatchesArticlesForEveryFilter()
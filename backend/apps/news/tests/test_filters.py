@@ -0,0 +1,72 @@
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from apps.news.filters import NewsArticleFilter
+from apps.news.models import Category, Country, Language, NewsArticle, Source
+
+
+@override_settings(NEWS_RESPONSE_CACHE_TIMEOUT=0)
+class NewsArticleFilterTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.business = Category.objects.get(name='business')
+        us = Country.objects.get(code='us')
+        english = Language.objects.get(code='en')
+        wire = Source.objects.create(source_id='wire', name='The Wire', category=cls.business, country=us, language=english)
+        daily = Source.objects.create(source_id='daily', name='Daily', country=Country.objects.get(code='fr'))
+        for title, source, published_at in [
+            ('January', wire, '2026-01-01T00:00:00Z'),
+            ('February', daily, '2026-02-01T00:00:00Z'),
+            ('March', wire, '2026-03-01T00:00:00Z'),
+        ]:
+            NewsArticle.objects.create(source=source, title=title, url=f'https://example.com/{title}',
+                                       published_at=published_at)
+
+    def titles(self, **params):
+        response = self.client.get(reverse('newsarticle-list'), {'ordering': 'published_at', **params})
+        self.assertEqual(response.status_code, 200)
+        return [article['title'] for article in response.json()['results']]
+
+    def test_published_range_includes_the_start_and_excludes_the_end(self):
+        self.assertEqual(self.titles(published_after='2026-02-01T00:00:00Z'), ['February', 'March'])
+        self.assertEqual(self.titles(published_before='2026-02-01T00:00:00Z'), ['January'])
+        self.assertEqual(
+            self.titles(published_after='2026-01-15T00:00:00Z', published_before='2026-03-01T00:00:00Z'), ['February'],
+        )
+
+    def test_invalid_date_is_a_client_error(self):
+        response = self.client.get(reverse('newsarticle-list'), {'published_after': 'yesterday'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('published_after', response.json())
+
+    def test_source_name_is_matched_in_a_subquery(self):
+        self.assertEqual(self.titles(source='the wire'), ['January', 'March'])
+        self.assertEqual(self.titles(source='Unknown'), [])
+        queryset = NewsArticleFilter({'source': 'The Wire'}, queryset=NewsArticle.objects.all()).qs
+        sql = str(queryset.query)
+        self.assertIn('IN (SELECT', sql)
+        self.assertNotIn('JOIN', sql)
+
+    def test_references_resolve_to_one_equality_predicate(self):
+        for params in ({'category': 'Business'}, {'category': 'BUSINESS', 'country': 'United States', 'language': 'en'}):
+            with self.subTest(params=params):
+                self.assertEqual(self.titles(**params), ['January', 'March'])
+        self.assertEqual(self.titles(country='FR'), ['February'])
+        queryset = NewsArticleFilter({'category': 'business'}, queryset=NewsArticle.objects.all()).qs
+        sql = str(queryset.query)
+        self.assertIn(f'"category_id" = {self.business.pk}', sql)
+        self.assertNotIn('JOIN', sql)
+
+    def test_unknown_reference_is_an_empty_result(self):
+        for params in ({'category': 'gossip'}, {'country': 'zz'}, {'language': 'klingon', 'category': 'business'}):
+            with self.subTest(params=params):
+                self.assertEqual(self.titles(**params), [])
+        queryset = NewsArticleFilter({'country': 'zz'}, queryset=NewsArticle.objects.all()).qs
+        with self.assertNumQueries(0):
+            self.assertEqual(list(queryset), [])
+
+    async def test_unknown_reference_is_an_empty_async_result(self):
+        response = await self.async_client.get(reverse('async-newsarticle-list'), {'country': 'zz'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['results'], [])
@@ -0,0 +1,96 @@
+from unittest import mock
+
+import requests
+from django.test import SimpleTestCase
+
+from apps.news_api_client import NewsApiSession
+from apps.news_api_stub import NewsApiStub
+
+
+class NewsApiSessionTests(SimpleTestCase):
+    """NewsApiSession against a local NewsApiStub, with backoff sleeps recorded instead of slept."""
+
+    def setUp(self):
+        self.stub = NewsApiStub(sources_count=3).start()
+        self.addCleanup(self.stub.stop)
+        self.session = NewsApiSession(
+            base_url=self.stub.base_url, timeout=5, max_retries=3, backoff_base=0.5, backoff_max=4,
+        )
+        self.addCleanup(self.session.close)
+        sleep = mock.patch('apps.news_api_client.time.sleep')
+        self.sleep = sleep.start()
+        self.addCleanup(sleep.stop)
+
+    def get_sources(self):
+        # NewsApiClient calls the public origin; the session redirects it to the stub
+        return self.session.get('https://newsapi.org/v2/sources')
+
+    def test_redirects_to_base_url(self):
+        response = self.get_sources()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()['sources']), 3)
+        self.assertEqual(self.stub.requests, 1)
+
+    def test_retries_server_errors_with_capped_backoff(self):
+        self.stub.fail_next(503, count=2)
+        with self.assertLogs('apps.news_api_client', 'WARNING'):
+            response = self.get_sources()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.stub.requests, 3)
+        self.assertEqual(self.session.last_call()['attempts'], 3)
+        delays = [call.args[0] for call in self.sleep.call_args_list]
+        self.assertEqual(len(delays), 2)
+        # Full jitter: attempt n waits at most backoff_base * 2 ** (n - 1)
+        self.assertLessEqual(delays[0], 0.5)
+        self.assertLessEqual(delays[1], 1.0)
+
+    def test_honors_retry_after_on_429(self):
+        self.stub.fail_next(429, retry_after=2)
+        with self.assertLogs('apps.news_api_client', 'WARNING'):
+            response = self.get_sources()
+        self.assertEqual(response.status_code, 200)
+        self.sleep.assert_called_once_with(2.0)
+
+    def test_retry_after_is_capped_by_backoff_max(self):
+        self.stub.fail_next(429, retry_after=120)
+        with self.assertLogs('apps.news_api_client', 'WARNING'):
+            self.get_sources()
+        self.sleep.assert_called_once_with(4)
+
+    def test_gives_up_after_max_retries(self):
+        self.stub.fail_next(500, count=10)
+        with self.assertLogs('apps.news_api_client', 'WARNING'):
+            response = self.get_sources()
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(self.stub.requests, 4)
+        self.assertEqual(self.session.last_call()['status'], 500)
+        self.assertEqual(self.session.stats()['attempts'], 4)
+
+    def test_client_errors_are_not_retried(self):
+        response = self.session.get(f'{self.stub.base_url}/v2/unknown')
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(self.stub.requests, 1)
+        self.sleep.assert_not_called()
+
+    def test_reuses_pooled_connections(self):
+        for _ in range(5):
+            self.get_sources()
+        self.assertEqual(self.stub.requests, 5)
+        self.assertEqual(self.stub.connections, 1)
+        self.assertEqual(self.session.stats()['calls'], 5)
+
+    def test_last_call_is_reset_when_a_call_fails(self):
+        self.get_sources()
+        self.assertIsNotNone(self.session.last_call())
+        with mock.patch('requests.Session.request', side_effect=ValueError('boom')):
+            with self.assertRaises(ValueError):
+                self.get_sources()
+        self.assertIsNone(self.session.last_call())
+
+    def test_connection_errors_are_retried_then_raised(self):
+        session = NewsApiSession(base_url='http://127.0.0.1:9', timeout=1, max_retries=2)
+        self.addCleanup(session.close)
+        with self.assertRaises(requests.ConnectionError), self.assertLogs('apps.news_api_client', 'WARNING'):
+            session.get('https://newsapi.org/v2/sources')
+        self.assertEqual(self.sleep.call_count, 2)
+        self.assertEqual(session.last_call()['attempts'], 3)
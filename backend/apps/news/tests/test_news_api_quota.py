@@ -0,0 +1,53 @@
+from unittest import mock
+
+from django.core.cache import caches
+from django.test import SimpleTestCase, override_settings
+
+from apps import news_api_quota
+from apps.news_api_quota import QuotaExceeded, QuotaLedger
+
+COMBINATIONS = [{'country': country} for country in ('us', 'fr', 'eg', 'ca')]
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'quota-tests'}})
+class QuotaLedgerTests(SimpleTestCase):
+
+    def setUp(self):
+        caches['default'].clear()
+        # The process-local warning is logged once per process
+        warned = mock.patch.object(news_api_quota, '_warned_process_local', True)
+        warned.start()
+        self.addCleanup(warned.stop)
+
+    def ledger(self, daily_limit):
+        return QuotaLedger(daily_limit=daily_limit, per_second=0, cache_alias='default')
+
+    def test_daily_limit(self):
+        ledger = self.ledger(2)
+        ledger.acquire()
+        ledger.acquire()
+        with self.assertRaises(QuotaExceeded):
+            ledger.acquire()
+        self.assertEqual(ledger.snapshot(), {'spent_today': 2, 'daily_limit': 2, 'remaining': 0})
+
+    def test_trim_budgets_the_first_page_of_each_query(self):
+        ledger = self.ledger(10)
+        ledger.acquire(7)
+        self.assertEqual(ledger.trim(COMBINATIONS[:3]), COMBINATIONS[:3])
+        with self.assertLogs('apps.news_api_quota', 'WARNING'):
+            self.assertEqual(ledger.trim(COMBINATIONS), COMBINATIONS[:3])
+        with self.assertLogs('apps.news_api_quota', 'WARNING'):
+            self.assertEqual(ledger.trim(COMBINATIONS, calls_per_query=2), COMBINATIONS[:1])
+
+    def test_trim_drops_everything_once_the_budget_is_spent(self):
+        ledger = self.ledger(10)
+        ledger.acquire(10)
+        with self.assertLogs('apps.news_api_quota', 'WARNING'):
+            self.assertEqual(ledger.trim(COMBINATIONS), [])
+
+    def test_warns_when_the_cache_is_process_local(self):
+        news_api_quota._warned_process_local = False
+        with self.assertLogs('apps.news_api_quota', 'WARNING') as logs:
+            ledger = self.ledger(10)
+        self.assertFalse(ledger.is_shared)
+        self.assertIn('enforced per process', logs.output[0])
@@ -0,0 +1,41 @@
+from unittest import mock
+
+from django.db.models import F, FloatField, Value
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from apps.news.filters import FullTextSearchFilter
+from apps.news.models import NewsArticle, Source
+
+
+def rank_by_id(self, request, queryset, view):
+    """FullTextSearchFilter's annotations and ordering, without a Postgres search vector."""
+    if not request.query_params.get('q'):
+        return queryset
+    queryset = queryset.annotate(search_rank=F('id') * Value(1.0, output_field=FloatField()), search_headline=F('title'))
+    return queryset.order_by('-search_rank', '-published_at')
+
+
+@override_settings(NEWS_ARTICLE_FAST_LIST=True, NEWS_RESPONSE_CACHE_TIMEOUT=0)
+class SearchCursorPaginationTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        source = Source.objects.create(source_id='example', name='Example')
+        NewsArticle.objects.bulk_create(
+            NewsArticle(source=source, title=f'Headline {i}', url=f'https://example.com/{i}',
+                        published_at='2026-01-01T00:00:00Z')
+            for i in range(5)
+        )
+
+    def test_pages_by_rank_with_sparse_fields(self):
+        url = reverse('newsarticle-list')
+        params = {'q': 'headline', 'pagination': 'cursor', 'fields': 'title', 'page_size': 2}
+        titles = []
+        with mock.patch.object(FullTextSearchFilter, 'filter_queryset', rank_by_id):
+            while url:
+                response = self.client.get(url, params)
+                self.assertEqual(response.status_code, 200)
+                titles.extend(article['title'] for article in response.data['results'])
+                url, params = response.data['next'], None
+        self.assertEqual(titles, [f'Headline {i}' for i in reversed(range(5))])
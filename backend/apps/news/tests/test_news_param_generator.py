@@ -0,0 +1,32 @@
+from django.test import SimpleTestCase
+
+from apps.news.models import Category
+from apps.news_param_generator import plan_query_combinations
+
+ALL_CATEGORIES = [name for name, _ in Category.CATEGORY_CHOICES]
+
+
+class PlanQueryCombinationsTests(SimpleTestCase):
+
+    def test_keeps_one_call_per_category_without_enough_pages(self):
+        plan = plan_query_combinations(['us'], ALL_CATEGORIES, page_size=100, max_pages=5)
+        self.assertEqual((plan['min_calls'], plan['max_calls']), (len(ALL_CATEGORIES), len(ALL_CATEGORIES) * 5))
+        self.assertEqual({params['category'] for params in plan['combinations']}, set(ALL_CATEGORIES))
+
+    def test_folds_every_category_when_paging_covers_them(self):
+        plan = plan_query_combinations(['us', 'fr'], ALL_CATEGORIES, page_size=100, max_pages=len(ALL_CATEGORIES))
+        self.assertEqual(plan['combinations'], [
+            {'country': 'us', 'page_size': 100},
+            {'country': 'fr', 'page_size': 100},
+        ])
+
+    def test_never_folds_a_partial_category_set(self):
+        plan = plan_query_combinations(['us'], ALL_CATEGORIES[:3], page_size=100, max_pages=10)
+        self.assertEqual(plan['min_calls'], 3)
+
+    def test_batches_sources(self):
+        sources = [f'source-{i}' for i in range(45)]
+        plan = plan_query_combinations(sources=sources, page_size=50, max_pages=2)
+        self.assertEqual((plan['min_calls'], plan['max_calls']), (3, 6))
+        self.assertEqual(plan['combinations'][2], {'sources': ','.join(sources[40:]), 'page_size': 50})
+        self.assertEqual(plan['estimated_articles'], 300)
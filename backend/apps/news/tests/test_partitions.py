@@ -0,0 +1,194 @@
+from datetime import datetime, timedelta, timezone
+from unittest import skipUnless
+
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.db.models import Count
+from django.test import TransactionTestCase
+
+from apps.news import partitions
+from apps.news.archive import archive_batch
+from apps.news.facets import FACET_COLUMNS
+from apps.news.models import ArchivedArticleBody, ArticleFacetCount, ArticleUrl, NewsArticle, Source
+from apps.news.partitions import add_months, month_start, partition_name
+from apps.news.services import bulk_upsert_articles
+
+# Partitions that migration 0010 creates for an empty table: this month and the next ones
+CURRENT = month_start(datetime.now(timezone.utc))
+NEXT = add_months(CURRENT, 1)
+
+
+def raw_article(month, url, source='Example'):
+    published_at = datetime(month.year, month.month, 15, tzinfo=timezone.utc)
+    return {
+        'url': url,
+        'title': 'Headline',
+        'description': 'Summary',
+        'content': 'Body',
+        'publishedAt': published_at.isoformat().replace('+00:00', 'Z'),
+        'source': {'name': source},
+    }
+
+
+def table_exists(name):
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT to_regclass(%s) IS NOT NULL", [name])
+        return cursor.fetchone()[0]
+
+
+def drop_table(name):
+    with connection.cursor() as cursor:
+        cursor.execute(f"DROP TABLE IF EXISTS {name}")
+
+
+@skipUnless(connection.vendor == 'postgresql', 'Articles are only partitioned in PostgreSQL')
+class PartitionMaintenanceTests(TransactionTestCase):
+    # Keep the reference rows seeded by migrations for the test cases that follow
+    serialized_rollback = True
+
+    def setUp(self):
+        Source.objects.create(source_id='example', name='Example')
+        bulk_upsert_articles([raw_article(CURRENT, f'https://example.com/old/{i}') for i in range(3)])
+        bulk_upsert_articles([raw_article(NEXT, f'https://example.com/new/{i}') for i in range(2)])
+
+    def restore_partition(self, month):
+        """Put back a partition taken out by a test, once its leftovers are gone."""
+        name = partition_name(month)
+        self.addCleanup(partitions.create_partition, month)
+        self.addCleanup(drop_table, f'{name}_bodies')
+        self.addCleanup(drop_table, name)
+
+    def assertConsistentWithArticles(self):
+        self.assertEqual(
+            sorted(ArticleUrl.objects.values_list('url', flat=True)),
+            sorted(NewsArticle.objects.values_list('url', flat=True)),
+        )
+        live = {
+            tuple(row[column] for column in FACET_COLUMNS.values()): row['total']
+            for row in NewsArticle.objects.order_by().values(*FACET_COLUMNS.values()).annotate(total=Count('id'))
+        }
+        rollup = {
+            tuple(row[column] for column in FACET_COLUMNS.values()): row['count']
+            for row in ArticleFacetCount.objects.filter(count__gt=0).values(*FACET_COLUMNS.values(), 'count')
+        }
+        self.assertEqual(rollup, live)
+        self.assertFalse(
+            ArchivedArticleBody.objects.exclude(article_id__in=NewsArticle.objects.values('id')).exists()
+        )
+
+    def test_ensure_partitions_creates_the_missing_months(self):
+        newest = max(partitions.attached_partitions())
+        today = add_months(newest, 2)
+        # A row of a month without a partition waits in the default partition
+        bulk_upsert_articles([raw_article(add_months(newest, 1), 'https://example.com/early')])
+        expected = [partition_name(add_months(newest, months)) for months in range(1, 4)]
+        for name in expected:
+            self.addCleanup(drop_table, name)
+
+        self.assertEqual(partitions.ensure_partitions(months_ahead=1, today=today), expected)
+        self.assertEqual(partitions.ensure_partitions(months_ahead=1, today=today), [])
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT tableoid::regclass::text FROM {partitions.TABLE} WHERE url = %s", ['https://example.com/early']
+            )
+            self.assertEqual(cursor.fetchone()[0], expected[0])
+
+    def test_drop_removes_the_articles_with_their_urls_bodies_and_counts(self):
+        archive_batch(datetime(NEXT.year, NEXT.month, 1, tzinfo=timezone.utc), batch_size=10)
+        self.assertEqual(ArchivedArticleBody.objects.count(), 3)
+        self.restore_partition(CURRENT)
+
+        name = partitions.detach_partition(CURRENT, partitions.DROP)
+
+        self.assertEqual(name, partition_name(CURRENT))
+        self.assertFalse(table_exists(name))
+        self.assertEqual(NewsArticle.objects.count(), 2)
+        self.assertEqual(ArchivedArticleBody.objects.count(), 0)
+        self.assertConsistentWithArticles()
+
+    def test_detach_keeps_the_articles_and_their_bodies_out_of_the_table(self):
+        archive_batch(datetime(NEXT.year, NEXT.month, 1, tzinfo=timezone.utc), batch_size=10)
+        self.restore_partition(CURRENT)
+
+        name = partitions.detach_partition(CURRENT)
+
+        self.assertNotIn(CURRENT, partitions.attached_partitions())
+        self.assertEqual(NewsArticle.objects.count(), 2)
+        self.assertConsistentWithArticles()
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT count(*) FROM {name}")
+            self.assertEqual(cursor.fetchone()[0], 3)
+            cursor.execute(f"SELECT count(*) FROM {name}_bodies JOIN {name} ON id = article_id")
+            self.assertEqual(cursor.fetchone()[0], 3)
+
+    def test_apply_retention_takes_out_the_months_before_the_cutoff(self):
+        self.restore_partition(CURRENT)
+        today = add_months(CURRENT, 2)
+        self.assertEqual(partitions.apply_retention(retention_months=0, today=today), [])
+        with self.assertRaises(ValueError):
+            partitions.apply_retention(retention_months=2, action='archive', today=today)
+
+        detached = partitions.apply_retention(retention_months=1, action=partitions.DROP, today=today)
+
+        self.assertEqual(detached, [partition_name(CURRENT)])
+        self.assertEqual(NewsArticle.objects.count(), 2)
+        self.assertConsistentWithArticles()
+
+    def test_maintain_partitions(self):
+        created = partitions.ensure_partitions()
+        for name in created:
+            self.addCleanup(drop_table, name)
+        with self.settings(NEWS_ARTICLE_RETENTION_MONTHS=0):
+            self.assertEqual(
+                partitions.maintain_partitions(),
+                {'partitioned': True, 'created': [], 'detached': []},
+            )
+
+
+@skipUnless(connection.vendor == 'postgresql', 'Articles are only partitioned in PostgreSQL')
+class PartitionMigrationTests(TransactionTestCase):
+    serialized_rollback = True
+    migrate_from = [('news', '0009_articlefacetcount')]
+    migrate_to = [('news', '0010_partition_articles_by_month')]
+
+    def migrate(self, targets):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(targets)
+        return executor.loader.project_state(targets).apps
+
+    def tearDown(self):
+        self.migrate(MigrationExecutor(connection).loader.graph.leaf_nodes())
+
+    def articles(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT id, url, published_at FROM {partitions.TABLE} ORDER BY id")
+            return cursor.fetchall()
+
+    def test_rebuild_keeps_every_article_both_ways(self):
+        apps = self.migrate(self.migrate_from)
+        historical = apps.get_model('news', 'NewsArticle')
+        now = datetime.now(timezone.utc)
+        for i, published_at in enumerate([now - timedelta(days=3650 * 2), now - timedelta(days=40), now]):
+            historical.objects.create(title='Headline', url=f'https://example.com/{i}', published_at=published_at)
+        articles = self.articles()
+
+        self.migrate(self.migrate_to)
+        self.assertTrue(partitions.is_partitioned())
+        self.assertEqual(self.articles(), articles)
+        # The row older than every monthly partition lands in the default partition
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT count(*) FROM {partitions.DEFAULT_PARTITION}")
+            self.assertEqual(cursor.fetchone()[0], 1)
+            # The id sequence carries on after the copied rows
+            cursor.execute(f"SELECT nextval('{partitions.TABLE}_id_seq')")
+            self.assertGreater(cursor.fetchone()[0], articles[-1][0])
+
+        self.migrate(self.migrate_from)
+        self.assertFalse(partitions.is_partitioned())
+        self.assertEqual(self.articles(), articles)
+
+        # Migration 0012 then registers every stored URL
+        self.migrate(MigrationExecutor(connection).loader.graph.leaf_nodes())
+        self.assertEqual(self.articles(), articles)
+        self.assertEqual(sorted(ArticleUrl.objects.values_list('url', flat=True)), [url for _, url, _ in articles])
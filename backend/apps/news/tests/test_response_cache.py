@@ -0,0 +1,59 @@
+import tempfile
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from apps.news import response_cache
+from apps.news.apps import bump_reference_version
+from apps.news.models import NewsArticle, Source
+from apps.news.pagination import COUNT_CACHED, CountStrategyPaginator
+
+
+class ConditionalGetTests(TestCase):
+    """Validators from the version stamps, with a cache every process shares."""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        shared_cache = override_settings(CACHES={'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': directory.name,
+        }})
+        shared_cache.enable()
+        self.addCleanup(shared_cache.disable)
+        source = Source.objects.create(source_id='example', name='Example')
+        self.article = NewsArticle.objects.create(
+            source=source, title='Headline', url='https://example.com/1', published_at='2026-01-01T00:00:00Z',
+        )
+
+    def test_unchanged_article_is_not_modified(self):
+        url = reverse('newsarticle-detail', args=[self.article.pk])
+        etag = self.client.get(url)['ETag']
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+    def test_missing_article_is_never_not_modified(self):
+        etag = self.client.get(reverse('newsarticle-detail', args=[self.article.pk]))['ETag']
+        missing = reverse('newsarticle-detail', args=[self.article.pk + 1])
+        self.assertEqual(self.client.get(missing, HTTP_IF_NONE_MATCH=etag).status_code, 404)
+
+    def test_cached_count_is_exact_until_the_version_changes(self):
+        def paginator():
+            return CountStrategyPaginator(NewsArticle.objects.order_by('id'), 10, strategy=COUNT_CACHED)
+
+        first = paginator()
+        self.assertEqual((first.count, first.count_is_approximate), (1, False))
+        with self.assertNumQueries(0):
+            cached = paginator()
+            self.assertEqual((cached.count, cached.count_is_approximate), (1, False))
+        response_cache.bump_version(response_cache.ARTICLES)
+        stale = paginator()
+        self.assertEqual((stale.count, stale.count_is_approximate), (1, True))
+
+
+class BumpReferenceVersionTests(TestCase):
+
+    def test_unreachable_cache_does_not_fail_migrate(self):
+        with mock.patch('apps.news.response_cache.bump_version', side_effect=ConnectionError('refused')), \
+                self.assertLogs('apps.news.apps', 'WARNING'):
+            bump_reference_version(sender=None)
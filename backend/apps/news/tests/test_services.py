@@ -0,0 +1,149 @@
+from datetime import datetime, timezone
+from unittest import mock
+
+from django.db import IntegrityError
+from django.test import TestCase
+
+from apps.news.models import ArticleFacetCount, ArticleUrl, Category, Country, Language, NewsArticle, Source
+from apps.news import response_cache, services
+from apps.news.services import bulk_upsert_articles, sync_sources
+
+URL = 'https://example.com/story'
+FIRST_SEEN = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def raw_article(published_at, url=URL, source='Unknown', **fields):
+    return {
+        'url': url,
+        'title': 'Headline',
+        'publishedAt': published_at.isoformat().replace('+00:00', 'Z'),
+        'source': {'name': source},
+        **fields,
+    }
+
+
+def raw_source(source_id, name=None, **fields):
+    return {
+        'id': source_id,
+        'name': name or source_id.title(),
+        'description': 'News',
+        'url': f'https://{source_id}.example.com',
+        'category': 'general',
+        'language': 'en',
+        'country': 'us',
+        **fields,
+    }
+
+
+class SyncSourcesTests(TestCase):
+
+    def sync(self, sources, **kwargs):
+        with self.captureOnCommitCallbacks(execute=True):
+            return sync_sources(sources, **kwargs)
+
+    def test_inserts_new_sources(self):
+        summary = self.sync([raw_source('bbc', category='business', country='zz'), {'name': 'No id'}])
+        self.assertEqual(summary, {'inserted': 1, 'updated': 0, 'retired': 0})
+        source = Source.objects.get()
+        self.assertEqual(
+            (source.source_id, source.name, source.url, source.is_active),
+            ('bbc', 'Bbc', 'https://bbc.example.com', True),
+        )
+        self.assertEqual(
+            (source.category_id, source.language_id, source.country_id),
+            (Category.objects.get(name='business').id, Language.objects.get(code='en').id, None),
+        )
+
+    def test_updates_only_changed_sources(self):
+        self.sync([raw_source('bbc'), raw_source('cnn')])
+        version = response_cache.get_version(response_cache.SOURCES)
+        self.assertEqual(self.sync([raw_source('bbc'), raw_source('cnn')]), {'inserted': 0, 'updated': 0, 'retired': 0})
+        self.assertEqual(response_cache.get_version(response_cache.SOURCES), version)
+
+        summary = self.sync([raw_source('bbc', name='BBC News', language='fr'), raw_source('cnn')])
+        self.assertEqual(summary, {'inserted': 0, 'updated': 1, 'retired': 0})
+        source = Source.objects.get(source_id='bbc')
+        self.assertEqual((source.name, source.language_id), ('BBC News', Language.objects.get(code='fr').id))
+        self.assertNotEqual(response_cache.get_version(response_cache.SOURCES), version)
+
+    def test_retires_missing_sources_and_reactivates_returning_ones(self):
+        self.sync([raw_source('bbc'), raw_source('cnn')])
+        self.assertEqual(self.sync([raw_source('bbc')])['retired'], 0)
+
+        summary = self.sync([raw_source('bbc')], retire_missing=True)
+        self.assertEqual(summary, {'inserted': 0, 'updated': 0, 'retired': 1})
+        self.assertEqual(dict(Source.objects.values_list('source_id', 'is_active')), {'bbc': True, 'cnn': False})
+
+        summary = self.sync([raw_source('bbc'), raw_source('cnn')], retire_missing=True)
+        self.assertEqual(summary, {'inserted': 0, 'updated': 1, 'retired': 0})
+        self.assertTrue(Source.objects.get(source_id='cnn').is_active)
+
+
+class BulkUpsertArticlesTests(TestCase):
+
+    def test_url_keeps_its_first_published_at(self):
+        bulk_upsert_articles([raw_article(FIRST_SEEN)])
+        summary = bulk_upsert_articles([raw_article(datetime(2026, 3, 1, tzinfo=timezone.utc))])
+        self.assertEqual(summary, {'created': 0, 'updated': 1, 'skipped': 0})
+        self.assertEqual(list(NewsArticle.objects.values_list('published_at', flat=True)), [FIRST_SEEN])
+        self.assertEqual(list(ArticleUrl.objects.values_list('url', 'published_at')), [(URL, FIRST_SEEN)])
+
+    def test_registers_articles_stored_without_their_url(self):
+        NewsArticle.objects.create(title='Headline', url=URL, published_at=FIRST_SEEN)
+        summary = bulk_upsert_articles([raw_article(datetime(2026, 3, 1, tzinfo=timezone.utc))])
+        self.assertEqual(summary['updated'], 1)
+        self.assertEqual(NewsArticle.objects.count(), 1)
+        self.assertEqual(ArticleUrl.objects.get(url=URL).published_at, FIRST_SEEN)
+
+    def test_retries_urls_registered_concurrently(self):
+        bulk_create = ArticleUrl.objects.bulk_create
+        calls = []
+
+        def registered_first(objs, *args, **kwargs):
+            calls.append(objs)
+            if len(calls) == 1:
+                raise IntegrityError('duplicate key value violates unique constraint')
+            return bulk_create(objs, *args, **kwargs)
+
+        with mock.patch.object(ArticleUrl.objects, 'bulk_create', side_effect=registered_first):
+            summary = bulk_upsert_articles([raw_article(FIRST_SEEN)])
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(summary['created'], 1)
+        self.assertEqual(ArticleUrl.objects.count(), 1)
+
+    def test_chunks_lock_their_urls_in_one_order(self):
+        urls = [f'https://example.com/{name}' for name in ('c', 'a', 'd', 'b')]
+        with mock.patch.object(services, '_claim_urls', wraps=services._claim_urls) as claim:
+            bulk_upsert_articles([raw_article(FIRST_SEEN, url) for url in urls], batch_size=2)
+        locked = [article.url for call in claim.call_args_list for article in call.args[0]]
+        self.assertEqual(locked, sorted(urls))
+
+    def test_incomplete_article_keeps_the_stored_values(self):
+        source = Source.objects.create(
+            source_id='example', name='Example', category=Category.objects.get(name='business'),
+            country=Country.objects.get(code='us'), language=Language.objects.get(code='en'),
+        )
+        bulk_upsert_articles([raw_article(
+            FIRST_SEEN, source='Example', description='Stored description', content='Stored content',
+            urlToImage='https://example.com/image.jpg',
+        )])
+        # Unknown source, no description, content or image
+        summary = bulk_upsert_articles([raw_article(FIRST_SEEN, title='New headline')])
+        self.assertEqual(summary['updated'], 1)
+        article = NewsArticle.objects.get()
+        self.assertEqual(
+            (article.title, article.description, article.content, article.image_url),
+            ('New headline', 'Stored description', 'Stored content', 'https://example.com/image.jpg'),
+        )
+        self.assertEqual(
+            (article.source_id, article.category_id, article.country_id, article.language_id),
+            (source.id, source.category_id, source.country_id, source.language_id),
+        )
+        self.assertEqual(
+            list(ArticleFacetCount.objects.filter(count__gt=0).values_list('source_id', 'count')), [(source.id, 1)],
+        )
+
+    def test_new_article_stores_missing_text_empty(self):
+        bulk_upsert_articles([raw_article(FIRST_SEEN)])
+        article = NewsArticle.objects.get()
+        self.assertEqual((article.description, article.content, article.image_url), ('', '', ''))
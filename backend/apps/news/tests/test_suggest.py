@@ -0,0 +1,61 @@
+from unittest import skipUnless
+
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from apps.news.models import NewsArticle, Source
+from apps.news.views import NewsArticleSuggestView
+
+
+@override_settings(NEWS_SUGGEST_CACHE_TIMEOUT=0)
+class NewsArticleSuggestTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        Source.objects.create(source_id='climate-home', name='Climate Home News')
+        Source.objects.create(source_id='climate-weekly', name='Climate Weekly', is_active=False)
+        Source.objects.create(source_id='sports-daily', name='Sports Daily')
+        for day, title in enumerate(['Climate summit opens', 'Markets rally on climate deal', 'Football final']):
+            NewsArticle.objects.create(
+                title=title, url=f'https://example.com/{day}', published_at=f'2026-01-0{day + 1}T00:00:00Z',
+            )
+
+    def suggest(self, q, **params):
+        response = self.client.get(reverse('newsarticle-suggest'), {'q': q, **params})
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_short_prefix_suggests_nothing(self):
+        with self.assertNumQueries(0):
+            self.assertEqual(self.suggest(' c '), {'q': 'c', 'titles': [], 'sources': []})
+
+    @skipUnless(connection.vendor == 'postgresql', 'Trigram matching needs pg_trgm')
+    def test_trigram_matches_rank_prefixes_first(self):
+        suggestions = self.suggest('Climaet')
+        self.assertEqual(suggestions['q'], 'climaet')
+        self.assertEqual(
+            [title['title'] for title in suggestions['titles']],
+            ['Markets rally on climate deal', 'Climate summit opens'],
+        )
+        suggestions = self.suggest('climat', limit=1)
+        self.assertEqual([title['title'] for title in suggestions['titles']], ['Climate summit opens'])
+        self.assertEqual([source['source_id'] for source in suggestions['sources']], ['climate-home'])
+
+    @skipUnless(connection.vendor == 'postgresql', 'Trigram matching needs pg_trgm')
+    def test_trigram_match_reads_the_gin_index(self):
+        queryset = NewsArticleSuggestView().ranked(Source.objects.all(), 'name', 'climate')
+        with connection.cursor() as cursor:
+            cursor.execute('SET LOCAL enable_seqscan = off')
+            plan = queryset.explain()
+        self.assertIn('news_source_name_trgm_idx', plan)
+
+    def test_prefix_matches_without_pg_trgm(self):
+        if connection.vendor == 'postgresql':
+            # Rolled back with the test's transaction, trigram indexes included
+            with connection.cursor() as cursor:
+                cursor.execute('DROP EXTENSION pg_trgm CASCADE')
+        with self.assertLogs('apps.news.views', 'WARNING'):
+            suggestions = self.suggest('climate')
+        self.assertEqual([title['title'] for title in suggestions['titles']], ['Climate summit opens'])
+        self.assertEqual([source['source_id'] for source in suggestions['sources']], ['climate-home'])
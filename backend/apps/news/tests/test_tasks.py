@@ -0,0 +1,85 @@
+from unittest import mock
+
+from django.test import TestCase, override_settings
+
+from config.celery import app
+from apps.news.models import NewsArticle
+from apps.news.tasks import fetch_latest_news_task, ingest_headlines_slice_task
+
+COMBINATIONS = [{'country': country} for country in ('us', 'fr', 'eg', 'ca', 'de')]
+
+
+class FakeFetcher:
+    """
+    Stands in for iter_query_batches(): two articles per query, after
+    `failures[country]` failed attempts of that query.
+    """
+
+    def __init__(self, failures=None):
+        self.failures = dict(failures or {})
+        self.calls = []
+
+    def __call__(self, query_combinations):
+        for params in query_combinations:
+            self.calls.append(params)
+            country = params['country']
+            if self.failures.get(country):
+                self.failures[country] -= 1
+                yield [], {'params': params, 'error': 'boom', 'attempts': 1}
+                continue
+            articles = [
+                {
+                    'url': f'https://example.com/{country}/{i}',
+                    'title': f'{country} headline {i}',
+                    'publishedAt': '2026-01-01T00:00:00Z',
+                    'source': {'name': 'Unknown'},
+                }
+                for i in range(2)
+            ]
+            yield articles, {'params': params, 'error': None, 'attempts': 1}
+
+
+@override_settings(NEWS_INGEST_SLICE_SIZE=2)
+class FanOutIngestionTests(TestCase):
+    """The fan-out chord and the retry of failed queries, run eagerly."""
+
+    def setUp(self):
+        # CELERY_TASK_ALWAYS_EAGER, as the settings set it. Eager errors must not
+        # propagate (the default), or retries would raise instead of re-running.
+        previous = app.conf['CELERY_TASK_ALWAYS_EAGER']
+        app.conf.update(CELERY_TASK_ALWAYS_EAGER=True)
+        self.addCleanup(app.conf.update, CELERY_TASK_ALWAYS_EAGER=previous)
+        resolve = mock.patch('apps.fetch_news.resolve_query_combinations', return_value=COMBINATIONS)
+        resolve.start()
+        self.addCleanup(resolve.stop)
+
+    def fetch_with(self, fetcher):
+        return mock.patch('apps.news.services.iter_query_batches', fetcher)
+
+    def test_chord_ingests_every_slice(self):
+        fetcher = FakeFetcher()
+        with self.fetch_with(fetcher), self.assertLogs('apps.news.tasks', 'INFO') as logs:
+            fetch_latest_news_task(fan_out=True)
+        self.assertEqual(NewsArticle.objects.count(), 10)
+        self.assertEqual(len(fetcher.calls), 5)
+        self.assertIn(
+            "'slices': 3, 'created': 10, 'updated': 0, 'skipped': 0, 'errors': 0, 'calls': 5",
+            '\n'.join(logs.output),
+        )
+
+    def test_failed_queries_are_retried_with_carried_counts(self):
+        fetcher = FakeFetcher(failures={'fr': 1})
+        with self.fetch_with(fetcher), self.assertLogs('apps.news.tasks', 'WARNING'):
+            summary = ingest_headlines_slice_task.apply(args=[COMBINATIONS[:2]]).get()
+        # Only the failed query is fetched again
+        self.assertEqual(fetcher.calls, [{'country': 'us'}, {'country': 'fr'}, {'country': 'fr'}])
+        self.assertEqual(summary, {'created': 4, 'updated': 0, 'skipped': 0, 'errors': 0, 'calls': 3})
+        self.assertEqual(NewsArticle.objects.count(), 4)
+
+    def test_queries_still_failing_after_max_retries_are_reported(self):
+        fetcher = FakeFetcher(failures={'us': 10})
+        with self.fetch_with(fetcher), self.assertLogs('apps.news.tasks', 'WARNING'):
+            summary = ingest_headlines_slice_task.apply(args=[COMBINATIONS[:1]]).get()
+        self.assertEqual(len(fetcher.calls), ingest_headlines_slice_task.max_retries + 1)
+        self.assertEqual(summary['errors'], 1)
+        self.assertEqual(summary['created'], 0)
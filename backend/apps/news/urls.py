@@ -1,8 +1,11 @@
 from django.urls import path
 from .views import (SourceListAPIView, CountryListView, CategoryListView, 
-                    LanguageListView, NewsArticleListView, NewsArticleRetrieveView
-
+                    LanguageListView, NewsArticleListView, NewsArticleRetrieveView,
+                    NewsArticleSuggestView, NewsArticleFacetsView, NewsArticleExportView,
+                    ResponseCacheStatsView
 )
+from .async_views import (AsyncSourceListView, AsyncCountryListView, AsyncCategoryListView,
+                          AsyncLanguageListView, AsyncNewsArticleListView, AsyncNewsArticleRetrieveView)
   
 
 urlpatterns = [
@@ -11,5 +14,17 @@ urlpatterns = [
     path('categories/', CategoryListView.as_view(), name='category-list'),
     path('languages/', LanguageListView.as_view(), name='language-list'),
     path('news/', NewsArticleListView.as_view(), name='newsarticle-list'),
+    path('news/export/', NewsArticleExportView.as_view(), name='newsarticle-export'),
+    path('news/facets/', NewsArticleFacetsView.as_view(), name='newsarticle-facets'),
+    path('news/suggest/', NewsArticleSuggestView.as_view(), name='newsarticle-suggest'),
     path('news/<int:pk>/', NewsArticleRetrieveView.as_view(), name='newsarticle-detail'),
+    path('cache/stats/', ResponseCacheStatsView.as_view(), name='response-cache-stats'),
+
+    # Async (ASGI) variants of the read endpoints
+    path('async/sources/', AsyncSourceListView.as_view(), name='async-source-list'),
+    path('async/countries/', AsyncCountryListView.as_view(), name='async-country-list'),
+    path('async/categories/', AsyncCategoryListView.as_view(), name='async-category-list'),
+    path('async/languages/', AsyncLanguageListView.as_view(), name='async-language-list'),
+    path('async/news/', AsyncNewsArticleListView.as_view(), name='async-newsarticle-list'),
+    path('async/news/<int:pk>/', AsyncNewsArticleRetrieveView.as_view(), name='async-newsarticle-detail'),
 ]
\ No newline at end of file
@@ -1,49 +1,162 @@
 from rest_framework import  status, filters
+from rest_framework.exceptions import APIException, ValidationError
 from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
 from rest_framework.generics import ListAPIView, RetrieveAPIView
+from rest_framework.views import APIView
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
+from django.utils.dateparse import parse_datetime
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.core.cache import cache
+from django.db import connections
+from django.db.models import BooleanField, Case, Count, FloatField, Sum, Value, When
+from django.utils.cache import add_never_cache_headers, patch_cache_control
+from django.views.decorators.http import condition
 from django_filters.rest_framework import DjangoFilterBackend
+from itertools import islice
+import csv
+import hashlib
+import json
+import logging
 
-from .models import NewsArticle, Source, Category, Language, Country
+from .models import ArticleFacetCount, NewsArticle, Source, Category, Language, Country
 from .serializers import (
     NewsArticleListSerializer,
+    NewsArticleListRowSerializer,
     NewsArticleDetailSerializer,
     SourceSerializer,
     CategorySerializer,
     LanguageSerializer,
     CountrySerializer
 )
-from .filters import NewsArticleFilter
-from .pagination import NewsArticlePagination
+from .filters import NewsArticleFilter, FullTextSearchFilter
+from .pagination import NewsArticlePagination, NewsArticleCursorPagination
+from . import response_cache
 
+logger = logging.getLogger(__name__)
+from .facets import FACET_COLUMNS, count_facets
+from .archive import restore_articles
 
-class CategoryListView(ListAPIView):
+
+class ConditionalGetMixin:
+    """
+    Answer GET with 304 Not Modified when the client's If-None-Match /
+    If-Modified-Since still matches the version stamps of `cache_namespaces`,
+    before any query or serialization runs, and add Cache-Control. Responses
+    read right after a change, possibly from a lagging replica, are not cacheable.
+    Without a shared cache the stamps never change, so no validator is sent.
+    """
+    cache_namespaces = ()
+    cache_max_age = None
+
+    def resource_exists(self, request, *args, **kwargs):
+        """Whether the object behind the URL exists; a 304 must never stand in for a 404."""
+        return True
+
+    def get(self, request, *args, **kwargs):
+        if not response_cache.versions_settled(self.cache_namespaces):
+            response = super().get(request, *args, **kwargs)
+            add_never_cache_headers(response)
+            return response
+        conditional = 'HTTP_IF_NONE_MATCH' in request.META or 'HTTP_IF_MODIFIED_SINCE' in request.META
+        if not response_cache.is_shared() or (conditional and not self.resource_exists(request, *args, **kwargs)):
+            response = super().get(request, *args, **kwargs)
+            patch_cache_control(response, public=True, max_age=self.cache_max_age)
+            return response
+        view = condition(
+            etag_func=lambda request, *args, **kwargs: response_cache.version_etag(self.cache_namespaces),
+            last_modified_func=lambda request, *args, **kwargs: response_cache.version_last_modified(self.cache_namespaces),
+        )(super().get)
+        response = view(request, *args, **kwargs)
+        patch_cache_control(response, public=True, max_age=self.cache_max_age)
+        return response
+
+
+class SparseFieldsMixin:
+    """
+    ?fields= / ?exclude= projection (comma-separated output field names).
+
+    Unrequested fields are dropped from the serializer and pushed down to the
+    query: only() keeps the columns of the requested fields (`projection_columns`)
+    and select_related() keeps the joins they need (`projection_relations`), so
+    nothing else is read from the database.
+    """
+    projection_columns = {}
+    projection_relations = {}
+
+    def get_requested_fields(self):
+        """Requested output fields in serializer order; raises ValidationError on unknown names."""
+        if not hasattr(self, '_requested_fields'):
+            available = list(self.projection_columns)
+            params = self.request.query_params
+            fields = [name.strip() for name in params.get('fields', '').split(',') if name.strip()]
+            exclude = [name.strip() for name in params.get('exclude', '').split(',') if name.strip()]
+            unknown = set(fields + exclude) - set(available)
+            if unknown:
+                raise ValidationError({'fields': f"Unknown field(s): {', '.join(sorted(unknown))}. "
+                                                 f"Available: {', '.join(available)}"})
+            self._requested_fields = [
+                name for name in available if (not fields or name in fields) and name not in exclude
+            ]
+        return self._requested_fields
+
+    def project_queryset(self, queryset, extra_columns=()):
+        """Restrict the queryset to the columns and joins of the requested fields."""
+        fields = self.get_requested_fields()
+        columns = ['id', *extra_columns]
+        relations = []
+        for field in fields:
+            columns.extend(self.projection_columns[field])
+            relations.extend(self.projection_relations.get(field, ()))
+        queryset = queryset.select_related(None)
+        if relations:
+            queryset = queryset.select_related(*dict.fromkeys(relations))
+        return queryset.only(*dict.fromkeys(columns))
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['fields'] = self.get_requested_fields()
+        return context
+
+
+class CategoryListView(ConditionalGetMixin, ListAPIView):
     """ViewSet for Category model (Read-only)"""
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
+    cache_namespaces = (response_cache.REFERENCES,)
+    cache_max_age = settings.NEWS_REFERENCE_CACHE_MAX_AGE
 
 
-class LanguageListView(ListAPIView):
+class LanguageListView(ConditionalGetMixin, ListAPIView):
     """ViewSet for Language model (Read-only)"""
     queryset = Language.objects.all()
     serializer_class = LanguageSerializer
+    cache_namespaces = (response_cache.REFERENCES,)
+    cache_max_age = settings.NEWS_REFERENCE_CACHE_MAX_AGE
 
 
-class CountryListView(ListAPIView):
+class CountryListView(ConditionalGetMixin, ListAPIView):
     """ViewSet for Country model (Read-only)"""
     queryset = Country.objects.all()
     serializer_class = CountrySerializer
+    cache_namespaces = (response_cache.REFERENCES,)
+    cache_max_age = settings.NEWS_REFERENCE_CACHE_MAX_AGE
 
 
-class SourceListAPIView(ListAPIView):
+class SourceListAPIView(ConditionalGetMixin, ListAPIView):
     """
-    List all sources with optional filtering by category, language, country
+    List all active sources with optional filtering by category, language, country
     """
-    queryset = Source.objects.select_related('category', 'language', 'country').all()
+    queryset = Source.objects.select_related('category', 'language', 'country').filter(is_active=True)
     serializer_class = SourceSerializer
-   
+    cache_namespaces = (response_cache.SOURCES, response_cache.REFERENCES)
+    cache_max_age = settings.NEWS_REFERENCE_CACHE_MAX_AGE
 
 
-class NewsArticleListView(ListAPIView):
+class NewsArticleListView(SparseFieldsMixin, ConditionalGetMixin, ListAPIView):
     """
     List all news articles with filtering, search, and ordering.
     Supports query params:
@@ -51,47 +164,379 @@ class NewsArticleListView(ListAPIView):
     - country: Filter by country ID
     - source: Filter by source ID
     - title: Search in title
+    - q: Full-text search over title, description and content, ranked by relevance
     - ordering: Sort by field (e.g., -published_at)
+    - pagination=cursor / cursor: Keyset pagination without counts
+    - fields / exclude: Comma-separated output fields to keep / drop
     """
     queryset = NewsArticle.objects.select_related(
         'source', 'category', 'language', 'country'
-    ).all()
+    ).defer('content', 'search_vector')
+    projection_columns = NewsArticleListSerializer.field_columns
+    projection_relations = {
+        'source': ['source'],
+        'category_name': ['category'],
+        'country_name': ['country'],
+        'language_name': ['language'],
+    }
     serializer_class = NewsArticleListSerializer
-    filter_backends = [DjangoFilterBackend, filters.OrderingFilter, filters.SearchFilter]
+    filter_backends = [DjangoFilterBackend, filters.OrderingFilter, filters.SearchFilter, FullTextSearchFilter]
     filterset_class = NewsArticleFilter
     pagination_class = NewsArticlePagination
     search_fields = ['title']
     ordering_fields = ['published_at', 'created_at', 'title']
     ordering = ['-published_at']
 
+    @property
+    def paginator(self):
+        """Page-number pagination by default, keyset pagination when requested."""
+        if not hasattr(self, '_paginator'):
+            if NewsArticleCursorPagination.is_requested(self.request):
+                self._paginator = NewsArticleCursorPagination()
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
+
+    # Article rows embed source names, so both namespaces version the cached pages
+    cache_namespaces = (response_cache.ARTICLES, response_cache.SOURCES)
+    cache_max_age = settings.NEWS_ARTICLE_CACHE_MAX_AGE
+
+    def serialize_articles(self, articles):
+        """Serialize model instances, or values() rows in fast-list mode."""
+        if 'description' in self.get_requested_fields():
+            restore_articles(articles, ('description',))
+        if settings.NEWS_ARTICLE_FAST_LIST:
+            return NewsArticleListRowSerializer(articles, self.get_requested_fields()).data
+        return self.get_serializer(articles, many=True).data
 
     def list(self, request, *args, **kwargs):
-        try:
-            queryset = self.get_queryset()
+        """Serve repeated queries from the response cache (X-Cache: HIT/MISS)."""
+        if not response_cache.is_enabled() or not response_cache.versions_settled(self.cache_namespaces):
+            return self.list_uncached(request, *args, **kwargs)
+
+        cache_key = response_cache.response_cache_key(request, self.cache_namespaces)
+        data = response_cache.get_cached_response(cache_key)
+        if data is not None:
+            response = Response(data)
+            response['X-Cache'] = 'HIT'
+            return response
+
+        response = self.list_uncached(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            response_cache.set_cached_response(cache_key, response.data)
+        response['X-Cache'] = 'MISS'
+        return response
 
-            # Apply ordering filters
-            queryset = self.filter_queryset(queryset)
+    def get_list_queryset(self):
+        """
+        Filtered and ordered articles, restricted to the requested fields:
+        values() rows in fast-list mode, model instances otherwise.
+        """
+        queryset = self.get_queryset()
+
+        # Apply ordering filters
+        queryset = self.filter_queryset(queryset)
+
+        # Read only the requested fields, plus the ordering columns keyset pagination reads back.
+        # Annotations such as search_rank stay on model instances, but values() rows need them named.
+        ordering = [name.lstrip('-') for name in queryset.query.order_by]
+        ordering_columns = [name for name in ordering if name in self.ordering_fields]
+        if settings.NEWS_ARTICLE_FAST_LIST:
+            annotations = [name for name in ordering if name in queryset.query.annotations]
+            return NewsArticleListRowSerializer.values(
+                queryset, self.get_requested_fields(), [*ordering_columns, *annotations]
+            )
+        return self.project_queryset(queryset, ordering_columns)
+
+    def list_uncached(self, request, *args, **kwargs):
+        try:
+            queryset = self.get_list_queryset()
 
             page = self.paginate_queryset(queryset)
             if page is not None:
-                serializer = self.get_serializer(page, many=True)
-                return self.get_paginated_response(serializer.data)
+                return self.get_paginated_response(self.serialize_articles(page))
 
-            serializer = self.get_serializer(queryset, many=True)
+            data = self.serialize_articles(queryset)
             return Response({
-                'count': serializer.data.__len__(),
-                'results': serializer.data
+                'count': data.__len__(),
+                'results': data
             })
 
+        except APIException:
+            # Client errors such as an invalid page or cursor keep their status code
+            raise
         except Exception as e:
             return Response({'error': 'An error occurred while fetching articles.'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
-class NewsArticleRetrieveView(RetrieveAPIView):
+class NewsArticleFacetsView(ConditionalGetMixin, ListAPIView):
+    """
+    Article counts per category, country, language and source for the current filters.
+    Supports the filter params of NewsArticleListView; each facet is counted
+    under the filters of the other facets. Counts come from the ArticleFacetCount
+    rollup unless the request also searches (q / search) or restricts the
+    publication date, which needs the article table.
+    """
+    queryset = NewsArticle.objects.all()
+    filterset_class = NewsArticleFilter
+    pagination_class = None
+    search_fields = ['title']
+    article_search_backends = [filters.SearchFilter, FullTextSearchFilter]
+    article_search_params = ['q', filters.SearchFilter.search_param]
+    article_range_params = ['published_after', 'published_before']
+    cache_namespaces = (response_cache.ARTICLES, response_cache.SOURCES)
+    cache_max_age = settings.NEWS_ARTICLE_CACHE_MAX_AGE
+
+    def list(self, request, *args, **kwargs):
+        params = request.query_params
+        ranges = {name: params[name] for name in self.article_range_params if params.get(name, '').strip()}
+        from_articles = bool(ranges) or any(params.get(name, '').strip() for name in self.article_search_params)
+        if from_articles:
+            base = self.get_queryset()
+            for backend in self.article_search_backends:
+                base = backend().filter_queryset(request, base, self)
+            if ranges:
+                filterset = self.filterset_class(ranges, queryset=base)
+                if not filterset.is_valid():
+                    raise ValidationError(filterset.errors)
+                base = filterset.qs
+            count_expression = Count('id')
+        else:
+            base = ArticleFacetCount.objects.all()
+            count_expression = Sum('count')
+
+        def queryset_for(facet):
+            data = {name: params[name] for name in FACET_COLUMNS if name != facet and params.get(name)}
+            return self.filterset_class(data, queryset=base).qs
+
+        payload = count_facets(queryset_for, count_expression)
+        payload['computed_from'] = 'articles' if from_articles else 'rollup'
+        return Response(payload)
+
+
+class Echo:
+    """File-like object whose write() hands the line back, for csv.writer over a stream."""
+
+    def write(self, value):
+        return value
+
+
+async def iterate_in_thread(iterator):
+    """
+    Async iterator over a sync one, advanced one item at a time in the thread
+    that runs sync code (thread_sensitive), where its database connection lives.
+    """
+    done = object()
+    while True:
+        item = await sync_to_async(next, thread_sensitive=True)(iterator, done)
+        if item is done:
+            return
+        yield item
+
+
+class NewsArticleExportView(SparseFieldsMixin, ListAPIView):
+    """
+    Stream every article matching the filters as NDJSON or CSV.
+    Supports the filter, search and fields/exclude params of NewsArticleListView, plus:
+    - output: ndjson (default) or csv
+    - since_id: Only articles with a greater id (resume from the last exported id)
+    - since: Only articles stored after this ISO 8601 datetime
+    Rows are read from a server-side cursor in id order and serialized chunk by
+    chunk, so memory stays flat whatever the size of the export, under WSGI and
+    ASGI alike.
+    """
+    queryset = NewsArticle.objects.all()
+    filter_backends = [DjangoFilterBackend, filters.SearchFilter, FullTextSearchFilter]
+    filterset_class = NewsArticleFilter
+    pagination_class = None
+    search_fields = ['title']
+    projection_columns = NewsArticleListView.projection_columns
+    content_types = {'ndjson': 'application/x-ndjson', 'csv': 'text/csv'}
+
+    def list(self, request, *args, **kwargs):
+        output = request.query_params.get('output', 'ndjson')
+        if output not in self.content_types:
+            raise ValidationError({'output': f"Expected one of: {', '.join(self.content_types)}"})
+
+        queryset = self.filter_queryset(self.get_queryset()).filter(**self.get_watermark())
+        # The id is always exported so that a client can resume with since_id
+        fields = self.get_requested_fields()
+        if 'id' not in fields:
+            fields = ['id', *fields]
+        rows = NewsArticleListRowSerializer.values(queryset.order_by('id'), fields).iterator(
+            chunk_size=settings.NEWS_EXPORT_CHUNK_SIZE
+        )
+
+        stream = self.stream_csv(rows, fields) if output == 'csv' else self.stream_ndjson(rows, fields)
+        if isinstance(request._request, ASGIRequest):
+            # An ASGI response consumes a sync iterator whole before sending anything
+            stream = iterate_in_thread(stream)
+        response = StreamingHttpResponse(stream, content_type=self.content_types[output])
+        response['Content-Disposition'] = f'attachment; filename="news-export.{output}"'
+        return response
+
+    def get_watermark(self):
+        """Lookups resuming the export after a since_id / since watermark."""
+        params = self.request.query_params
+        lookups = {}
+        if params.get('since_id'):
+            try:
+                lookups['id__gt'] = int(params['since_id'])
+            except ValueError:
+                raise ValidationError({'since_id': 'Expected an integer article id.'})
+        if params.get('since'):
+            since = parse_datetime(params['since'])
+            if since is None:
+                raise ValidationError({'since': 'Expected an ISO 8601 datetime.'})
+            lookups['created_at__gt'] = since
+        return lookups
+
+    def serialized_chunks(self, rows, fields):
+        """Serialize the row iterator one chunk at a time."""
+        while True:
+            chunk = list(islice(rows, settings.NEWS_EXPORT_CHUNK_SIZE))
+            if not chunk:
+                return
+            if 'description' in fields:
+                restore_articles(chunk, ('description',))
+            yield NewsArticleListRowSerializer(chunk, fields).data
+
+    def stream_ndjson(self, rows, fields):
+        for articles in self.serialized_chunks(rows, fields):
+            yield ''.join(json.dumps(article, cls=JSONEncoder) + '\n' for article in articles)
+
+    def stream_csv(self, rows, fields):
+        # The nested source is flattened into one column per attribute
+        columns = []
+        for field in fields:
+            columns.extend(['source.id', 'source.source_id', 'source.name'] if field == 'source' else [field])
+        writer = csv.writer(Echo())
+        yield writer.writerow(columns)
+        for articles in self.serialized_chunks(rows, fields):
+            lines = []
+            for article in articles:
+                source = article.get('source') or {}
+                article = {**article, 'source.id': source.get('id'), 'source.source_id': source.get('source_id'),
+                           'source.name': source.get('name')}
+                lines.append(writer.writerow([article.get(column) for column in columns]))
+            yield ''.join(lines)
+
+
+class ResponseCacheStatsView(APIView):
+    """
+    Hit/miss counters and current data versions of the article list response cache
+    """
+
+    def get(self, request, *args, **kwargs):
+        return Response(response_cache.cache_stats())
+
+
+class NewsArticleRetrieveView(SparseFieldsMixin, ConditionalGetMixin, RetrieveAPIView):
     """
     Retrieve single article by ID
+    Supports query params:
+    - fields / exclude: Comma-separated output fields to keep / drop
     """
-    queryset = NewsArticle.objects.select_related(
-        'source', 'category', 'language', 'country'
-    ).all()
-    serializer_class = NewsArticleDetailSerializer
\ No newline at end of file
+    queryset = NewsArticle.objects.all()
+    serializer_class = NewsArticleDetailSerializer
+    cache_namespaces = (response_cache.ARTICLES, response_cache.SOURCES)
+    cache_max_age = settings.NEWS_ARTICLE_CACHE_MAX_AGE
+    projection_columns = NewsArticleDetailSerializer.field_columns
+    projection_relations = {
+        'source': ['source__category', 'source__language', 'source__country'],
+        'category': ['category'],
+        'language': ['language'],
+        'country': ['country'],
+    }
+
+    def get_queryset(self):
+        return self.project_queryset(super().get_queryset())
+
+    def get_object(self):
+        """The article, with its description restored if it was archived."""
+        return restore_articles([super().get_object()], ('description',))[0]
+
+    def resource_exists(self, request, *args, **kwargs):
+        # The version stamps say nothing about one article: it may never have existed or been deleted
+        return self.queryset.filter(pk=kwargs['pk']).exists()
+
+
+class NewsArticleSuggestView(APIView):
+    """
+    Typeahead suggestions for article titles and source names.
+    Supports query params:
+    - q: Typed prefix (at least 2 characters)
+    - limit: Suggestions per group (default 8, max 20)
+    Matches come from the pg_trgm GIN indexes (word similarity), prefix
+    matches ranked first, and are cached per prefix. Without the pg_trgm
+    extension only prefix matches are suggested.
+    """
+    min_length = 2
+    default_limit = 8
+    max_limit = 20
+
+    def get(self, request, *args, **kwargs):
+        prefix = ' '.join(request.query_params.get('q', '').split()).lower()
+        try:
+            limit = min(max(int(request.query_params.get('limit', self.default_limit)), 1), self.max_limit)
+        except ValueError:
+            limit = self.default_limit
+
+        if len(prefix) < self.min_length:
+            return Response({'q': prefix, 'titles': [], 'sources': []})
+
+        # Hashed: the prefix is free user text, spaces included
+        cache_key = f"news:suggest:{limit}:{hashlib.md5(prefix.encode()).hexdigest()}"
+        payload = cache.get(cache_key)
+        if payload is None:
+            payload = {
+                'q': prefix,
+                'titles': self.suggest_titles(prefix, limit),
+                'sources': self.suggest_sources(prefix, limit),
+            }
+            cache.set(cache_key, payload, settings.NEWS_SUGGEST_CACHE_TIMEOUT)
+
+        response = Response(payload)
+        patch_cache_control(response, public=True, max_age=settings.NEWS_SUGGEST_CACHE_TIMEOUT)
+        return response
+
+    @staticmethod
+    def trigram_available(using):
+        """Whether the database has the pg_trgm operators (migration 0008 installs the extension)."""
+        connection = connections[using]
+        if connection.vendor != 'postgresql':
+            return False
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')")
+            return cursor.fetchone()[0]
+
+    def ranked(self, queryset, field, prefix):
+        """
+        Rows whose `field` word-matches the prefix, prefix matches first.
+        Only the trigram operator is in the WHERE clause: istartswith compiles
+        to UPPER(field) LIKE, which the GIN index on the raw column cannot serve.
+        """
+        if not self.trigram_available(queryset.db):
+            logger.warning("pg_trgm is not installed: suggesting prefix matches only")
+            return queryset.filter(**{f'{field}__istartswith': prefix}).annotate(
+                is_prefix=Value(True, output_field=BooleanField()),
+                similarity=Value(1.0, output_field=FloatField()),
+            )
+        return queryset.filter(**{f'{field}__trigram_word_similar': prefix}).annotate(
+            is_prefix=Case(
+                When(**{f'{field}__istartswith': prefix}, then=Value(True)),
+                default=Value(False),
+                output_field=BooleanField(),
+            ),
+            similarity=TrigramWordSimilarity(prefix, field),
+        )
+
+    def suggest_titles(self, prefix, limit):
+        queryset = self.ranked(NewsArticle.objects.all(), 'title', prefix)
+        queryset = queryset.order_by('-is_prefix', '-similarity', '-published_at')
+        return list(queryset.values('id', 'title')[:limit])
+
+    def suggest_sources(self, prefix, limit):
+        queryset = self.ranked(Source.objects.filter(is_active=True), 'name', prefix)
+        queryset = queryset.order_by('-is_prefix', '-similarity', 'name')
+        return list(queryset.values('id', 'source_id', 'name')[:limit])
@@ -0,0 +1,186 @@
+from newsapi import NewsApiClient
+from email.utils import parsedate_to_datetime
+from contextlib import contextmanager
+from datetime import datetime, timezone
+import os
+import random
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from django.conf import settings
+from .news_api_quota import QuotaExceeded, get_quota_ledger
+import logging
+
+logger = logging.getLogger(__name__)
+
+NEWS_API_ORIGIN = 'https://newsapi.org'
+
+
+class NewsApiSession(requests.Session):
+    """
+    Pooled keep-alive session used for every NewsAPI call.
+
+    Adds what NewsApiClient lacks: a configurable timeout, gzip negotiation,
+    retries with jittered exponential backoff (honoring Retry-After) and
+    per-call latency/byte accounting. Requests aimed at https://newsapi.org
+    are redirected to `base_url`, which lets a local stub server stand in.
+    Every attempt, retries included, is charged to the optional `quota` ledger.
+    """
+
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+    def __init__(self, base_url=None, timeout=10, max_retries=3, backoff_base=0.5,
+                 backoff_max=30, pool_size=10, quota=None):
+        super().__init__()
+        self.quota = quota
+        self.base_url = (base_url or NEWS_API_ORIGIN).rstrip('/')
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.mount('https://', adapter)
+        self.mount('http://', adapter)
+        self.headers.update({'Accept-Encoding': 'gzip, deflate', 'Connection': 'keep-alive'})
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._totals = {'calls': 0, 'attempts': 0, 'bytes': 0, 'wire_bytes': 0, 'elapsed': 0.0}
+
+    @contextmanager
+    def override_timeout(self, timeout):
+        """Use a different timeout for calls made by the current thread."""
+        previous = getattr(self._local, 'timeout', None)
+        self._local.timeout = timeout
+        try:
+            yield self
+        finally:
+            self._local.timeout = previous
+
+    def last_call(self):
+        """Stats of the most recent call made by the current thread, or None."""
+        return getattr(self._local, 'last_call', None)
+
+    def stats(self):
+        """Snapshot of the cumulative counters for this session."""
+        with self._lock:
+            return dict(self._totals)
+
+    def request(self, method, url, **kwargs):
+        if url.startswith(NEWS_API_ORIGIN) and self.base_url != NEWS_API_ORIGIN:
+            url = self.base_url + url[len(NEWS_API_ORIGIN):]
+        kwargs['timeout'] = getattr(self._local, 'timeout', None) or self.timeout
+        # A call that raises before being recorded must not report the previous call's stats
+        self._local.last_call = None
+
+        started = time.perf_counter()
+        attempt = 0
+        while True:
+            attempt += 1
+            if self.quota is not None:
+                try:
+                    self.quota.acquire()
+                except QuotaExceeded:
+                    self._record(started, attempt - 1, None)
+                    raise
+            try:
+                response = super().request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt > self.max_retries:
+                    self._record(started, attempt, None)
+                    raise
+                delay = self._backoff(attempt)
+                logger.warning(f"NewsAPI request failed ({e}), retry {attempt} in {delay:.2f}s")
+            else:
+                if response.status_code not in self.RETRY_STATUSES or attempt > self.max_retries:
+                    self._record(started, attempt, response)
+                    return response
+                delay = self._retry_after(response)
+                if delay is None:
+                    delay = self._backoff(attempt)
+                logger.warning(f"NewsAPI returned {response.status_code}, retry {attempt} in {delay:.2f}s")
+                response.close()
+            time.sleep(delay)
+
+    def _backoff(self, attempt):
+        """Full-jitter exponential backoff for the given attempt number."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))
+
+    def _retry_after(self, response):
+        """Seconds to wait according to a Retry-After header, capped at backoff_max."""
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+        try:
+            delay = float(value)
+        except ValueError:
+            try:
+                delay = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+            except (TypeError, ValueError):
+                return None
+        return min(max(delay, 0), self.backoff_max)
+
+    def _record(self, started, attempts, response):
+        """Store per-call stats for the current thread and update the totals."""
+        size = len(response.content) if response is not None else 0
+        wire_size = size
+        if response is not None and response.raw is not None:
+            wire_size = response.raw.tell() or int(response.headers.get('Content-Length') or size)
+
+        call = {
+            'elapsed': round(time.perf_counter() - started, 4),
+            'attempts': attempts,
+            'status': response.status_code if response is not None else None,
+            'bytes': size,
+            'wire_bytes': wire_size,
+        }
+        self._local.last_call = call
+        with self._lock:
+            self._totals['calls'] += 1
+            self._totals['attempts'] += attempts
+            self._totals['bytes'] += size
+            self._totals['wire_bytes'] += wire_size
+            self._totals['elapsed'] += call['elapsed']
+
+
+_session = None
+_session_pid = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """
+    Return the process-wide NewsAPI session, creating it on first use.
+    A forked worker (e.g. Celery prefork) gets its own session instead of
+    sharing the parent's sockets.
+    """
+    global _session, _session_pid
+    with _session_lock:
+        if _session is None or _session_pid != os.getpid():
+            _session = NewsApiSession(
+                base_url=settings.NEWS_API_BASE_URL,
+                timeout=settings.NEWS_API_TIMEOUT,
+                max_retries=settings.NEWS_API_MAX_RETRIES,
+                backoff_base=settings.NEWS_API_BACKOFF_BASE,
+                backoff_max=settings.NEWS_API_BACKOFF_MAX,
+                pool_size=settings.NEWS_API_POOL_SIZE,
+                quota=get_quota_ledger(),
+            )
+            _session_pid = os.getpid()
+        return _session
+
+
+def reset_session():
+    """Close and drop the process-wide session (e.g. after a settings change)."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = None
+
+
+def get_news_api_client():
+    """NewsApiClient bound to the shared pooled session."""
+    return NewsApiClient(api_key=os.getenv("NEWS_API_KEY"), session=get_session())
@@ -0,0 +1,142 @@
+from datetime import datetime, timezone
+import time
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Cache backends whose counters live in a single process
+PROCESS_LOCAL_CACHES = (LocMemCache, DummyCache)
+
+_warned_process_local = False
+
+
+class QuotaExceeded(Exception):
+    """Raised when a NewsAPI call would exceed the shared budget."""
+
+
+class QuotaLedger:
+    """
+    NewsAPI call budget shared by every process through a Django cache backend.
+
+    The daily budget is a counter per UTC day. The burst limit is a counter per
+    wall-clock second. Both rely on the cache's atomic incr(), so any
+    backend shared between Celery workers (Redis, Memcached, database) works.
+    With a process-local backend (LocMem, the fallback when REDIS_URL is unset)
+    each process counts its own calls only, so the limits hold per process.
+    A limit of 0 disables that check.
+    """
+
+    KEY_PREFIX = 'newsapi:quota'
+
+    def __init__(self, daily_limit=None, per_second=None, cache_alias=None):
+        self.daily_limit = settings.NEWS_API_DAILY_QUOTA if daily_limit is None else daily_limit
+        self.per_second = settings.NEWS_API_QUOTA_PER_SECOND if per_second is None else per_second
+        self.cache = caches[cache_alias or settings.NEWS_API_QUOTA_CACHE]
+        self._warn_if_process_local()
+
+    def _warn_if_process_local(self):
+        global _warned_process_local
+        if _warned_process_local or not isinstance(self.cache, PROCESS_LOCAL_CACHES):
+            return
+        _warned_process_local = True
+        if self.daily_limit or self.per_second:
+            logger.warning(f"NewsAPI quota ledger uses a process-local {type(self.cache).__name__}: "
+                           f"limits are enforced per process, not across workers. Set REDIS_URL "
+                           f"(or NEWS_API_QUOTA_CACHE) to share them.")
+
+    @property
+    def is_shared(self):
+        """Whether every process reads and updates the same counters."""
+        return not isinstance(self.cache, PROCESS_LOCAL_CACHES)
+
+    def _day_key(self):
+        return f"{self.KEY_PREFIX}:day:{datetime.now(timezone.utc):%Y%m%d}"
+
+    def _incr(self, key, amount, timeout):
+        """Atomically add `amount` to a counter, creating it when missing."""
+        self.cache.add(key, 0, timeout=timeout)
+        try:
+            return self.cache.incr(key, amount)
+        except ValueError:
+            # The key expired between add() and incr()
+            self.cache.add(key, 0, timeout=timeout)
+            return self.cache.incr(key, amount)
+
+    def spent_today(self):
+        """Number of calls recorded for the current UTC day."""
+        return self.cache.get(self._day_key(), 0)
+
+    def remaining(self):
+        """Calls left today, or None when there is no daily limit."""
+        if not self.daily_limit:
+            return None
+        return max(self.daily_limit - self.spent_today(), 0)
+
+    def acquire(self, calls=1, wait=True):
+        """
+        Reserve budget for `calls` requests.
+
+        Args:
+            calls (int): Number of requests about to be made
+            wait (bool): Sleep until the next second when the burst limit is hit,
+                instead of raising
+
+        Raises:
+            QuotaExceeded: When the daily budget (or, without wait, the burst limit) is spent
+        """
+        if self.daily_limit:
+            key = self._day_key()
+            spent = self._incr(key, calls, timeout=60 * 60 * 48)
+            if spent > self.daily_limit:
+                self.cache.decr(key, calls)
+                raise QuotaExceeded(f"NewsAPI daily quota of {self.daily_limit} calls exhausted")
+
+        if self.per_second:
+            while True:
+                now = time.time()
+                second = int(now)
+                used = self._incr(f"{self.KEY_PREFIX}:second:{second}", calls, timeout=5)
+                if used <= self.per_second:
+                    break
+                if not wait:
+                    raise QuotaExceeded(f"NewsAPI burst limit of {self.per_second} calls/s reached")
+                time.sleep(second + 1 - now)
+
+    def trim(self, query_combinations, calls_per_query=1):
+        """
+        Drop the combinations that today's remaining budget cannot cover.
+
+        Each combination is budgeted `calls_per_query` calls, its first page by
+        default: later pages are metered one by one by acquire() and stop at
+        QuotaExceeded without losing the pages already fetched, and the
+        known-URL early stop usually ends a query after its first page anyway.
+
+        Returns:
+            list: The leading combinations that fit in the budget
+        """
+        remaining = self.remaining()
+        calls_per_query = max(calls_per_query, 1)
+        if remaining is None or len(query_combinations) * calls_per_query <= remaining:
+            return query_combinations
+
+        fitting = remaining // calls_per_query
+        logger.warning(f"NewsAPI budget low ({remaining} calls left, {calls_per_query} per query), "
+                       f"trimming {len(query_combinations)} query combinations to {fitting}")
+        return query_combinations[:fitting]
+
+    def snapshot(self):
+        """Current budget state, for logs and task results."""
+        return {
+            'spent_today': self.spent_today(),
+            'daily_limit': self.daily_limit,
+            'remaining': self.remaining(),
+        }
+
+
+def get_quota_ledger():
+    """Ledger configured from settings."""
+    return QuotaLedger()
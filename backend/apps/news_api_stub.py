@@ -0,0 +1,187 @@
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlparse, parse_qs
+import gzip
+import json
+import random
+import threading
+import time
+from .news.models import Category, Language, Country
+
+
+class NewsApiStub:
+    """
+    Offline stand-in for the NewsAPI /v2/sources and /v2/top-headlines endpoints.
+
+    Serves either recorded fixtures ({"sources": [...], "articles": [...]}) or
+    deterministic synthetic data, with configurable latency, error rate and
+    payload size. Point NEWS_API_BASE_URL at `base_url` to use it.
+    """
+
+    def __init__(self, host='127.0.0.1', port=0, latency=0.0, error_rate=0.0, payload_bytes=500,
+                 sources_count=40, results_per_query=150, fixtures=None, seed=42):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.payload_bytes = payload_bytes
+        self.results_per_query = results_per_query
+        self.random = random.Random(seed)
+        self.requests = 0
+        self.connections = 0
+        # Scripted (status, headers) answers served before any real response
+        self._failures = []
+        self._lock = threading.Lock()
+
+        if fixtures:
+            with open(fixtures) as f:
+                data = json.load(f)
+            self.sources = data.get('sources', [])
+            self.recorded_articles = data.get('articles', [])
+        else:
+            self.sources = self._synthetic_sources(sources_count)
+            self.recorded_articles = None
+
+        self.server = ThreadingHTTPServer((host, port), self._handler_class())
+        self.server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Serve from a background thread."""
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def fail_next(self, status, count=1, retry_after=None):
+        """Answer the next `count` requests with `status` (and an optional Retry-After)."""
+        headers = {'Retry-After': str(retry_after)} if retry_after is not None else {}
+        with self._lock:
+            self._failures.extend([(status, headers)] * count)
+
+    def _synthetic_sources(self, count):
+        categories = [name for name, _ in Category.CATEGORY_CHOICES]
+        languages = [code for code, _ in Language.LANGUAGE_CHOICES]
+        countries = [code for code, _ in Country.COUNTRY_CHOICES]
+        return [
+            {
+                'id': f'stub-source-{i}',
+                'name': f'Stub Source {i}',
+                'description': f'Synthetic source number {i}',
+                'url': f'https://stub-source-{i}.example.com',
+                'category': categories[i % len(categories)],
+                'language': languages[i % len(languages)],
+                'country': countries[i % len(countries)],
+            }
+            for i in range(count)
+        ]
+
+    def _matching_sources(self, params):
+        sources = self.sources
+        if params.get('sources'):
+            wanted = set(params['sources'].split(','))
+            return [source for source in sources if source['id'] in wanted]
+        for key in ('country', 'category'):
+            if params.get(key):
+                sources = [source for source in sources if source.get(key) == params[key]]
+        return sources or self.sources
+
+    def _query_articles(self, params):
+        """Full, deterministic result set for one query."""
+        if self.recorded_articles is not None:
+            return self.recorded_articles
+
+        key = '-'.join(params.get(name, '') for name in ('country', 'category', 'sources')) or 'all'
+        sources = self._matching_sources(params)
+        filler = 'x' * self.payload_bytes
+        published = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        articles = []
+        for i in range(self.results_per_query):
+            source = sources[i % len(sources)]
+            articles.append({
+                'source': {'id': source['id'], 'name': source['name']},
+                'author': 'Stub Author',
+                'title': f'Stub headline {key} #{i}',
+                'description': filler[:self.payload_bytes // 4],
+                'url': f'https://stub.example.com/{key}/{i}',
+                'urlToImage': f'https://stub.example.com/{key}/{i}.jpg',
+                'publishedAt': (published + timedelta(minutes=i)).strftime('%Y-%m-%dT%H:%M:%SZ'),
+                'content': filler,
+            })
+        return articles
+
+    def respond(self, path, params):
+        """Return (status, payload, headers) for a request path and query parameters."""
+        with self._lock:
+            self.requests += 1
+            scripted = self._failures.pop(0) if self._failures else None
+            failed = scripted is None and self.random.random() < self.error_rate
+        if scripted is not None:
+            status, headers = scripted
+            return status, {'status': 'error', 'code': 'scriptedFailure', 'message': 'Stub failure'}, headers
+        if failed:
+            return 500, {'status': 'error', 'code': 'unexpectedError', 'message': 'Stub failure'}, {}
+
+        if path.endswith('/sources'):
+            return 200, {'status': 'ok', 'sources': self.sources}, {}
+
+        if path.endswith('/top-headlines'):
+            articles = self._query_articles(params)
+            page_size = int(params.get('pageSize', 20))
+            page = int(params.get('page', 1))
+            start = (page - 1) * page_size
+            return 200, {
+                'status': 'ok',
+                'totalResults': len(articles),
+                'articles': articles[start:start + page_size],
+            }, {}
+
+        return 404, {'status': 'error', 'code': 'notFound', 'message': f'Unknown endpoint {path}'}, {}
+
+    def _handler_class(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def setup(self):
+                super().setup()
+                # One handler per TCP connection; keep-alive requests reuse it
+                with stub._lock:
+                    stub.connections += 1
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                if stub.latency:
+                    time.sleep(stub.latency)
+                url = urlparse(self.path)
+                params = {key: values[0] for key, values in parse_qs(url.query).items()}
+                status, payload, headers = stub.respond(url.path, params)
+
+                body = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                if 'gzip' in self.headers.get('Accept-Encoding', ''):
+                    body = gzip.compress(body)
+                    self.send_header('Content-Encoding', 'gzip')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
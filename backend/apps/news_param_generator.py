@@ -1,6 +1,10 @@
+from django.conf import settings
 from .news.models import Country, Category
 import random
 
+# NewsAPI accepts up to 20 comma-separated source IDs per call
+MAX_SOURCES_PER_CALL = 20
+
 
 def sample_filters(countries_count=None, categories_count=None):
     """
@@ -74,3 +78,52 @@ def build_query_combinations(countries=None, categories=None, sources=None):
             })
     
     return combinations
+
+
+def plan_query_combinations(countries=None, categories=None, sources=None, page_size=None, max_pages=None):
+    """
+    Plan the fewest NewsAPI calls covering the same filters as build_query_combinations().
+    
+    - A country requested with every category gets a single country-only call
+      instead of one call per category, when that call may follow at least as
+      many pages as the per-category calls it replaces (max_pages >= number of
+      categories). Otherwise folding would fetch fewer articles.
+    - Source IDs are batched into comma-separated groups of MAX_SOURCES_PER_CALL.
+    
+    Args:
+        countries (list): Specific country codes (e.g., ['us', 'fr'])
+        categories (list): Specific category names (e.g., ['business', 'technology'])
+        sources (list): Specific source IDs (e.g., ['bbc-news'])
+        page_size (int): Articles requested per call (defaults to NEWS_API_PAGE_SIZE)
+        max_pages (int): Pages followed per call (defaults to NEWS_API_MAX_PAGES)
+    
+    Returns:
+        dict: {'combinations': [...], 'min_calls': int, 'max_calls': int, 'estimated_articles': int}
+        where min_calls counts first pages only (what QuotaLedger.trim() budgets),
+        max_calls every page up to max_pages, and estimated_articles is the
+        upper bound of page_size per call
+    """
+    page_size = page_size or settings.NEWS_API_PAGE_SIZE
+    max_pages = max_pages or settings.NEWS_API_MAX_PAGES
+    all_categories = {name for name, _ in Category.CATEGORY_CHOICES}
+    if countries and categories and all_categories.issubset(categories) and max_pages >= len(all_categories):
+        categories = None
+
+    combinations = [
+        dict(params, page_size=page_size)
+        for params in build_query_combinations(countries, categories)
+    ]
+
+    if sources:
+        for start in range(0, len(sources), MAX_SOURCES_PER_CALL):
+            combinations.append({
+                'sources': ','.join(sources[start:start + MAX_SOURCES_PER_CALL]),
+                'page_size': page_size
+            })
+
+    return {
+        'combinations': combinations,
+        'min_calls': len(combinations),
+        'max_calls': len(combinations) * max_pages,
+        'estimated_articles': len(combinations) * max_pages * page_size,
+    }
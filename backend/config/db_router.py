@@ -0,0 +1,189 @@
+import asyncio
+import contextvars
+import logging
+import random
+import time
+from contextlib import ContextDecorator
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+logger = logging.getLogger(__name__)
+
+_pinned = contextvars.ContextVar('db_pinned_to_primary', default=False)
+# Until when reads of the current context stay on the primary after a write
+_primary_until = contextvars.ContextVar('db_primary_until', default=0.0)
+
+# Process-local replica health: alias -> (healthy, checked_at)
+_health = {}
+# Probes running in a worker thread on behalf of the event loop: alias -> future
+_probing = {}
+
+
+class pin_to_primary(ContextDecorator):
+    """
+    Route every read in the block (or decorated function) to the primary.
+    Used by code that reads what it just wrote, such as the ingestion services.
+    """
+
+    def __init__(self):
+        self._tokens = []
+
+    def _recreate_cm(self):
+        # A decorated function gets a fresh instance per call, so concurrent calls
+        # in other threads never pop each other's tokens
+        return type(self)()
+
+    def __enter__(self):
+        self._tokens.append(_pinned.set(True))
+        return self
+
+    def __exit__(self, *exc_info):
+        _pinned.reset(self._tokens.pop())
+        return False
+
+
+def replica_is_healthy(alias):
+    """
+    Whether a replica accepts connections and lags less than
+    DATABASE_REPLICA_MAX_LAG. Probed at most every
+    DATABASE_REPLICA_HEALTH_CHECK_INTERVAL seconds per process.
+    """
+    healthy, checked_at = _health.get(alias, (False, None))
+    if checked_at is not None and time.monotonic() - checked_at < settings.DATABASE_REPLICA_HEALTH_CHECK_INTERVAL:
+        return healthy
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        # Blocking probes are not allowed on the event loop: keep the last result
+        # (the primary until a probe has run) and refresh it in a worker thread
+        if alias not in _probing:
+            _probing[alias] = loop.run_in_executor(None, _probe_in_thread, alias)
+            _probing[alias].add_done_callback(lambda future: _probing.pop(alias, None))
+        return healthy
+
+    healthy = _probe(alias)
+    _health[alias] = (healthy, time.monotonic())
+    return healthy
+
+
+def _probe_in_thread(alias):
+    try:
+        _health[alias] = (_probe(alias), time.monotonic())
+    finally:
+        # The worker thread serves no queries: do not keep its connection open
+        connections[alias].close()
+
+
+def _probe(alias):
+    connection = connections[alias]
+    try:
+        connection.ensure_connection()
+        if connection.vendor != 'postgresql':
+            return True
+        with connection.cursor() as cursor:
+            # No lag outside recovery (a plain database standing in for a replica)
+            # or when everything received has been replayed (an idle primary)
+            cursor.execute(
+                "SELECT CASE WHEN NOT pg_is_in_recovery() "
+                "OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+                "ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END"
+            )
+            lag = float(cursor.fetchone()[0] or 0)
+    except Exception as exc:
+        logger.warning("Database replica %s is unavailable, reading from the primary: %s", alias, exc)
+        connection.close()
+        return False
+    if lag > settings.DATABASE_REPLICA_MAX_LAG:
+        logger.warning("Database replica %s lags %.1fs behind, reading from the primary", alias, lag)
+        return False
+    return True
+
+
+class PrimaryReplicaRouter:
+    """
+    Writes go to the primary ("default"); reads go to a random healthy replica
+    from DATABASE_REPLICAS, except:
+
+    - inside pin_to_primary() (writers reading their own writes),
+    - for DATABASE_REPLICA_STICKY_SECONDS after a write by the same context
+      (thread, task, or client through ReplicaPinningMiddleware),
+    - when no replica is healthy.
+
+    Without replicas configured every query uses the primary.
+    """
+
+    def db_for_read(self, model, **hints):
+        replicas = settings.DATABASE_REPLICAS
+        if not replicas or _pinned.get() or _primary_until.get() > time.time():
+            return DEFAULT_DB_ALIAS
+        candidates = list(replicas)
+        random.shuffle(candidates)
+        for alias in candidates:
+            if replica_is_healthy(alias):
+                return alias
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        if settings.DATABASE_REPLICAS:
+            _primary_until.set(time.time() + settings.DATABASE_REPLICA_STICKY_SECONDS)
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same data as the primary
+        databases = {DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICAS}
+        return obj1._state.db in databases and obj2._state.db in databases
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
+
+
+class ReplicaPinningMiddleware:
+    """
+    Carry the sticky window across requests: a response to a request that
+    wrote sets a short-lived cookie, and requests presenting it read from the
+    primary, so a client (e.g. an admin user) always sees its own writes.
+    """
+    sync_capable = True
+    async_capable = True
+    cookie_name = 'db_primary_until'
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        token, until = self.process_request(request)
+        try:
+            return self.process_response(self.get_response(request), until)
+        finally:
+            _primary_until.reset(token)
+
+    async def __acall__(self, request):
+        token, until = self.process_request(request)
+        try:
+            return self.process_response(await self.get_response(request), until)
+        finally:
+            _primary_until.reset(token)
+
+    def process_request(self, request):
+        try:
+            until = float(request.COOKIES.get(self.cookie_name, 0))
+        except ValueError:
+            until = 0.0
+        return _primary_until.set(until), until
+
+    def process_response(self, response, until):
+        written_until = _primary_until.get()
+        if written_until > until and written_until > time.time():
+            response.set_cookie(
+                self.cookie_name, f'{written_until:.3f}',
+                max_age=settings.DATABASE_REPLICA_STICKY_SECONDS, httponly=True, samesite='Lax',
+            )
+        return response
@@ -29,6 +29,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
 
     'corsheaders',
     'rest_framework',
@@ -45,6 +46,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'config.db_router.ReplicaPinningMiddleware',
 ]
 
 ROOT_URLCONF = 'config.urls'
@@ -79,6 +81,43 @@ DATABASES = {
     }
 }
 
+# Read replicas
+# Comma-separated "host[:port]" list; each replica gets a "replica<N>" alias with
+# the primary's name and credentials. API reads are routed to them by the router.
+DATABASE_REPLICAS = []
+for index, replica in enumerate(filter(None, os.getenv("POSTGRES_REPLICA_HOSTS", "").split(",")), start=1):
+    host, _, port = replica.strip().partition(":")
+    alias = f"replica{index}"
+    DATABASES[alias] = {
+        **DATABASES["default"],
+        "HOST": host,
+        "PORT": port or DATABASES["default"]["PORT"],
+        # Tests and benchmarks read the test database through the primary connection
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_REPLICAS.append(alias)
+
+DATABASE_ROUTERS = ["config.db_router.PrimaryReplicaRouter"]
+DATABASE_REPLICA_STICKY_SECONDS = int(os.getenv("DATABASE_REPLICA_STICKY_SECONDS", 5))  # reads stay on the primary this long after a write (replication lag)
+DATABASE_REPLICA_HEALTH_CHECK_INTERVAL = int(os.getenv("DATABASE_REPLICA_HEALTH_CHECK_INTERVAL", 10))  # seconds between replica probes
+DATABASE_REPLICA_MAX_LAG = float(os.getenv("DATABASE_REPLICA_MAX_LAG", 30))  # seconds of replay lag before a replica is skipped
+
+# Cache
+# Shared between web and Celery processes when Redis is configured
+if os.getenv("REDIS_URL"):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.getenv("REDIS_URL"),
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 AUTH_PASSWORD_VALIDATORS = [
@@ -118,11 +157,51 @@ CORS_ALLOWED_ORIGINS = [
     "http://localhost:4200",  # angular development server
    
 ]
+# NewsAPI Configuration
+NEWS_API_MAX_WORKERS = int(os.getenv("NEWS_API_MAX_WORKERS", 4))  # concurrent headline queries
+NEWS_API_TIMEOUT = float(os.getenv("NEWS_API_TIMEOUT", 10))  # seconds per request
+NEWS_API_MAX_RPS = float(os.getenv("NEWS_API_MAX_RPS", 5))  # 0 disables the cap
+NEWS_API_BASE_URL = os.getenv("NEWS_API_BASE_URL", "https://newsapi.org")  # point at a stub server for local runs
+NEWS_API_POOL_SIZE = int(os.getenv("NEWS_API_POOL_SIZE", 10))  # keep-alive connections per host
+NEWS_API_MAX_RETRIES = int(os.getenv("NEWS_API_MAX_RETRIES", 3))  # on 429/5xx and connection errors
+NEWS_API_BACKOFF_BASE = float(os.getenv("NEWS_API_BACKOFF_BASE", 0.5))  # seconds, doubled per retry
+NEWS_API_BACKOFF_MAX = float(os.getenv("NEWS_API_BACKOFF_MAX", 30))  # cap on any single wait
+NEWS_API_PAGE_SIZE = int(os.getenv("NEWS_API_PAGE_SIZE", 100))  # NewsAPI maximum is 100
+# Pages followed per query. At 7 or more (one per category), a country asked for every
+# category is fetched with one country-wide query instead of one per category
+NEWS_API_MAX_PAGES = int(os.getenv("NEWS_API_MAX_PAGES", 5))
+NEWS_API_KNOWN_STOP_RATIO = float(os.getenv("NEWS_API_KNOWN_STOP_RATIO", 0.8))  # stop paging once this share is stored
+NEWS_API_DAILY_QUOTA = int(os.getenv("NEWS_API_DAILY_QUOTA", 100))  # calls per UTC day, 0 = unlimited
+NEWS_API_QUOTA_PER_SECOND = int(os.getenv("NEWS_API_QUOTA_PER_SECOND", 10))  # across all workers, 0 = unlimited
+NEWS_API_QUOTA_CACHE = os.getenv("NEWS_API_QUOTA_CACHE", "default")  # cache alias holding the ledger; per process unless shared (Redis)
+
+# Article API
+NEWS_RESPONSE_CACHE = os.getenv("NEWS_RESPONSE_CACHE", "default")  # cache alias for article list responses; must be shared (Redis), or caching and ETags are off
+NEWS_RESPONSE_CACHE_TIMEOUT = int(os.getenv("NEWS_RESPONSE_CACHE_TIMEOUT", 900))  # seconds, 0 disables the cache
+NEWS_REFERENCE_CACHE_MAX_AGE = int(os.getenv("NEWS_REFERENCE_CACHE_MAX_AGE", 86400))  # Cache-Control for reference data and sources
+NEWS_ARTICLE_CACHE_MAX_AGE = int(os.getenv("NEWS_ARTICLE_CACHE_MAX_AGE", 60))  # Cache-Control for article endpoints
+NEWS_ARTICLE_FAST_LIST = os.getenv("NEWS_ARTICLE_FAST_LIST", "true").lower() == "true"  # values() read path for /news/
+NEWS_ARTICLE_COUNT_STRATEGY = os.getenv("NEWS_ARTICLE_COUNT_STRATEGY", "exact")  # exact, estimated or cached
+NEWS_ARTICLE_COUNT_ESTIMATE_THRESHOLD = int(os.getenv("NEWS_ARTICLE_COUNT_ESTIMATE_THRESHOLD", 10000))  # exact COUNT(*) below this estimate
+NEWS_ARTICLE_COUNT_CACHE_TIMEOUT = int(os.getenv("NEWS_ARTICLE_COUNT_CACHE_TIMEOUT", 300))  # seconds per filter signature
+NEWS_EXPORT_CHUNK_SIZE = int(os.getenv("NEWS_EXPORT_CHUNK_SIZE", 2000))  # rows fetched per server-side cursor round trip
+NEWS_ARTICLE_PARTITIONS_AHEAD = int(os.getenv("NEWS_ARTICLE_PARTITIONS_AHEAD", 3))  # future monthly article partitions kept ready
+NEWS_ARTICLE_RETENTION_MONTHS = int(os.getenv("NEWS_ARTICLE_RETENTION_MONTHS", 0))  # detach partitions older than this many full months (0 keeps all)
+NEWS_ARTICLE_RETENTION_ACTION = os.getenv("NEWS_ARTICLE_RETENTION_ACTION", "detach")  # 'detach' keeps a standalone table, 'drop' deletes it
+NEWS_ARCHIVE_AFTER_DAYS = int(os.getenv("NEWS_ARCHIVE_AFTER_DAYS", 90))  # archive_article_bodies moves older article bodies to compressed storage
+NEWS_ARCHIVE_BATCH_SIZE = int(os.getenv("NEWS_ARCHIVE_BATCH_SIZE", 1000))  # articles archived per transaction
+NEWS_SUGGEST_CACHE_TIMEOUT = int(os.getenv("NEWS_SUGGEST_CACHE_TIMEOUT", 300))  # seconds per typeahead prefix
+
 # Celery Configuration
 CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = 'UTC'
+CELERY_TASK_ALWAYS_EAGER = os.getenv("CELERY_TASK_ALWAYS_EAGER", "false").lower() == "true"
+
+# Headline ingestion: split sampled queries into per-slice subtasks joined by a chord
+NEWS_INGEST_FAN_OUT = os.getenv("NEWS_INGEST_FAN_OUT", "false").lower() == "true"
+NEWS_INGEST_SLICE_SIZE = int(os.getenv("NEWS_INGEST_SLICE_SIZE", 4))  # queries per subtask
 
 CELERY_BEAT_SCHEDULE = {
     'fetch-sources-every-week': {
@@ -133,4 +212,8 @@ CELERY_BEAT_SCHEDULE = {
         'task': 'apps.news.tasks.fetch_latest_news_task',
         'schedule': 60 * 60 * 24,  # every day
     },
+    'maintain-article-partitions-every-day': {
+        'task': 'apps.news.tasks.maintain_article_partitions_task',
+        'schedule': 60 * 60 * 24,  # every day
+    },
 }